@@ -40,13 +40,15 @@ console.log_message('"Success: enriched_bibliography" initiated with VU Bibliogr
 console.log_message('Starting to merge "enriched_bibliography" with UvA Bibliography object')
 enriched_bibliography.enrich_with(uva_bibliography,
                             field_to_match_in_bibliographies='b_doi',
-                            method='merge')
+                            method='merge',
+                            key_normalizer='doi')
 console.log_message('Success: "enriched_bibliography" merged with UvA Bibliography object')
 
 console.log_message('Starting to enrich "enriched_bibliography" with OpenCitations Bibliography object')
 enriched_bibliography.enrich_with(oc_bibliography,
                             field_to_match_in_bibliographies='b_doi',
-                            method='left join')
+                            method='left join',
+                            key_normalizer='doi')
 console.log_message('Success: "enriched_bibliography" enriched with OpenCitations Bibliography object')
 
 # TODO: Turn n3 transformation and ttl writing steps to a single 'write_to_ttl' method for Bibliography (e.g., vu_bibliography.write_to_ttl())
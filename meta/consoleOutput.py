@@ -1455,3 +1455,87 @@ class ConsoleOutput():
             self.last_outputted_line = output
         else:
             pass
+
+
+    def print_file_progress(self, file_progress, status_message='', print_decimals=False):
+        """
+        Prints the progress of reading a file, as the byte offset reached in the file out of the size of the file (see
+        File_Progress). Unlike counting the lines of a file beforehand to use .print_current_progress(), this does not
+        require an additional pass over the file.
+
+        Args:
+            file_progress(File_Progress)
+            status_message(str)
+            print_decimals(bool)
+
+        Examples:
+            >>> my_console_output = ConsoleOutput(log_file_path='log.txt')
+            >>> with open('..//preprocessor//test_data//blazegraph_output_1000.csv', encoding='utf8') as file:  #doctest: +ELLIPSIS
+            ...    my_file_progress = File_Progress(file)
+            ...    for each_line in file:
+            ...        my_console_output.print_file_progress(my_file_progress, 'Iterating')
+            [==----------------------------------------------------------] 2% ...Iterating
+            [===---------------------------------------------------------] 5% ...Iterating
+            ...
+            [============================================================] 100% ...Iterating
+        """
+        if file_progress.file_size:  # (an empty file has no progress to report)
+            self.print_current_progress(file_progress.get_byte_offset(), file_progress.file_size, status_message,
+                                        print_decimals)
+
+
+class File_Progress():
+    """
+    A progress source for a file that is read in a single pass: the progress is the byte offset reached in the file,
+    and the maximum progress is the size of the file (see ConsoleOutput.print_file_progress()).
+
+    For files opened in text mode, the offset is that of the underlying binary buffer, and so it may be ahead of the
+    lines that have been read by up to the size of the buffer.
+
+    Examples:
+        >>> with open('..//preprocessor//test_data//blazegraph_output_1000.csv', encoding='utf8') as file:
+        ...    my_file_progress = File_Progress(file)
+        ...    my_file_progress.get_byte_offset()
+        ...    for each_line in file:
+        ...        pass
+        ...    my_file_progress.get_byte_offset() == my_file_progress.file_size
+        0
+        True
+        >>> my_file_progress.file_size
+        285981
+
+        >>> # the file can also be tracked after the File_Progress object is created (e.g., once it is opened)
+        >>> my_file_progress = File_Progress()
+        >>> my_file_progress.get_byte_offset(), my_file_progress.file_size
+        (0, 0)
+    """
+    def __init__(self, file=None):
+        self.file = None
+        self.file_size = 0
+        if file is not None:
+            self.track(file)
+
+
+    def track(self, file):
+        """
+        Args:
+            file: An open file object (in text or binary mode)
+        """
+        import os
+
+        self.file = file
+        self.file_size = os.fstat(file.fileno()).st_size
+
+
+    def get_byte_offset(self):
+        """
+        Returns:
+            int: The current byte offset in the file (the size of the file, if it is closed)
+        """
+        if self.file is None:
+            return 0
+        elif self.file.closed:
+            return self.file_size
+        else:
+            # the position of a text file cannot be told while it is being iterated over, but that of its buffer can
+            return getattr(self.file, 'buffer', self.file).tell()
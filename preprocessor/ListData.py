@@ -678,9 +678,10 @@ class ListBuffer(ListData):
 
     def is_parsable(self, syntax_to_parse_by='bibtex'):
         """
+        Checks whether the buffer can be parsed. The check is made in memory (see ListBuffer.are_parsable()).
 
         Args:
-            syntax_to_parse_by:
+            syntax_to_parse_by(str): Currently, only 'bibtex' is supported.
 
         Returns:
             boolean
@@ -710,21 +711,89 @@ class ListBuffer(ListData):
             >>> my_buffer.is_parsable()
             False
         """
-        if syntax_to_parse_by == 'bibtex':
-            # import and shorten bibtex parser function
-            from pybtex.database.input import bibtex
-            parser = bibtex.Parser()
+        return ListBuffer.are_parsable([self.dataset], syntax_to_parse_by)[0]
 
-            # TODO: test can be made in memory instead of via temporary file (could use 'parser.parse_bytes')
-            with open('temp_buffer_dump.bib', 'w', encoding='utf8') as temp_buffer_dump_file:
-                for each_buffer_row in self.dataset:
-                    print(each_buffer_row, file=temp_buffer_dump_file)
+    @staticmethod
+    def are_parsable(list_of_entries, syntax_to_parse_by='bibtex'):
+        """
+        Checks whether each entry in a batch of entries can be parsed. The whole batch is first parsed at once, in
+        memory; if it cannot be parsed, it is split in halves until the entries that cannot be parsed are isolated. So,
+        a batch with only a few faulty entries is parsed only a few more times than a batch without any.
+
+        Args:
+            list_of_entries(list): A list of entries, each of which is a list of rows (e.g., ListBuffer.dataset)
+            syntax_to_parse_by(str): Currently, only 'bibtex' is supported.
+
+        Returns:
+            list: A boolean for each entry, in the same order as list_of_entries
+
+        Examples:
+            >>> my_entries = [['@article{01,', 'title = "A title",', '}'],
+            ...               ['@article{02,', 'title = "A "title",', '}'],
+            ...               ['@article{03,', 'title = "Another title",', '}'],
+            ...               ['@article{01,', 'title = "A title with a repeated id",', '}']]
+            >>> ListBuffer.are_parsable(my_entries)
+            [True, False, True, True]
+
+            >>> # as in separate files, a macro defined in an @string command is not defined in the other entries
+            >>> my_entries = [['@string{jn = "Some Journal"}'],
+            ...               ['@article{01,', 'journal = jn,', '}'],
+            ...               ['@article{02,', 'journal = "Some Journal",', 'month = jul,', '}']]
+            >>> ListBuffer.are_parsable(my_entries)
+            [True, False, True]
+            >>> ListBuffer.are_parsable(my_entries[1:])
+            [False, True]
+            >>> ListBuffer.are_parsable([])
+            []
+        """
+        if syntax_to_parse_by != 'bibtex':
+            raise ValueError('Unknown syntax "%s". Currently, only "bibtex" is supported.' % syntax_to_parse_by)
+
+        results = [False] * len(list_of_entries)
 
-            with open('temp_buffer_dump.bib', encoding='utf8') as temp_buffer_dump_file:
-                try:
-                    parsed_file = parser.parse_file(temp_buffer_dump_file)
-                    return True
-                except:
-                    return False
+        def validate(start, end):
+            batch = list_of_entries[start:end]
+            no_of_parsed_entries = ListBuffer._parse_bibtex_in_memory(batch)
+            # in a batch, an entry may also be 'parsed' by being swallowed by its neighbour; so, the number of parsed
+            # ...entries must match as well
+            if no_of_parsed_entries is not None and (len(batch) == 1 or no_of_parsed_entries == len(batch)):
+                results[start:end] = [True] * len(batch)
+            elif len(batch) > 1:
+                middle = (start + end) // 2
+                validate(start, middle)
+                validate(middle, end)
 
+        if list_of_entries:
+            validate(0, len(list_of_entries))
+        return results
 
+    # a single parser is reused for all checks (see ListBuffer._parse_bibtex_in_memory())
+    _bibtex_parser = None
+
+    @staticmethod
+    def _parse_bibtex_in_memory(list_of_entries):
+        """
+        Parses the rows of the given entries as a single bibtex string.
+
+        Returns:
+            int: number of parsed entries, or None if the entries cannot be parsed
+        """
+        from pybtex.database import BibliographyData
+        from pybtex.database.input import bibtex
+        from pybtex.utils import CaseInsensitiveDict
+
+        if ListBuffer._bibtex_parser is None:
+            ListBuffer._bibtex_parser = bibtex.Parser()
+
+        parser = ListBuffer._bibtex_parser
+        # entries of the previous check would otherwise be seen as duplicates, and its @string macros would be
+        # ...defined in this check (as a new parser for each entry would do, only the month macros are defined)
+        parser.data = BibliographyData()
+        parser.macros = CaseInsensitiveDict(bibtex.month_names)
+
+        bibtex_string = ''.join('%s\n' % each_row for each_entry in list_of_entries for each_row in each_entry)
+        try:
+            parser.parse_string(bibtex_string)
+        except Exception:
+            return None
+        return len(parser.data.entries)
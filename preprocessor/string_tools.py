@@ -104,9 +104,14 @@ class String(str):
         """
         Replaces given patterns with their replacements provided in the parameter pattern_conversions_dictionary.
 
+        The patterns are compiled into a Pattern_Replacer once for each distinct dictionary (and then reused), so that
+        they are not validated and compiled again for each string. For repeated calls with the same patterns (e.g., for
+        each line of a file), a Pattern_Replacer can also be passed directly instead of the dictionary.
+
         Args:
-            pattern_conversions_dictionary(dict): A dictionary in the format of {target:replacement}. Targets and
-                replacements can be longer than single characters, and can contain regex expressions.
+            pattern_conversions_dictionary(dict or Pattern_Replacer): A dictionary in the format of
+                {target:replacement}. Targets and replacements can be longer than single characters, and can contain
+                regex expressions.
 
         Returns:
             A modified String object (self)
@@ -153,27 +158,18 @@ class String(str):
             ... except Exception as error_message:
             ...     print(error_message)
             first argument must be string or compiled pattern
-        """
-        import re
-        Parameter_Value(pattern_conversions_dictionary).force_type(dict)
-
-        # pass target:replacement couples to re.sub
-        for each_target_pattern in pattern_conversions_dictionary.keys():
-            each_replacement_pattern = pattern_conversions_dictionary[each_target_pattern]
-            try:
-                self.content = re.sub(each_target_pattern, each_replacement_pattern, self.content)
 
-        ### ERROR HANDLING ###
-        # handle incorrect input dictionary
-            except Exception as exception_message:
-                if str(exception_message) == 'nothing to repeat at position 0':
-                    raise ValueError("pattern_conversions_dictionary keys likely contain an unescaped character that "
-                                     "is wrongly interpreted as a regex expression. (e.g., '*' instead of '\*')."
-                                     "Please check your pattern_conversions_dictionary")
-                else:
-                    raise Exception(exception_message)
-        #######################
+            >>> # compiled patterns
+            >>> my_replacer = Pattern_Replacer({'<': '--', '>': '--'})
+            >>> String('<tag>').replace_patterns(my_replacer)
+            '--tag--'
+        """
+        if isinstance(pattern_conversions_dictionary, Pattern_Replacer):
+            pattern_replacer = pattern_conversions_dictionary
+        else:
+            pattern_replacer = Pattern_Replacer.get_cached(pattern_conversions_dictionary)
 
+        self.content = pattern_replacer.replace(self.content)
         return self
 
 
@@ -983,6 +979,210 @@ class String(str):
         return self
 
 
+class Pattern_Replacer():
+    r"""
+    Holds the patterns of a {target: replacement} dictionary (as used by String.replace_patterns()) in compiled form,
+    so that they can be applied to any number of strings without being validated and compiled again.
+
+    If all targets are literal strings (e.g., '<' or '\{"\}') that cannot create or break each other's matches,
+    all replacements are made in a single scan of the string: with one str.translate() call if all targets are single
+    characters, or otherwise with one compiled alternation of the targets. Otherwise (e.g., if a target is a regex
+    expression such as '[0-9]'), the compiled patterns are applied one by one, in the order of the dictionary. Either
+    way, the result is the same as that of applying the patterns one by one with re.sub().
+
+    Examples:
+        >>> # literal patterns (replaced in a single scan)
+        >>> my_replacer = Pattern_Replacer({'<': '--', '>': '--', '\{"\}': "'", '\\\\': '--', '“': "'"})
+        >>> my_replacer.is_single_pass
+        True
+        >>> my_replacer.replace('<an {"}example{"} with \\sqrt{s} and “quotes”>')
+        "--an 'example' with --sqrt{s} and 'quotes”--"
+
+        >>> # single characters
+        >>> Pattern_Replacer({'<': '', '>': ''}).replace('<tag>')
+        'tag'
+
+        >>> # a regex pattern (patterns are applied one by one)
+        >>> my_replacer = Pattern_Replacer({'[0-9]': '_', 'a': 'b'})
+        >>> my_replacer.is_single_pass
+        False
+        >>> my_replacer.replace('a2n 6ex6ample4')
+        'b_n _ex_bmple_'
+
+        >>> # the result of a replacement can be matched by a later pattern (patterns are applied one by one)
+        >>> my_replacer = Pattern_Replacer({'x': '', 'ab': 'c'})
+        >>> my_replacer.is_single_pass
+        False
+        >>> my_replacer.replace('axb')
+        'c'
+
+        >>> # erroneous target parameter
+        >>> try:
+        ...     Pattern_Replacer({'*': ''})
+        ... except ValueError as error_message:
+        ...     print(error_message)
+        pattern_conversions_dictionary keys likely contain an unescaped character that is wrongly interpreted as a regex expression. (e.g., '*' instead of '\*').Please check your pattern_conversions_dictionary
+    """
+
+    # replacers created by .get_cached() (i.e., by String.replace_patterns()), by the items of their dictionaries
+    _cache = {}
+    _MAXIMUM_CACHE_SIZE = 1000
+
+    def __init__(self, pattern_conversions_dictionary):
+        import re
+        Parameter_Value(pattern_conversions_dictionary).force_type(dict)
+
+        self.pattern_conversions_dictionary = dict(pattern_conversions_dictionary)
+
+        self._compiled_patterns = []
+        for each_target_pattern, each_replacement_pattern in self.pattern_conversions_dictionary.items():
+            if each_target_pattern == '' and each_replacement_pattern == '':
+                continue  # replaces nothing (e.g., the default {'': ''} of some methods)
+            try:
+                self._compiled_patterns.append((re.compile(each_target_pattern), each_replacement_pattern))
+
+            ### ERROR HANDLING ###
+            # handle incorrect input dictionary
+            except Exception as exception_message:
+                if str(exception_message) == 'nothing to repeat at position 0':
+                    raise ValueError("pattern_conversions_dictionary keys likely contain an unescaped character that "
+                                     "is wrongly interpreted as a regex expression. (e.g., '*' instead of '\\*')."
+                                     "Please check your pattern_conversions_dictionary")
+                else:
+                    raise Exception(exception_message)
+            #######################
+
+        literal_replacements = [(Pattern_Replacer._get_literal(each_compiled_pattern.pattern), each_replacement)
+                                for each_compiled_pattern, each_replacement in self._compiled_patterns]
+        self.is_single_pass = Pattern_Replacer._can_be_replaced_in_single_pass(literal_replacements)
+
+        self._translation_table = None
+        self._combined_pattern = None
+        if self.is_single_pass:
+            self._literal_replacements = dict(literal_replacements)
+            if all(len(each_literal) == 1 for each_literal in self._literal_replacements):
+                self._translation_table = str.maketrans(self._literal_replacements)
+            else:
+                self._combined_pattern = re.compile('|'.join(re.escape(each_literal)
+                                                             for each_literal in self._literal_replacements))
+
+
+    @staticmethod
+    def get_cached(pattern_conversions_dictionary):
+        """
+        Returns a Pattern_Replacer for the dictionary, which is created only once for each distinct dictionary.
+
+        Examples:
+            >>> Pattern_Replacer.get_cached({'a': 'b'}) is Pattern_Replacer.get_cached({'a': 'b'})
+            True
+        """
+        if type(pattern_conversions_dictionary) != dict:
+            return Pattern_Replacer(pattern_conversions_dictionary)  # raises an error
+
+        cache_key = tuple(pattern_conversions_dictionary.items())
+        try:
+            return Pattern_Replacer._cache[cache_key]
+        except KeyError:
+            pattern_replacer = Pattern_Replacer(pattern_conversions_dictionary)
+            if len(Pattern_Replacer._cache) >= Pattern_Replacer._MAXIMUM_CACHE_SIZE:
+                Pattern_Replacer._cache.clear()
+            Pattern_Replacer._cache[cache_key] = pattern_replacer
+            return pattern_replacer
+        except TypeError:  # unhashable replacements
+            return Pattern_Replacer(pattern_conversions_dictionary)
+
+
+    def replace(self, input_string):
+        """
+        Args:
+            input_string(str)
+
+        Returns:
+            str
+        """
+        if self._translation_table is not None:
+            return input_string.translate(self._translation_table)
+
+        elif self._combined_pattern is not None:
+            return self._combined_pattern.sub(lambda match: self._literal_replacements[match.group(0)], input_string)
+
+        else:
+            for each_compiled_pattern, each_replacement_pattern in self._compiled_patterns:
+                try:
+                    input_string = each_compiled_pattern.sub(each_replacement_pattern, input_string)
+                except Exception as exception_message:
+                    raise Exception(exception_message)
+            return input_string
+
+
+    @staticmethod
+    def _get_literal(pattern):
+        r"""
+        Returns the string that a regex pattern matches, if the pattern can only match a single, literal string
+        (e.g., '\{"\}' or '<'), and None otherwise.
+
+        Examples:
+            >>> Pattern_Replacer._get_literal('\\{"\\}'), Pattern_Replacer._get_literal('{"}')
+            ('{"}', '{"}')
+            >>> Pattern_Replacer._get_literal('\\\\')
+            '\\'
+            >>> Pattern_Replacer._get_literal('[0-9]'), Pattern_Replacer._get_literal('a{2}'), Pattern_Replacer._get_literal('\\d')
+            (None, None, None)
+        """
+        import re
+
+        literal_characters = []
+        i = 0
+        while i < len(pattern):
+            each_character = pattern[i]
+            if each_character == '\\':
+                # an escaped symbol is literal, but an escaped letter or digit is a special sequence (e.g., '\\d')
+                if i + 1 < len(pattern) and not pattern[i + 1].isalnum() and not pattern[i + 1].isspace():
+                    literal_characters.append(pattern[i + 1])
+                    i += 2
+                    continue
+                return None
+            elif each_character in '.^$*+?[]|()':
+                return None
+            elif each_character == '{' and re.match(r'\{\d*,?\d*\}', pattern[i:]) and pattern[i:i + 2] != '{}':
+                return None  # a quantifier (e.g., 'a{2}')
+            literal_characters.append(each_character)
+            i += 1
+
+        literal = ''.join(literal_characters)
+        if re.fullmatch(pattern, literal) is None:
+            return None
+        return literal
+
+
+    @staticmethod
+    def _can_be_replaced_in_single_pass(literal_replacements):
+        """
+        Checks whether replacing a list of (literal target, replacement) pairs in a single scan gives the same result
+        as replacing them one by one. This is the case if no replacement (or removal) can create or break a match of a
+        target that is replaced later (i.e., if the characters of each target are not in any earlier target or
+        replacement, and, after a removal, later targets are single characters), and if no replacement contains a
+        backslash (which re.sub() would treat as an escape).
+
+        Args:
+            literal_replacements(list): (target, replacement) pairs, in which target is None if it is not literal.
+
+        Returns:
+            bool
+        """
+        for i, (each_target, each_replacement) in enumerate(literal_replacements):
+            if not each_target or type(each_replacement) != str or '\\' in each_replacement:
+                return False
+            for each_later_target, each_later_replacement in literal_replacements[i + 1:]:
+                if each_later_target is None:
+                    return False
+                if set(each_later_target) & set(each_target + each_replacement):
+                    return False
+                if each_replacement == '' and len(each_later_target) > 1:
+                    return False
+        return True
+
+
 class File_Path(String, str):
     def __init__(self, path_string):
         """
@@ -1350,7 +1550,7 @@ class Parameter_Value():
             >>> my_parameter.convert_to_single_item_list_if_not_list()
             ['a', 'b', 'c']
         """
-        if type(self.content) != list:
+        if not isinstance(self.content, list):
             self.content = [self.content]
 
         return self.content
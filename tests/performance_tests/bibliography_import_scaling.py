@@ -0,0 +1,110 @@
+"""
+Benchmarks how the run time of Bibliography.importBibtex() and Bibliography.importCsv() grows with the number of
+entries being imported.
+
+Synthetic inputs are generated by replicating the entries of the VU Pure sample ('Input//vu_1k.bib') and the
+OpenCitations sample ('tests//acceptance_tests//test_data//oc_articles_with_matching_dois_v1.3_1k.csv') under new,
+unique ids until the desired number of entries is reached. If the import scales linearly, the 'seconds per 1k entries'
+column should stay (roughly) constant as the number of entries grows.
+
+Usage (from the repository root):
+    python -m tests.performance_tests.bibliography_import_scaling [no_of_entries_1 no_of_entries_2 ...]
+"""
+import os
+import sys
+import re
+import io
+import time
+import contextlib
+
+repository_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, repository_root)
+os.chdir(repository_root)  # paths below are relative to the repository root (and use '//' as separator, as elsewhere)
+
+from triplicator.bibTools import Bibliography
+from meta.consoleOutput import ConsoleOutput
+
+BIBTEX_SAMPLE_PATH = 'Input//vu_1k.bib'
+CSV_SAMPLE_PATH = 'tests//acceptance_tests//test_data//oc_articles_with_matching_dois_v1.3_1k.csv'
+OUTPUT_DIRECTORY = 'tests//performance_tests//output'
+
+DEFAULT_BENCHMARK_SIZES = [1000, 10000, 100000]
+
+
+def generate_synthetic_bibtex_file(no_of_entries, output_file_path):
+    """
+    Writes a .bib file with the desired number of entries by replicating the entries in the VU sample file. Each
+    replica gets a unique id (the original id suffixed with the replica number).
+    """
+    with open(BIBTEX_SAMPLE_PATH, encoding='utf8') as sample_file:
+        sample_entries = re.findall(r'(@\w+\{)([^,]+)(,.*?\n\}\n)', sample_file.read(), flags=re.DOTALL)
+
+    with open(output_file_path, mode='w', encoding='utf8') as output_file:
+        for i in range(no_of_entries):
+            entry_head, entry_id, entry_body = sample_entries[i % len(sample_entries)]
+            output_file.write('%s%s_%d%s\n' % (entry_head, entry_id, i, entry_body))
+
+
+def generate_synthetic_csv_file(no_of_entries, output_file_path):
+    """
+    Writes an OpenCitations .csv file with the desired number of rows by replicating the rows in the OpenCitations
+    sample file. Each replica gets a unique DOI (which is used as the entry id during import).
+    """
+    with open(CSV_SAMPLE_PATH, encoding='utf8') as sample_file:
+        header_line, *sample_rows = [each_line for each_line in sample_file if each_line.strip()]
+
+    with open(output_file_path, mode='w', encoding='utf8') as output_file:
+        output_file.write(header_line)
+        for i in range(no_of_entries):
+            each_row = sample_rows[i % len(sample_rows)]
+            output_file.write(each_row.replace(' "10.', ' "10.%d.' % i, 1))
+
+
+def time_import(import_function, **import_arguments):
+    """
+    Runs the given import function (with its console output suppressed) and returns the elapsed time in seconds.
+    """
+    start_time = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        import_function(**import_arguments)
+    return time.perf_counter() - start_time
+
+
+def run_benchmark(benchmark_sizes=DEFAULT_BENCHMARK_SIZES):
+    console = ConsoleOutput(log_file_path=OUTPUT_DIRECTORY + '//benchmark_log.txt')
+    results = []
+
+    for each_size in benchmark_sizes:
+        bibtex_path = OUTPUT_DIRECTORY + '//synthetic_%d.bib' % each_size
+        csv_path = OUTPUT_DIRECTORY + '//synthetic_%d.csv' % each_size
+        generate_synthetic_bibtex_file(each_size, bibtex_path)
+        generate_synthetic_csv_file(each_size, csv_path)
+
+        bibtex_bibliography = Bibliography()
+        bibtex_seconds = time_import(bibtex_bibliography.importBibtex, path_of_file_to_import=bibtex_path)
+
+        csv_bibliography = Bibliography()
+        csv_seconds = time_import(csv_bibliography.importCsv,
+                                  path_of_file_to_import=csv_path,
+                                  csv_delimiter_character=',',
+                                  field_value_list_separator=' | ',
+                                  id_column_header='doi',
+                                  conversion_arguments_list='open citations',
+                                  cleaning_algorithm='default')
+
+        results.append('%8d entries | importBibtex: %8.2fs (%.3fs per 1k) | importCsv: %8.2fs (%.3fs per 1k)'
+                       % (each_size,
+                          bibtex_seconds, bibtex_seconds / each_size * 1000,
+                          csv_seconds, csv_seconds / each_size * 1000))
+
+        os.remove(bibtex_path)
+        os.remove(csv_path)
+
+    console.log_list_with_caption('Bibliography import scaling benchmark results:', results,
+                                  print_list_length_with_caption=False, add_timestamp_in_file=True)
+
+
+if __name__ == '__main__':
+    os.makedirs(OUTPUT_DIRECTORY, exist_ok=True)
+    requested_sizes = [int(each_argument) for each_argument in sys.argv[1:]]
+    run_benchmark(requested_sizes or DEFAULT_BENCHMARK_SIZES)
@@ -0,0 +1,131 @@
+"""
+Microbenchmark that compares the precompiled Formatting_Engine (used by cleanAndFormatValues() and
+standardizeCapitalization()) with the previous per-call behaviour, in which every pattern was applied with a separate
+re.sub() call on every value.
+
+The titles, journal names and publisher names in the example .bib files are formatted as document instance names
+and labels with both implementations. The outputs are checked to be identical before the timings are reported.
+
+Usage (from the repository root):
+    python -m tests.performance_tests.formatting_engine_benchmark [no_of_repetitions]
+"""
+import os
+import sys
+import re
+import io
+import timeit
+import contextlib
+from urllib.parse import quote
+
+repository_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, repository_root)
+os.chdir(repository_root)  # paths below are relative to the repository root (and use '//' as separator, as elsewhere)
+
+from triplicator.bibTools import formatting_engine
+from triplicator.pybtexImporter import iterate_pybtex_entries
+from meta.consoleOutput import ConsoleOutput
+
+EXAMPLE_BIBTEX_FILE_PATHS = ['triplicator//example_data//test.bib',
+                             'triplicator//example_data//vu_1k_test.bib',
+                             'Input//vu_1k.bib',
+                             'Input//uva_1k.bib']
+
+DEFAULT_NO_OF_REPETITIONS = 5
+
+
+########################################################################
+#           PREVIOUS (PER-CALL) IMPLEMENTATION, FOR COMPARISON         #
+########################################################################
+
+LEGACY_PATTERN_OF_CHARACTERS_TO_OMIT = "[.,;\'\")(}{]"
+LEGACY_DICTIONARY_OF_PATTERNS_TO_REPLACE = {": ": "-", " - ": "-", '\{"\}': "'"}
+LEGACY_EN_TITLE_WORDS = ['In', 'The', 'A', 'An', 'As', 'On', 'At', 'For', 'With', 'From', 'By', 'Of', 'Vs', 'And',
+                         'Be', 'Been', 'Not', 'Is', "Isn't", 'Are', "Aren't", 'Does', "Doesn't", 'Do', "Don't", 'Was',
+                         "Wasn't", 'Were', "Weren't", 'Did', "Didn't"]
+
+
+def legacy_standardize_capitalization(input_string):
+    formatted_string = input_string
+    for each_word in LEGACY_EN_TITLE_WORDS:
+        formatted_string = re.sub(' %s ' % each_word, ' %s ' % each_word.lower(), formatted_string)
+    return formatted_string
+
+
+def legacy_replace_patterns(input_string):
+    output_string = input_string
+    for each_target_pattern, each_replacement_pattern in LEGACY_DICTIONARY_OF_PATTERNS_TO_REPLACE.items():
+        output_string = re.sub(each_target_pattern, each_replacement_pattern, output_string)
+    return output_string
+
+
+def legacy_format_document_name(title, algorithm):
+    document_instance_name = legacy_standardize_capitalization(title)
+    document_instance_name = legacy_replace_patterns(document_instance_name)
+
+    if algorithm == 'pybtex_document_instance_name':
+        document_instance_name = re.sub(LEGACY_PATTERN_OF_CHARACTERS_TO_OMIT, "", document_instance_name)
+        document_instance_name = legacy_replace_patterns(document_instance_name)
+        document_instance_name = re.sub(" ", "_", document_instance_name)
+        document_instance_name = quote(document_instance_name)
+
+    return document_instance_name
+
+
+########################################################################
+#                               BENCHMARK                              #
+########################################################################
+
+def collect_example_titles():
+    """
+    Returns a list of all titles, journal names and publisher names in the example .bib files.
+    """
+    titles = []
+    with contextlib.redirect_stderr(io.StringIO()):  # pybtex warnings about the example files are not relevant here
+        for each_path in EXAMPLE_BIBTEX_FILE_PATHS:
+            for each_entry_id, each_entry in iterate_pybtex_entries(each_path):
+                for each_field_name in ['title', 'journal', 'publisher']:
+                    if each_field_name in each_entry.fields:
+                        titles.append(each_entry.fields[each_field_name])
+    return titles
+
+
+def run_benchmark(no_of_repetitions=DEFAULT_NO_OF_REPETITIONS):
+    console = ConsoleOutput(log_file_path=None)
+    titles = collect_example_titles()
+    results = []
+
+    for each_algorithm in ['pybtex_document_instance_name', 'pybtex_document_label']:
+        if each_algorithm == 'pybtex_document_instance_name':
+            engine_function = formatting_engine.format_document_instance_name
+        else:
+            engine_function = formatting_engine.format_document_label
+
+        legacy_outputs = [legacy_format_document_name(each_title, each_algorithm) for each_title in titles]
+        engine_outputs = [engine_function(each_title) for each_title in titles]
+        batch_outputs = formatting_engine.format_document_names(titles, algorithm=each_algorithm)
+        if not legacy_outputs == engine_outputs == batch_outputs:
+            raise AssertionError('Outputs of the formatting engine differ from the per-call outputs for "%s"'
+                                 % each_algorithm)
+
+        legacy_seconds = min(timeit.repeat(
+            lambda: [legacy_format_document_name(each_title, each_algorithm) for each_title in titles],
+            number=1, repeat=no_of_repetitions))
+        engine_seconds = min(timeit.repeat(
+            lambda: [engine_function(each_title) for each_title in titles],
+            number=1, repeat=no_of_repetitions))
+        batch_seconds = min(timeit.repeat(
+            lambda: formatting_engine.format_document_names(titles, algorithm=each_algorithm),
+            number=1, repeat=no_of_repetitions))
+
+        results.append('%-30s | per-call re.sub: %.4fs | engine: %.4fs (%.1fx) | engine, batch: %.4fs (%.1fx)'
+                       % (each_algorithm, legacy_seconds,
+                          engine_seconds, legacy_seconds / engine_seconds,
+                          batch_seconds, legacy_seconds / batch_seconds))
+
+    console.log_list_with_caption('Formatting engine benchmark results (%d titles, identical outputs):' % len(titles),
+                                  results, print_list_length_with_caption=False, print_to_file=False)
+
+
+if __name__ == '__main__':
+    requested_repetitions = [int(each_argument) for each_argument in sys.argv[1:]]
+    run_benchmark(*requested_repetitions)
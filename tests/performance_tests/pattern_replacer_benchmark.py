@@ -0,0 +1,124 @@
+"""
+Microbenchmark that compares String.replace_patterns() (which uses a compiled Pattern_Replacer) with the previous
+behaviour, in which the patterns dictionary was validated, and each pattern was applied with a separate re.sub() call,
+every time a string was processed.
+
+Every line of the example .bib files is processed with the patterns that '_01_clean_vu_bibliography.py' uses for
+cleaning the VU bibliography (replaced in a single scan), and with the patterns that String.purify() uses (which
+include a regex pattern, and so are applied one by one). The outputs are checked to be identical before the timings
+are reported.
+
+Usage (from the repository root):
+    python -m tests.performance_tests.pattern_replacer_benchmark [no_of_repetitions]
+"""
+import os
+import sys
+import re
+import timeit
+
+repository_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, repository_root)
+os.chdir(repository_root)  # paths below are relative to the repository root (and use '//' as separator, as elsewhere)
+
+from preprocessor.string_tools import String, Pattern_Replacer, Parameter_Value
+from meta.consoleOutput import ConsoleOutput
+
+EXAMPLE_BIBTEX_FILE_PATHS = ['Input//vu_1k.bib',
+                             'Input//uva_1k.bib',
+                             'tests//acceptance_tests//test_data//VU_Pure_research_output-51017_cleaned_10k.bib']
+
+# the patterns in '_01_clean_vu_bibliography.py' (copied, as importing that script would start the cleaning)
+VU_CLEANING_PATTERNS = {
+    '<': '--',
+    '>': '--',
+    '\\{"\\}': "'",
+    '\\\\': '--',
+    '“': "'",
+    '”': "'",
+    '’': "'"
+}
+
+# the patterns in String.purify()
+PURIFICATION_PATTERNS = {
+    '<': '',
+    '>': '',
+    '\\{"\\}': '',
+    '\\\\': '',
+    "'": '',
+    '"': '',
+    '“': '',
+    '”': '',
+    '’': '',
+    '\\[|\\]|\\{|\\}': ''
+}
+
+DEFAULT_NO_OF_REPETITIONS = 5
+
+
+########################################################################
+#           PREVIOUS (PER-CALL) IMPLEMENTATION, FOR COMPARISON         #
+########################################################################
+
+def legacy_replace_patterns(input_string, pattern_conversions_dictionary):
+    Parameter_Value(pattern_conversions_dictionary).force_type(dict)
+
+    output_string = input_string
+    for each_target_pattern in pattern_conversions_dictionary.keys():
+        each_replacement_pattern = pattern_conversions_dictionary[each_target_pattern]
+        output_string = re.sub(each_target_pattern, each_replacement_pattern, output_string)
+    return output_string
+
+
+########################################################################
+#                               BENCHMARK                              #
+########################################################################
+
+def collect_example_lines():
+    """
+    Returns a list of all lines in the example .bib files (without newline characters).
+    """
+    lines = []
+    for each_path in EXAMPLE_BIBTEX_FILE_PATHS:
+        with open(each_path, encoding='utf8') as bib_file:
+            lines.extend(each_line.rstrip('\n') for each_line in bib_file)
+    return lines
+
+
+def run_benchmark(no_of_repetitions=DEFAULT_NO_OF_REPETITIONS):
+    console = ConsoleOutput(log_file_path=None)
+    lines = collect_example_lines()
+    results = []
+
+    for each_name, each_patterns in [('_01_clean_vu_bibliography', VU_CLEANING_PATTERNS),
+                                     ('String.purify()', PURIFICATION_PATTERNS)]:
+        pattern_replacer = Pattern_Replacer(each_patterns)
+
+        legacy_outputs = [legacy_replace_patterns(each_line, each_patterns) for each_line in lines]
+        string_outputs = [String(each_line).replace_patterns(each_patterns).content for each_line in lines]
+        replacer_outputs = [pattern_replacer.replace(each_line) for each_line in lines]
+        if not legacy_outputs == string_outputs == replacer_outputs:
+            raise AssertionError('Outputs of Pattern_Replacer differ from the per-call outputs for "%s"' % each_name)
+
+        legacy_seconds = min(timeit.repeat(
+            lambda: [legacy_replace_patterns(each_line, each_patterns) for each_line in lines],
+            number=1, repeat=no_of_repetitions))
+        string_seconds = min(timeit.repeat(
+            lambda: [String(each_line).replace_patterns(each_patterns) for each_line in lines],
+            number=1, repeat=no_of_repetitions))
+        replacer_seconds = min(timeit.repeat(
+            lambda: [pattern_replacer.replace(each_line) for each_line in lines],
+            number=1, repeat=no_of_repetitions))
+
+        results.append('%-26s | single scan: %-5s | per-call re.sub: %.4fs | String.replace_patterns: %.4fs (%.1fx) | '
+                       'Pattern_Replacer.replace: %.4fs (%.1fx)'
+                       % (each_name, pattern_replacer.is_single_pass, legacy_seconds,
+                          string_seconds, legacy_seconds / string_seconds,
+                          replacer_seconds, legacy_seconds / replacer_seconds))
+
+    console.log_list_with_caption('Pattern replacer benchmark results (%d lines, identical outputs):' % len(lines),
+                                  results, print_list_length_with_caption=False, print_to_file=False)
+
+
+if __name__ == '__main__':
+    requested_repetitions = [int(each_argument) for each_argument in sys.argv[1:]]
+    run_benchmark(*requested_repetitions)
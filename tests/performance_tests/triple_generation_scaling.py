@@ -0,0 +1,86 @@
+"""
+Benchmarks how the run time of Triples.import_bibliography_object() changes with the number of worker processes
+(see the workers parameter of the method).
+
+A synthetic bibliography of the desired number of entries is generated by replicating the entries of the VU Pure
+sample in the acceptance test data under new, unique ids. Its triples are then generated with each number of workers,
+and checked to be identical to those generated by a single process before the timings are reported. On a machine with
+enough cores, the speedup should grow with the number of workers (minus the cost of sending the entries to the workers
+and adding their triples in the main process).
+
+Usage (from the repository root):
+    python -m tests.performance_tests.triple_generation_scaling [no_of_entries [no_of_workers_1 no_of_workers_2 ...]]
+"""
+import os
+import sys
+import io
+import time
+import contextlib
+
+repository_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, repository_root)
+os.chdir(repository_root)  # paths below are relative to the repository root (and use '//' as separator, as elsewhere)
+
+from triplicator.bibTools import Bibliography
+from triplicator.rdfTools import Triples
+from meta.consoleOutput import ConsoleOutput
+
+VU_BIBTEX_PATH = 'tests//acceptance_tests//test_data//VU_Pure_research_output-51017_cleaned_10k.bib'
+
+DEFAULT_NO_OF_ENTRIES = 100000
+DEFAULT_NOS_OF_WORKERS = [1, 2, 4, 8]
+
+
+def build_synthetic_bibliography(no_of_entries):
+    """
+    Returns a Bibliography object with the desired number of entries, made by replicating the entries of the VU
+    sample. Each replica gets a unique id (the original id suffixed with the replica number).
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        sample_bibliography = Bibliography()
+        sample_bibliography.importBibtex(VU_BIBTEX_PATH)
+    sample_entries = list(sample_bibliography.entries.items())
+
+    synthetic_bibliography = Bibliography()
+    for i in range(no_of_entries):
+        each_entry_id, each_entry = sample_entries[i % len(sample_entries)]
+        each_new_entry_id = '%s_%d' % (each_entry_id, i)
+        each_new_entry = dict(each_entry)
+        each_new_entry['b_pure_bibliography_id'] = each_new_entry_id
+        synthetic_bibliography.entries[each_new_entry_id] = each_new_entry
+    return synthetic_bibliography
+
+
+def run_benchmark(no_of_entries=DEFAULT_NO_OF_ENTRIES, nos_of_workers=DEFAULT_NOS_OF_WORKERS):
+    console = ConsoleOutput(log_file_path=None)
+    bibliography = build_synthetic_bibliography(no_of_entries)
+    results = []
+
+    single_process_triples = None
+    single_process_seconds = None
+    for each_no_of_workers in [1] + [each for each in nos_of_workers if each != 1]:
+        start_time = time.perf_counter()
+        triples = Triples().import_bibliography_object(bibliography, desired_source_bibliography_name='vu',
+                                                       show_progress_bar=False, workers=each_no_of_workers)
+        elapsed_seconds = time.perf_counter() - start_time
+
+        if single_process_triples is None:
+            single_process_triples, single_process_seconds = triples.triples_list, elapsed_seconds
+        elif triples.triples_list != single_process_triples:
+            raise AssertionError('Triples generated with %d workers differ from those generated by a single process'
+                                 % each_no_of_workers)
+
+        results.append('workers=%-3d | %d triples | %8.2fs (%.1fx)'
+                       % (each_no_of_workers, len(triples), elapsed_seconds, single_process_seconds / elapsed_seconds))
+
+    console.log_list_with_caption('Triple generation scaling benchmark results (%d entries, %d cores, identical '
+                                  'triples):' % (no_of_entries, os.cpu_count()), results,
+                                  print_list_length_with_caption=False, print_to_file=False)
+
+
+if __name__ == '__main__':
+    requested_arguments = [int(each_argument) for each_argument in sys.argv[1:]]
+    if len(requested_arguments) > 1:
+        run_benchmark(requested_arguments[0], requested_arguments[1:])
+    else:
+        run_benchmark(*requested_arguments)
@@ -0,0 +1,91 @@
+"""
+Reports the memory used by the triples of the VU Pure sample when they are stored as a list of strings (i.e.,
+Triples(storage='list')) and when they are stored as dictionary-encoded arrays of terms (i.e.,
+Triples(storage='columnar'); see Columnar_Triples in triplicator.columnarStorage).
+
+The VU Pure sample in the acceptance test data is imported and converted to triples with both storage types. The
+triples are checked to be identical before the sizes are reported. Objects that are shared (e.g., a term that is used
+in many triples) are counted only once.
+
+Usage (from the repository root):
+    python -m tests.performance_tests.triple_storage_memory_report
+"""
+import os
+import sys
+import io
+import contextlib
+
+repository_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, repository_root)
+os.chdir(repository_root)  # paths below are relative to the repository root (and use '//' as separator, as elsewhere)
+
+from triplicator.bibTools import Bibliography
+from triplicator.rdfTools import Triples
+from meta.consoleOutput import ConsoleOutput
+
+VU_BIBTEX_PATH = 'tests//acceptance_tests//test_data//VU_Pure_research_output-51017_cleaned_10k.bib'
+
+
+def measure_size_in_bytes(root_object):
+    """
+    Returns the total size of an object and all dictionaries, lists, tuples and strings reachable from it. Each
+    object is counted once, no matter how many times it is referred to.
+    """
+    seen_object_ids = set()
+    objects_to_measure = [root_object]
+    total_size = 0
+
+    while objects_to_measure:
+        each_object = objects_to_measure.pop()
+        if id(each_object) in seen_object_ids:
+            continue
+        seen_object_ids.add(id(each_object))
+        total_size += sys.getsizeof(each_object)
+
+        if isinstance(each_object, dict):
+            objects_to_measure.extend(each_object.keys())
+            objects_to_measure.extend(each_object.values())
+        elif isinstance(each_object, (list, tuple)):
+            objects_to_measure.extend(each_object)
+
+    return total_size
+
+
+def measure_triples_size_in_bytes(triples):
+    """
+    Returns the size of the triples held in a Triples object (and, for columnar storage, of its terms dictionary).
+    """
+    triples_list = triples.triples_list
+    if triples.storage == 'columnar':
+        return measure_size_in_bytes([triples_list._subjects, triples_list._predicates, triples_list._objects,
+                                      triples_list._terms, triples_list._term_codes])
+    return measure_size_in_bytes(triples_list)
+
+
+def run_report():
+    console = ConsoleOutput(log_file_path=None)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        bibliography = Bibliography()
+        bibliography.importBibtex(VU_BIBTEX_PATH)
+
+    results = []
+    triples_by_storage = {}
+    for each_storage in ['list', 'columnar']:
+        triples = Triples(storage=each_storage)
+        triples.import_bibliography_object(bibliography, desired_source_bibliography_name='vu',
+                                           show_progress_bar=False)
+        triples_by_storage[each_storage] = triples
+
+        results.append('storage=%-8s | %d triples | %6.2f MB'
+                       % (each_storage, len(triples), measure_triples_size_in_bytes(triples) / 1e6))
+
+    if list(triples_by_storage['list']) != list(triples_by_storage['columnar']):
+        raise AssertionError('Triples in columnar storage differ from the triples in list storage')
+
+    console.log_list_with_caption('Memory used by the triples of the VU Pure sample (identical triples):', results,
+                                  print_list_length_with_caption=False, print_to_file=False)
+
+
+if __name__ == '__main__':
+    run_report()
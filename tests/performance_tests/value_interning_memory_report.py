@@ -0,0 +1,110 @@
+"""
+Reports the memory used by the merged VU + UvA + OpenCitations bibliography with and without interning of field values
+(see Bibliography(intern_values=..., value_pool=...) and Value_Pool in triplicator.bibTools).
+
+The VU and UvA Pure samples and the OpenCitations sample in the acceptance test data are imported, merged on 'b_doi'
+(as in '_04_merge_vu_uva_opencitations_and_convert_to_ttl.py'), and the size of the resulting entries and field values
+registry is measured. Objects that are shared between entries (e.g., interned journal names) are counted only once.
+
+Usage (from the repository root):
+    python -m tests.performance_tests.value_interning_memory_report
+"""
+import os
+import sys
+import io
+import contextlib
+
+repository_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, repository_root)
+os.chdir(repository_root)  # paths below are relative to the repository root (and use '//' as separator, as elsewhere)
+
+from triplicator.bibTools import Bibliography, Value_Pool, formatting_cache
+from meta.consoleOutput import ConsoleOutput
+
+VU_BIBTEX_PATH = 'tests//acceptance_tests//test_data//VU_Pure_research_output-51017_cleaned_10k.bib'
+UVA_BIBTEX_PATH = 'tests//acceptance_tests//test_data//UvA_Pure_research_output-41217_cleaned_10k.bib'
+OC_CSV_PATH = 'tests//acceptance_tests//test_data//oc_articles_with_matching_dois_v1.3_1k.csv'
+
+
+def measure_size_in_bytes(root_object):
+    """
+    Returns the total size of an object and all dictionaries, lists, tuples and strings reachable from it. Each
+    object is counted once, no matter how many times it is referred to.
+    """
+    seen_object_ids = set()
+    objects_to_measure = [root_object]
+    total_size = 0
+
+    while objects_to_measure:
+        each_object = objects_to_measure.pop()
+        if id(each_object) in seen_object_ids:
+            continue
+        seen_object_ids.add(id(each_object))
+        total_size += sys.getsizeof(each_object)
+
+        if isinstance(each_object, dict):
+            objects_to_measure.extend(each_object.keys())
+            objects_to_measure.extend(each_object.values())
+        elif isinstance(each_object, (list, tuple)):
+            objects_to_measure.extend(each_object)
+
+    return total_size
+
+
+def build_merged_bibliography(intern_values):
+    """
+    Imports and merges the VU, UvA and OpenCitations samples. If values are interned, the three bibliographies share
+    one pool, so that their equal values share one object after merging.
+    """
+    shared_value_pool = Value_Pool()
+    with contextlib.redirect_stdout(io.StringIO()):
+        merged_bibliography = Bibliography(intern_values=intern_values, value_pool=shared_value_pool)
+        merged_bibliography.importBibtex(VU_BIBTEX_PATH)
+
+        uva_bibliography = Bibliography(intern_values=intern_values, value_pool=shared_value_pool)
+        uva_bibliography.importBibtex(UVA_BIBTEX_PATH)
+
+        oc_bibliography = Bibliography(intern_values=intern_values, value_pool=shared_value_pool)
+        oc_bibliography.importCsv(path_of_file_to_import=OC_CSV_PATH,
+                                  csv_delimiter_character=',',
+                                  field_value_list_separator=' | ',
+                                  id_column_header='doi',
+                                  conversion_arguments_list='open citations',
+                                  cleaning_algorithm='default')
+
+        merged_bibliography.enrich_with(uva_bibliography, field_to_match_in_bibliographies='b_doi', method='merge',
+                                        key_normalizer='doi')
+        merged_bibliography.enrich_with(oc_bibliography, field_to_match_in_bibliographies='b_doi',
+                                        method='left join', key_normalizer='doi')
+    return merged_bibliography
+
+
+def run_report():
+    console = ConsoleOutput(log_file_path=None)
+    results = []
+
+    # the formatting cache also makes repeated formatted values (but not unformatted ones) share one object, so the
+    # ...report is made both with and without it
+    default_formatting_cache_size = formatting_cache.maximum_size
+    for each_formatting_cache_size in [default_formatting_cache_size, 0]:
+        for each_intern_values_setting in [False, True]:
+            formatting_cache.clear()
+            formatting_cache.maximum_size = each_formatting_cache_size
+
+            merged_bibliography = build_merged_bibliography(intern_values=each_intern_values_setting)
+            entries_size = measure_size_in_bytes(merged_bibliography.entries)
+            all_size = measure_size_in_bytes([merged_bibliography.entries,
+                                              merged_bibliography._field_values_registry])
+
+            results.append('formatting cache: %-3s | intern_values=%-5s | %d entries | entries: %6.2f MB | '
+                           'entries and registry: %6.2f MB'
+                           % ('on' if each_formatting_cache_size else 'off', each_intern_values_setting,
+                              len(merged_bibliography.entries), entries_size / 1e6, all_size / 1e6))
+    formatting_cache.maximum_size = default_formatting_cache_size
+
+    console.log_list_with_caption('Memory used by the merged VU + UvA + OpenCitations bibliography:', results,
+                                  print_list_length_with_caption=False, print_to_file=False)
+
+
+if __name__ == '__main__':
+    run_report()
@@ -1,4 +1,8 @@
+import weakref
+import itertools
+
 from preprocessor.Text_File import Text_File, Log_File
+from triplicator.cacheTools import Formatting_Cache
 
 
 class Bibtex_File(Text_File):
@@ -23,7 +27,7 @@ class Bibtex_File(Text_File):
 
 
     def convert_to_ttl(self, desired_version_suffix, desired_source_bibliography_name, output_directory='',
-                       show_progress_bar=True):
+                       show_progress_bar=True, streaming=False, remove_duplicates=False):
         """
         Takes a bib file and outputs a .ttl file.
 
@@ -32,6 +36,13 @@ class Bibtex_File(Text_File):
                 (e.g., my_bibliography.bib --> my_bibliography_2.1.ttl)
             desired_source_label: The bibliography source information that be attached to each entry
                 (e.g., ex:my_article ==> ex:hasOriginBibliography ==> ex:opencitations)
+            streaming(bool): If True, the cleaned bib file is parsed one entry at a time, and each entry is formatted,
+                converted to triples and written to the .ttl file as soon as it is parsed (see
+                Bibliography.iterateBibtexEntries() and RDF_File.write_entries_as_triples()). Neither a Bibliography
+                object nor a Triples object of the whole file is built, so memory usage does not grow with the size
+                of the file. The .ttl file is the same as in the default mode.
+            remove_duplicates(bool): If True, each triple is written to the .ttl file only once (see
+                Triples.import_bibliography_object()).
 
         Returns:
             Nothing
@@ -174,6 +185,25 @@ class Bibtex_File(Text_File):
             >>> my_ttl_file.print_lines(35)
             <http://clokman.com/kfir/resource#a1f8850ca82a4fb89aab8db2a49f8fa1> <http://www.w3.org/2000/01/rdf-schema#label> "Geloof en rechtvaardiging"@en .
 
+            >>> # streaming conversion (one entry at a time)
+            >>> my_bibtex_file = Bibtex_File('example_data//vu_25_test.bib')
+            >>> my_bibtex_file.convert_to_ttl(desired_version_suffix='v0.0.test3',
+            ...                               desired_source_bibliography_name='bib name with spaces',
+            ...                               output_directory='example_data//example_output_dir',
+            ...                               show_progress_bar=False, streaming=True)
+            Cleaning of "example_data//vu_25_test.bib" started
+            Cleaning of "example_data//vu_25_test.bib" finished
+            Parsing of example_data//vu_25_test_cleaned.bib started
+            pybtex package is parsing using bibtex.Parser() (one entry at a time)...
+            Writing of the triples to file "example_data//example_output_dir//vu_25_test_v0.0.test3.ttl" has started
+            Success: 53 triples were written to "example_data//example_output_dir//vu_25_test_v0.0.test3.ttl"
+            These items were skipped due to errors (0 items):
+            <BLANKLINE>
+            A log of the operation is kept in "log.txt"
+            >>> (Text_File('example_data//example_output_dir//vu_25_test_v0.0.test3.ttl').return_content() ==
+            ...  Text_File('example_data//example_output_dir//vu_25_test_v0.0.test2.ttl').return_content())
+            True
+
             >>> # see bottom of this file for longer tests
 
         """
@@ -181,6 +211,7 @@ class Bibtex_File(Text_File):
         from unidecode import unidecode
         from preprocessor.string_tools import Parameter_Value, File_Path, String
         from triplicator.rdfTools import Triples, RDF_File
+        from meta.consoleOutput import ConsoleOutput, File_Progress
         from triplicator.bibTools import Bibliography  # refers to own module, but not redundant—required by force_type
                                                        # method used in Triples.import_bibliography_object()
 
@@ -223,17 +254,7 @@ class Bibtex_File(Text_File):
         self.clean_bibtex_file_and_write_output_to_another_file(patterns_to_replace=pattern_replacements_dictionary,
                                                                 show_progress_bar=show_progress_bar)
 
-        ### Parse the bib file ###
-        bibliography = Bibliography()
-        bibliography.importBibtex(self.cleaned_file_path, show_progress_bar=show_progress_bar)
-
-        ### Convert to n3 format ###
-        triples = Triples()
-        triples.import_bibliography_object(bibliography,
-                                           desired_source_bibliography_name=desired_source_bibliography_name,
-                                           show_progress_bar=show_progress_bar)
-
-        ### Write to .ttl file
+        ### Prepare the .ttl file
         if output_directory and (not os.path.exists(output_directory)):
             os.makedirs(output_directory)
 
@@ -244,12 +265,51 @@ class Bibtex_File(Text_File):
 
         ttl_file_path = output_directory_to_prepend + self.input_file_name + '_' + desired_version_suffix + '.ttl'
         ttl_file = RDF_File(ttl_file_path)
+
+        ### Parse, convert to n3 format and write to .ttl file, one entry at a time ###
+        if streaming:
+            console = ConsoleOutput(log_file_path='log.txt')
+            console.log_message('Parsing of %s started' % self.cleaned_file_path, add_timestamp_in_file=True)
+            console.log_message('pybtex package is parsing using bibtex.Parser() (one entry at a time)...',
+                                add_timestamp_in_file=True)
+
+            # values are not interned, as the interned values would accumulate in memory
+            bibliography = Bibliography(intern_values=False)
+            file_progress = File_Progress()
+            ttl_file.write_entries_as_triples(bibliography.iterateBibtexEntries(self.cleaned_file_path,
+                                                                                file_progress=file_progress),
+                                              desired_source_bibliography_name=desired_source_bibliography_name,
+                                              show_progress_bar=show_progress_bar,
+                                              file_progress=file_progress,
+                                              remove_duplicates=remove_duplicates)
+            return
+
+        ### Parse the bib file ###
+        bibliography = Bibliography()
+        bibliography.importBibtex(self.cleaned_file_path, show_progress_bar=show_progress_bar)
+
+        ### Convert to n3 format ###
+        triples = Triples()
+        triples.import_bibliography_object(bibliography,
+                                           desired_source_bibliography_name=desired_source_bibliography_name,
+                                           show_progress_bar=show_progress_bar,
+                                           remove_duplicates=remove_duplicates)
+
+        ### Write to .ttl file
         ttl_file.write_triples_to_file(triples, show_progress_bar=show_progress_bar)
 
 
     def clean_bibtex_file_and_write_output_to_another_file(self, convert_to_ascii=True, patterns_to_replace={'': ''},
-                                                           show_progress_bar=False):
+                                                           show_progress_bar=False, validation_batch_size=1000,
+                                                           workers=1, lines_per_chunk=10000):
         """
+        Writes the entries of the file that are balanced and can be parsed to the cleaned file, after replacing the
+        given patterns (and non-ascii characters, if convert_to_ascii is True). Entries are checked for parsability in
+        memory, in batches of validation_batch_size entries (see ListBuffer.are_parsable()).
+
+        The file is read in chunks of (about) lines_per_chunk lines that are split at entry boundaries. If workers is
+        more than 1, the chunks are cleaned in that many worker processes. Either way, the entries are written in
+        their original order, and the counters of skipped entries are the same.
 
         Examples:
             ### CLEANING ###############################################################################################
@@ -380,69 +440,135 @@ class Bibtex_File(Text_File):
             >>> my_cleaned_file.print_lines(124)
             title    = "In pursuit of lepton flavour violation: A search for the t- mgg decay with atlas at [?]s=8 TeV",
 
+            ### PARALLEL CLEANING ######################################################################################
+            >>> my_file = Bibtex_File('example_data//vu_1k_test.bib')
+            >>> my_file.clean_bibtex_file_and_write_output_to_another_file(lines_per_chunk=500)
+            Cleaning of "example_data//vu_1k_test.bib" started
+            Cleaning of "example_data//vu_1k_test.bib" finished
+            >>> with open('example_data//vu_1k_test_cleaned.bib', encoding='utf8') as cleaned_file:
+            ...     cleaned_lines = cleaned_file.readlines()
+            >>> my_parallel_file = Bibtex_File('example_data//vu_1k_test.bib')
+            >>> my_parallel_file.clean_bibtex_file_and_write_output_to_another_file(workers=2, lines_per_chunk=500)
+            Cleaning of "example_data//vu_1k_test.bib" started
+            Cleaning of "example_data//vu_1k_test.bib" finished
+            >>> with open('example_data//vu_1k_test_cleaned.bib', encoding='utf8') as cleaned_file:
+            ...     cleaned_file.readlines() == cleaned_lines
+            True
+            >>> (my_parallel_file.no_of_nonparsable_entries_due_to_unknown_reason ==
+            ...  my_file.no_of_nonparsable_entries_due_to_unknown_reason)
+            True
+
+            >>> # entries that use a macro defined in an @string command cannot be parsed on their own, whichever
+            >>> # ...entries were checked before them (in this or in another worker process)
+            >>> my_file = Bibtex_File('example_data//string_macro_test.bib')
+            >>> my_file.clean_bibtex_file_and_write_output_to_another_file(lines_per_chunk=10)
+            Cleaning of "example_data//string_macro_test.bib" started
+            Cleaning of "example_data//string_macro_test.bib" finished
+            >>> with open('example_data//string_macro_test_cleaned.bib', encoding='utf8') as cleaned_file:
+            ...     cleaned_lines = cleaned_file.readlines()
+            >>> [each_line.strip() for each_line in cleaned_lines if each_line.startswith('@')]
+            ['@string{jn = "Some Journal"}', '@article{02,', '@article{04,']
+            >>> my_file.no_of_nonparsable_entries_due_to_unknown_reason
+            3
+            >>> my_parallel_file = Bibtex_File('example_data//string_macro_test.bib')
+            >>> my_parallel_file.clean_bibtex_file_and_write_output_to_another_file(workers=3, lines_per_chunk=10)
+            Cleaning of "example_data//string_macro_test.bib" started
+            Cleaning of "example_data//string_macro_test.bib" finished
+            >>> with open('example_data//string_macro_test_cleaned.bib', encoding='utf8') as cleaned_file:
+            ...     cleaned_file.readlines() == cleaned_lines
+            True
+            >>> my_parallel_file.no_of_nonparsable_entries_due_to_unknown_reason
+            3
+
         """
         # This command likely cannot read some files in which certain unicode characters exist due to an encoding bug.
         # See: http://www.i18nqa.com/debug/bug-double-conversion.html
-        from preprocessor.string_tools import String
-        from preprocessor.ListData import ListBuffer
-        from unidecode import unidecode
-        from meta.consoleOutput import ConsoleOutput
+        from collections import deque
+        from concurrent.futures import ProcessPoolExecutor
+        from preprocessor.string_tools import Parameter_Value
+        from meta.consoleOutput import ConsoleOutput, File_Progress
 
-        current_progress = 0
-        maximum_progress = self.get_no_of_lines_in_file()
+        Parameter_Value(workers).force_positive_integer()
+
+        # progress is reported as the byte offset reached in the input file when each chunk is read (so that the lines
+        # ...of the file do not have to be counted beforehand)
+        file_progress = File_Progress()
+        chunk_end_offsets = []
 
         console = ConsoleOutput(log_file_path='log.txt')
         console.log_message(('Cleaning of "%s" started' % self.input_file_path),
                             add_timestamp_in_file=True)
 
+        def read_chunks():
+            # chunks of raw lines that (as far as can be seen before cleaning) start at the beginning of an entry
+            chunk = []
+            with open(self.input_file_path, encoding="utf8") as input_file:
+                file_progress.track(input_file)
+                for each_line in input_file:
+                    if len(chunk) >= lines_per_chunk and each_line.startswith('@'):
+                        chunk_end_offsets.append(file_progress.get_byte_offset())
+                        yield chunk
+                        chunk = []
+                    chunk.append(each_line)
+            if chunk:
+                chunk_end_offsets.append(file_progress.file_size)
+                yield chunk
+
+        def clean_chunks_in_parallel(executor):
+            # at most 2 x workers chunks are read and sent to the workers ahead of the chunk whose result is being
+            # ...written, so that memory usage does not grow with the size of the file (executor.map() would read and
+            # ...submit all chunks of the file at once)
+            submitted_chunks = deque()
+            for each_chunk in read_chunks():
+                submitted_chunks.append(executor.submit(_cleanBibtexChunk, each_chunk, convert_to_ascii,
+                                                        patterns_to_replace, validation_batch_size))
+                if len(submitted_chunks) >= 2 * workers:
+                    yield submitted_chunks.popleft().result()
+            while submitted_chunks:
+                yield submitted_chunks.popleft().result()
+
+        with open(self.cleaned_file_path, mode='w', encoding="utf8") as output_file:
+
+            def write_lines(lines_to_write):
+                for each_line in lines_to_write:
+                    print(each_line, file=output_file)
+
+            if workers == 1:
+                chunk_results = (_cleanBibtexChunk(each_chunk, convert_to_ascii, patterns_to_replace,
+                                                   validation_batch_size) for each_chunk in read_chunks())
+            else:
+                executor = ProcessPoolExecutor(max_workers=workers)
+                chunk_results = clean_chunks_in_parallel(executor)
 
-        with open(self.input_file_path, encoding="utf8") as input_file:
-            with open(self.cleaned_file_path, mode='w', encoding="utf8") as output_file:
-
-                buffer = ListBuffer()
-
-                for current_line in input_file:
-                    current_line = String(current_line).\
-                        clean_from_newline_characters().\
-                        replace_patterns(patterns_to_replace)
-
-                    if convert_to_ascii:
-                        current_line.clean_from_non_ascii_characters()
-
-                    # new entry line
-                    if current_line.is_line_type('bibtex', 'start of entry'):
-
-                        # this is the first entry ever (just append to buffer)
-                        if buffer.is_empty:
-                            buffer.append_row(current_line.content)
-
-                        # this is NOT the first entry ever (write buffer to output if balanced, then re-initiate)
-                        else:
-                            if buffer.is_each_row_balanced(exclude_special_rows_of_syntax='bibtex'):
-                                if buffer.is_parsable('bibtex'):
-                                    for each_buffer_line in buffer.dataset:
-                                        print(each_buffer_line, file=output_file)
-                                else:
-                                    self.no_of_nonparsable_entries_due_to_unknown_reason += 1
-                            else:
-                                # currently, when an unbalanced row is detected, the entry it belongs to is simply
-                                # not written to the output file. If a more precise procedure (e.g., an unbalanced
-                                # character removal algorithm) is to be added, it should be added under this 'else'.
-                                self.no_of_unbalanced_entries_skipped += 1
-
-                            buffer.clear_all().\
-                                append_row(current_line.content)
-
-                    # regular line (just append to buffer)
-                    elif not current_line.is_line_type('bibtex', 'start of entry') \
-                            and not current_line.is_line_type('bibtex', 'comment'):
-                        buffer.append_row(current_line.content)
+            # the lines of the entry that is at the end of a chunk may continue in the next chunk; so, that entry is
+            # ...held here until the start of the next entry is seen, and then checked and written in this process
+            pending_entry = []
+            try:
+                for i, (leading_lines, cleaned_lines, no_of_unbalanced_entries, no_of_nonparsable_entries,
+                        trailing_entry) in enumerate(chunk_results):
+                    pending_entry.extend(leading_lines)
+                    if trailing_entry is not None:
+                        if pending_entry:
+                            pending_entry_results = _validateBibtexEntries([pending_entry], validation_batch_size)
+                            write_lines(pending_entry_results[0])
+                            self.no_of_unbalanced_entries_skipped += pending_entry_results[1]
+                            self.no_of_nonparsable_entries_due_to_unknown_reason += pending_entry_results[2]
+                        pending_entry = trailing_entry
+
+                    write_lines(cleaned_lines)
+                    self.no_of_unbalanced_entries_skipped += no_of_unbalanced_entries
+                    self.no_of_nonparsable_entries_due_to_unknown_reason += no_of_nonparsable_entries
 
                     # reporting
                     if show_progress_bar:  # show_progress_bar is False by default to prevent overly long test outputs
-                        console.print_current_progress(current_progress, maximum_progress,
-                                                          'Cleaning %s' % self.input_file_path)
-                        current_progress += 1
+                        console.print_current_progress(chunk_end_offsets[i], file_progress.file_size,
+                                                       'Cleaning %s' % self.input_file_path)
+            finally:
+                if workers > 1:
+                    executor.shutdown()
+
+            # the last entry in the file (pending_entry) is not followed by the start of another entry, and is therefore
+            # ...not checked or written
 
         console.log_message(('Cleaning of "%s" finished' % self.input_file_path), add_timestamp_in_file=True)
 
@@ -469,35 +595,108 @@ class Bibliography:
         >>> my_bibliography.entries
         {'01': {'author': 'John Can Lokman', 'title': 'A title'}, '02': {'title': 'Another title'}}
     """
-    _class_instance_registry     = []   # will contain all instances created in this class
+    # will contain all live instances created in this class, by their registry numbers (in order of creation). weak
+    # ...references are used, so that the registry does not keep otherwise unused bibliographies in memory.
+    _class_instance_registry     = weakref.WeakValueDictionary()
+    _class_instance_counter      = itertools.count()
     _class_id_registry           = []   # will hold all instance ids created in this class
-    _class_field_values_registry = {}   # will hold all field name-value pairs and entry ids associated
-                                        # ...with field values.
+    _class_field_values_registry = {}   # will hold the field name-value pairs of the globally indexed fields, and the
+                                        # ...registry numbers of the bibliographies and entry ids associated with the
+                                        # ...field values (see .indexFieldGlobally()).
     # ...this enables fast searching for field values such as author names, etc.
     # ...across bibliographies.
 
-    def __init__(instance):
+    # fields whose values are interned if the bibliography is created with intern_values=True. these repeat a small
+    # ...set of values across many entries (unlike e.g., titles and abstracts, which are mostly unique)
+    _INTERNED_FIELDS = ['b_authors', 'b_author_labels', 'b_type', 'b_publication_type', 'b_journal', 'b_journal_label',
+                        'b_publisher', 'b_publisher_label', 'b_publication', 'b_publication_label', 'b_issn',
+                        'b_publication_year', 'b_publication_month', 'b_topics', 'b_topic_labels']
+
+    def __init__(instance, indexed_fields=None, storage='dict', intern_values=False, value_pool=None):
         """
         Constructor for Bibliography Class Instance.
 
         It creates an empty Bibliography object, which can later be populated by using e.g., .setEntry or .import
         methods.
 
+        Keyword Args:
+            indexed_fields(list or str): Names of the fields whose values are indexed (in ._field_values_registry)
+                from the start, as entries are added. The values of other fields are indexed lazily, the first time
+                they are looked up (e.g., with .getEntriesByField() or .enrich_with()); from then on, their index is
+                also kept up to date as entries are added. If 'all', the values of all fields are indexed as entries
+                are added.
+            storage(str): How the entries are stored. 'dict' stores them in a dictionary of dictionaries. 'columnar'
+                stores them in columns of dictionary-encoded values (see columnarStorage.Columnar_Entries), which
+                uses a fraction of the memory for large bibliographies; .entries then behaves like the dictionary of
+                entries.
+            intern_values(bool or list): If True, the values of the fields that repeat a small set of values across
+                many entries (see Bibliography._INTERNED_FIELDS; e.g., journal names, publishers, author names) are
+                interned in a Value_Pool when they are added to the bibliography, so that equal values share one object
+                (also in ._field_values_registry). A list of field names can be provided to intern other fields.
+                Unique values such as titles and abstracts are not interned by default, as interning them only adds
+                to the memory used.
+            value_pool(Value_Pool): The pool in which values are interned, if intern_values is enabled. By default,
+                each bibliography has its own pool, which is freed together with the bibliography; a pool can be
+                shared by bibliographies that are to be merged, so that their equal values share one object.
+
+        Examples:
+            >>> my_bibliography = Bibliography(indexed_fields=['b_doi'])
+            >>> my_bibliography.setEntry('01', 'b_doi', '10.1186/s13034-015-0062-7')
+            >>> my_bibliography.setEntry('01', 'b_abstract', 'A long abstract')
+            >>> my_bibliography._field_values_registry
+            {'b_doi': {'10.1186/s13034-015-0062-7': ['01']}}
+
+            >>> my_columnar_bibliography = Bibliography(storage='columnar')
+            >>> my_columnar_bibliography.setEntry('01', 'b_doi', '10.1186/s13034-015-0062-7')
+            >>> my_columnar_bibliography.setEntry('01', 'b_abstract', 'A long abstract')
+            >>> my_columnar_bibliography.entries == my_bibliography.entries
+            True
         """
-        # adds the instance to the list of all instances of the class
-        Bibliography._class_instance_registry.append(instance)
+        # adds the instance to the registry of all instances of the class
+        Bibliography._registerInstance(instance)
 
         # local equivalent of _class_field_values_registry. Does the same thing for the bibliography instance.
+        # ...only holds the fields that are indexed (see indexed_fields parameter and .indexField())
         instance._field_values_registry = {}
+        instance._index_all_fields = indexed_fields == 'all'
+        if indexed_fields and not instance._index_all_fields:
+            for each_field_name in indexed_fields:
+                instance._field_values_registry[each_field_name] = {}
+
+        # indexes of normalized field values (e.g., DOI kernels), in the form of
+        # ...{field_name: {key_normalizer: {normalized_value: [entry_id, ...]}}}. built on first lookup (see
+        # ...enrich_with(key_normalizer=...)), and then kept up to date like ._field_values_registry
+        instance._normalized_field_values_registry = {}
+
+        # prefix and substring search indexes of fields, in the form of {field_name: Text_Search_Index}. built on first
+        # ...search (see .searchEntries()), and then kept up to date like ._field_values_registry
+        instance._search_indexes = {}
 
         # hold all ids created within the bibliography instance. allows quick checking whether an id exists.
-        instance._id_registry = []
+        # ...a dictionary (with None values) is used as an insertion-ordered set, so that membership checks are O(1)
+        # ...while the order in which ids are added is preserved.
+        instance._id_registry = {}
 
         # dictionary for holding all field types and number of their occurrences
         instance._field_type_registry = {}
 
+        # pool in which the values of ._interned_fields are interned (see Value_Pool)
+        if intern_values:
+            instance._value_pool = value_pool if value_pool is not None else Value_Pool()
+            instance._interned_fields = frozenset(Bibliography._INTERNED_FIELDS if intern_values is True
+                                                  else intern_values)
+        else:
+            instance._value_pool = None
+            instance._interned_fields = frozenset()
+
         # dictionary that holds all entries. this is where the bibliography data is held, including ids & field values.
-        instance.entries = {}
+        if storage == 'dict':
+            instance.entries = {}
+        elif storage == 'columnar':
+            from triplicator.columnarStorage import Columnar_Entries
+            instance.entries = Columnar_Entries()
+        else:
+            raise ValueError('Unknown storage "%s"; storage must be "dict" or "columnar".' % storage)
 
         instance.no_of_existing_fields_enriched_in_last_operation = 0
         instance.no_of_fields_added_in_last_operation = 0
@@ -506,11 +705,19 @@ class Bibliography:
 
         instance.log_file_path = 'log.txt'
 
+        # size, modification time and hash of the files imported into the bibliography. used to determine whether a
+        # ...snapshot of the bibliography (see .save()) is still up to date with its source files.
+        instance._source_file_fingerprints = {}
+        # import method and conversion parameters used for each imported file. used to determine whether a snapshot
+        # ...was made by the same kind of import as the one that is requested.
+        instance._source_file_import_parameters = {}
+
     ###################################################################################################################
     ############################################### IMPORT FUNCTIONS ##################################################
     ###################################################################################################################
 
-    def importBibtex(instance, path_of_file_to_import, conversion_arguments_list='bib_default', show_progress_bar=False):
+    def importBibtex(instance, path_of_file_to_import, conversion_arguments_list='bib_default', show_progress_bar=False,
+                     workers=1, streaming=False, snapshot_path=None):
         """
         Parses a Bibliography class object from a .bib file. During parsing, field names in the bib file is converted
         to names (i.e., strings) specified in conversation_conversion_arguments_list.
@@ -523,6 +730,19 @@ class Bibliography:
                 the hardcoded conversion arguments list will likely be sufficient. However, in cases where
                 modifications may still be necessary, the format in the example sublist below should be followed:
                 ['each_pybtex_entry.fields["title"]', 'pybtex_document_instance_name', 'b_document'],
+            show_progress_bar(bool): Shows a progress bar during the import (False by default).
+            workers(int): Number of processes to use during parsing and formatting. If more than 1, the .bib file is
+                split at entry boundaries into (at most) this many shards, each shard is parsed and formatted in a
+                separate worker process, and the results are merged (in the original order of entries) into this
+                Bibliography object.
+            streaming(bool): If True, the .bib file is parsed one entry at a time, and each entry is formatted and
+                added to the Bibliography object as soon as it is parsed. This way, a pybtex object of the whole file
+                is never held in memory, which keeps memory usage low for very large files. Cannot be combined with
+                workers > 1.
+            snapshot_path(str): If provided, the Bibliography object is loaded from this snapshot file (see
+                .save()) instead of being parsed, as long as the snapshot is up to date with the .bib file (and the
+                Bibliography object is empty). Otherwise, the .bib file is parsed, and a new snapshot is saved to
+                this path.
 
 
         Returns:
@@ -564,27 +784,218 @@ class Bibliography:
              'b_volume': 3}
             <BLANKLINE>
             <BLANKLINE>
+
+            >>> # Import the same file using two worker processes
+            >>> my_parallel_bib = Bibliography()
+            >>> my_parallel_bib.importBibtex('example_data//test.bib', workers=2)
+            Parsing of example_data//test.bib started
+            Splitting example_data//test.bib into shards for 2 worker processes...
+            pybtex package is parsing 2 shards using bibtex.Parser() in parallel...
+            pybtex package finished parsing
+            <BLANKLINE>
+            <BLANKLINE>
+            ---------------------------------------------------------------------------------------------------
+            example_data//test.bib parsed and imported as Bibliography object.
+            <BLANKLINE>
+            Fields added to the parsed the Bibliography object:
+            {'b_abstract': 2,
+             'b_author_labels': 4,
+             'b_authors': 4,
+             'b_document': 4,
+             'b_document_label': 4,
+             'b_doi': 2,
+             'b_issn': 3,
+             'b_issue_number': 1,
+             'b_journal': 3,
+             'b_journal_label': 3,
+             'b_pages': 2,
+             'b_publication_month': 4,
+             'b_publication_year': 4,
+             'b_publisher': 4,
+             'b_publisher_label': 4,
+             'b_pure_bibliography_id': 4,
+             'b_topic_labels': 2,
+             'b_topics': 2,
+             'b_type': 4,
+             'b_volume': 3}
+            <BLANKLINE>
+            <BLANKLINE>
+            >>> my_parallel_bib.entries == my_bib.entries
+            True
+            >>> my_parallel_bib._field_values_registry == my_bib._field_values_registry
+            True
+
+            >>> # Import the same file one entry at a time
+            >>> my_streamed_bib = Bibliography()
+            >>> my_streamed_bib.importBibtex('example_data//test.bib', streaming=True)
+            Parsing of example_data//test.bib started
+            pybtex package is parsing using bibtex.Parser() (one entry at a time)...
+            pybtex package finished parsing
+            <BLANKLINE>
+            <BLANKLINE>
+            ---------------------------------------------------------------------------------------------------
+            example_data//test.bib parsed and imported as Bibliography object.
+            <BLANKLINE>
+            Fields added to the parsed the Bibliography object:
+            {'b_abstract': 2,
+             'b_author_labels': 4,
+             'b_authors': 4,
+             'b_document': 4,
+             'b_document_label': 4,
+             'b_doi': 2,
+             'b_issn': 3,
+             'b_issue_number': 1,
+             'b_journal': 3,
+             'b_journal_label': 3,
+             'b_pages': 2,
+             'b_publication_month': 4,
+             'b_publication_year': 4,
+             'b_publisher': 4,
+             'b_publisher_label': 4,
+             'b_pure_bibliography_id': 4,
+             'b_topic_labels': 2,
+             'b_topics': 2,
+             'b_type': 4,
+             'b_volume': 3}
+            <BLANKLINE>
+            <BLANKLINE>
+            >>> my_streamed_bib.entries == my_bib.entries
+            True
         """
-        from builtins import KeyError
-        from pprint import pprint
-        from triplicator.pybtexImporter import Pybtex_import
-        from meta.consoleOutput import ConsoleOutput
+        from concurrent.futures import ProcessPoolExecutor
+        from itertools import repeat
+        from triplicator.pybtexImporter import Pybtex_import, split_bibtex_file_into_shards, iterate_pybtex_entries
+        from meta.consoleOutput import ConsoleOutput, File_Progress
         from preprocessor.Text_File import Log_File
+        from preprocessor.string_tools import Parameter_Value
+
+        Parameter_Value(workers).force_positive_integer()
+        if streaming and workers > 1:
+            raise ValueError('Streaming import cannot be combined with multiple workers; either set streaming=False '
+                             'or workers=1.')
 
         log_file = Log_File(instance.log_file_path)
 
         console = ConsoleOutput(log_file_path='log.txt')
-        console.log_message('Parsing of %s started' % path_of_file_to_import, add_timestamp_in_file=True)
 
+        conversion_arguments_list = Bibliography._getBibtexConversionArgumentsList(conversion_arguments_list)
+        import_parameters = {'import_method': 'importBibtex',
+                             'conversion_arguments_list': conversion_arguments_list}
+
+        if instance._loadSnapshotIfUpToDate(snapshot_path, path_of_file_to_import, import_parameters):
+            return
 
-        # import input data into pybtex_data variable
-        pybtex_import_instance = Pybtex_import(path_of_file_to_import)
-        pybtex_data = pybtex_import_instance.data
+        console.log_message('Parsing of %s started' % path_of_file_to_import, add_timestamp_in_file=True)
+        instance._recordSourceFile(path_of_file_to_import, import_parameters)
 
         ########################################################################
         #  Transfer items from pybtex parsed dictionary to output dictionary   #
         ########################################################################
 
+        # single process, streaming: parse, format and add one entry at a time
+        if streaming:
+            console.log_message('pybtex package is parsing using bibtex.Parser() (one entry at a time)...',
+                                add_timestamp_in_file=True)
+
+            file_progress = File_Progress()
+            instance._importPybtexEntries(iterate_pybtex_entries(path_of_file_to_import, file_progress),
+                                          conversion_arguments_list,
+                                          show_progress_bar=show_progress_bar,
+                                          progress_message='Parsing file "%s"' % path_of_file_to_import,
+                                          file_progress=file_progress)
+
+            console.log_message('pybtex package finished parsing', add_timestamp_in_file=True)
+
+        # single process: parse the whole file with pybtex, and format its entries
+        elif workers == 1:
+            # import input data into pybtex_data variable
+            pybtex_import_instance = Pybtex_import(path_of_file_to_import)
+            pybtex_data = pybtex_import_instance.data
+
+            console.log_message('Calculating file length...', add_timestamp_in_file=True)
+            instance._importPybtexEntries(pybtex_data.entries.items(), conversion_arguments_list,
+                                          show_progress_bar=show_progress_bar,
+                                          progress_message='Parsing file "%s"' % path_of_file_to_import)
+
+        # multiple processes: parse and format shards of the file in worker processes, and merge the results in order
+        else:
+            console.log_message('Splitting %s into shards for %d worker processes...'
+                                % (path_of_file_to_import, workers), add_timestamp_in_file=True)
+            shards = split_bibtex_file_into_shards(path_of_file_to_import, no_of_shards=workers)
+
+            console.log_message('pybtex package is parsing %d shards using bibtex.Parser() in parallel...'
+                                % len(shards), add_timestamp_in_file=True)
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                shard_results = executor.map(_importBibtexShard, shards, repeat(conversion_arguments_list))
+                for i, each_shard_result in enumerate(shard_results):
+                    instance._mergeShard(*each_shard_result)
+
+                    if show_progress_bar:
+                        console.print_current_progress(i, len(shards), 'Parsing file "%s"' % path_of_file_to_import)
+
+            console.log_message('pybtex package finished parsing', add_timestamp_in_file=True)
+
+
+        ########################################################################
+
+        # SERIES_TITLE AND ID -- To be implemented if needed
+        # This has to be kept out of the main loop, as series is not a field, but a whole bibliography entry
+        # themselves.
+        # They are not nested within individual entries, and are rather parallel to them.
+        # Some older code from previous versions, which extracts and converts series title:
+        # try:
+        #    # collection refers to a full reference entity, and this is why the title of the collection is nested quite
+        #    # ...deeper than other elements parsed before in this script
+        #    for series_id in pybtex_data.entries[each_pybtex_entry_id].collection.entries:
+        #        print series_id, each_pybtex_entry_id
+        #        #bibDictionary[each_pybtex_entry_id].append({"is_part_of_series_with_title":[each_pybtex_entry_id].fields["title"].encode("ascii",errors="ignore")
+        #        bibDictionary[each_pybtex_entry_id].append({"is_part_of_series_with_id":series_id})
+        #        #[each_pybtex_entry_id].fields["title"].encode("ascii",errors="ignore")
+        ## field missing from bibliography
+        # except(KeyError):
+        #    pass
+
+
+        ########################
+        #  OPERATION SUMMARY   #
+        ########################
+
+        # Print and log success message
+        import_complete_message = path_of_file_to_import + ' ' + 'parsed and imported as Bibliography object.'
+        print('\n\n-----------------------------------------------------------------------------------------------'
+              '----')
+        console.log_message(import_complete_message, add_timestamp_in_file=True)
+
+        # Print and log statistics about the import operation
+        # TODO: print total number of imported entries
+        console.log_message("\nFields added to the parsed the Bibliography object:")
+        instance.summarize()
+        for each_key, each_value in instance._field_type_registry.items():
+            log_file.append_line(str(each_key) + ': ' + str(each_value))
+
+        # Print and log a sample from parsed entries
+        console.log_message("\n")
+        instance.write_preview_to_log(number_of_entries_to_preview=3)
+
+        if snapshot_path is not None:
+            instance.save(snapshot_path)
+
+
+    @staticmethod
+    def _getBibtexConversionArgumentsList(conversion_arguments_list):
+        """
+        Returns the conversion arguments list to be used by .importBibtex() and .iterateBibtexEntries() (i.e., the
+        hardcoded list if conversion_arguments_list is 'bib_default', and the provided list otherwise).
+
+        Args:
+            conversion_arguments_list(str or list): See .importBibtex()
+
+        Returns:
+            list
+
+        Raises:
+            ValueError: If conversion_arguments_list is neither 'bib_default' nor a list.
+        """
         # In order to shorten the code, a list of arguments is given below, and then passed to the .setFormattedEntry method
         # ... through a for loop. In the list, each line is a (sub-)list of three arguments to be passed.
 
@@ -639,79 +1050,173 @@ class Bibliography:
             raise ValueError("Conversion_arguments_list parameter should be either 'bib_default' or be a list that "
                               "contains at least one list of arguments.")
 
+        return conversion_arguments_list
+
+
+    def _importPybtexEntries(instance, pybtex_entries, conversion_arguments_list, show_progress_bar=False,
+                             progress_message='', file_progress=None):
+        """
+        Formats pybtex entries as specified in conversion_arguments_list and adds them to the Bibliography object.
+        Used by .importBibtex() (in the main process, or in worker processes for each shard of the file).
+
+        Args:
+            pybtex_entries: (entry id, pybtex Entry) pairs (e.g., pybtex_data.entries.items(), or a generator such
+                as pybtexImporter.iterate_pybtex_entries())
+            conversion_arguments_list(list): See .importBibtex()
+            show_progress_bar(bool)
+            progress_message(str): Status message to display next to the progress bar
+            file_progress(File_Progress): If provided, the progress bar shows the progress of reading the source file
+                (e.g., when pybtex_entries is a generator that reads the file), instead of the number of entries.
+
+        Returns:
+            Nothing; modifies the object it is called from.
+        """
+        from meta.consoleOutput import ConsoleOutput
+
+        console = ConsoleOutput(log_file_path='log.txt')
+
+        # compile the target field expressions in conversion_arguments_list once (instead of evaluating them with
+        # ...eval() for each entry)
+        extraction_plan = compileConversionArgumentsList(conversion_arguments_list,
+                                                         entry_id_variable_name='each_pybtex_entry_id',
+                                                         entry_variable_name='each_pybtex_entry')
+
         # variables for progress bar
         current_progress = 0
-        console.log_message('Calculating file length...', add_timestamp_in_file=True)
-        maximum_progress = len(pybtex_data.entries.items())
+        if file_progress is None and show_progress_bar:
+            maximum_progress = len(pybtex_entries)
 
         # loop through individual reference entries in the parsed pybtex bib file
-        for each_pybtex_entry_id, each_pybtex_entry in pybtex_data.entries.items():
-            # loop through each line in the conversion_arguments_list
-            for each_argument_list in conversion_arguments_list:
-                # try using the elements of each sub-list in conversion_arguments_list as arguments of .setFormattedEntry method
+        for each_pybtex_entry_id, each_pybtex_entry in pybtex_entries:
+            # loop through each line in the extraction plan
+            for each_accessor, each_formatting_algorithm, each_desired_field_name in extraction_plan:
+                # try using the elements of each line in the extraction plan as arguments of .setFormattedEntry method
                 # (try-except block is necessary, as each field may not exist for each entry)
                 try:
-                    instance.setFormattedEntry(each_pybtex_entry_id, eval(each_argument_list[0]),
-                                               each_argument_list[1], each_argument_list[2])
+                    instance.setFormattedEntry(each_pybtex_entry_id,
+                                               each_accessor(each_pybtex_entry_id, each_pybtex_entry),
+                                               each_formatting_algorithm, each_desired_field_name)
                 except KeyError:
                     pass
 
             if show_progress_bar:  # default is false to prevent very long test outputs
-                console.print_current_progress(current_progress, maximum_progress,
-                                               'Parsing file "%s"' % path_of_file_to_import)
-                current_progress += 1
+                if file_progress is not None:
+                    console.print_file_progress(file_progress, progress_message)
+                else:
+                    console.print_current_progress(current_progress, maximum_progress, progress_message)
+                    current_progress += 1
 
 
-        ########################################################################
+    def _mergeShard(instance, shard_entries, shard_field_type_registry):
+        """
+        Merges the entries and field type registry of a shard (i.e., a Bibliography object that holds a part of the same
+        source file, created in a worker process by .importBibtex()) into the Bibliography object. The result is the
+        same as it would be if the entries of the shard were added to the object with .setEntry().
 
-        # SERIES_TITLE AND ID -- To be implemented if needed
-        # This has to be kept out of the main loop, as series is not a field, but a whole bibliography entry
-        # themselves.
-        # They are not nested within individual entries, and are rather parallel to them.
-        # Some older code from previous versions, which extracts and converts series title:
-        # try:
-        #    # collection refers to a full reference entity, and this is why the title of the collection is nested quite
-        #    # ...deeper than other elements parsed before in this script
-        #    for series_id in pybtex_data.entries[each_pybtex_entry_id].collection.entries:
-        #        print series_id, each_pybtex_entry_id
-        #        #bibDictionary[each_pybtex_entry_id].append({"is_part_of_series_with_title":[each_pybtex_entry_id].fields["title"].encode("ascii",errors="ignore")
-        #        bibDictionary[each_pybtex_entry_id].append({"is_part_of_series_with_id":series_id})
-        #        #[each_pybtex_entry_id].fields["title"].encode("ascii",errors="ignore")
-        ## field missing from bibliography
-        # except(KeyError):
-        #    pass
+        Args:
+            shard_entries(dict): .entries of the shard
+            shard_field_type_registry(dict): ._field_type_registry of the shard
 
+        Returns:
+            Nothing; modifies the object it is called from.
 
-        ########################
-        #  OPERATION SUMMARY   #
-        ########################
+        Examples:
+            >>> first_shard = Bibliography()
+            >>> first_shard.setEntry('01', 'author', 'John Can Lokman')
+            >>> second_shard = Bibliography()
+            >>> second_shard.setEntry('02', 'author', 'John Can Lokman')
+            >>> second_shard.setEntry('02', 'title', 'A title')
+
+            >>> merged_bibliography = Bibliography(indexed_fields='all')
+            >>> for each_shard in [first_shard, second_shard]:
+            ...     merged_bibliography._mergeShard(each_shard.entries, each_shard._field_type_registry)
+            >>> merged_bibliography.entries
+            {'01': {'author': 'John Can Lokman'}, '02': {'author': 'John Can Lokman', 'title': 'A title'}}
+            >>> merged_bibliography._field_type_registry
+            {'author': 2, 'title': 1}
+            >>> merged_bibliography._field_values_registry
+            {'author': {'John Can Lokman': ['01', '02']}, 'title': {'A title': ['02']}}
+        """
+        for each_entry_id, each_entry_data in shard_entries.items():
+            if instance._value_pool is not None:  # values created in worker processes are interned here
+                each_entry_data = {each_field_name: instance._value_pool.intern(each_field_value)
+                                   if each_field_name in instance._interned_fields else each_field_value
+                                   for each_field_name, each_field_value in each_entry_data.items()}
+
+            if each_entry_id not in instance._id_registry:
+                instance.entries[each_entry_id] = each_entry_data
+                instance._id_registry[each_entry_id] = None
+            else:
+                instance.entries[each_entry_id].update(each_entry_data)
 
-        # Print and log success message
-        import_complete_message = path_of_file_to_import + ' ' + 'parsed and imported as Bibliography object.'
-        print('\n\n-----------------------------------------------------------------------------------------------'
-              '----')
-        console.log_message(import_complete_message, add_timestamp_in_file=True)
+            # only updates the fields that are already indexed in this object
+            for each_field_name, each_field_value in each_entry_data.items():
+                instance.updateFieldValuesRegistry(each_entry_id, each_field_name, each_field_value)
 
-        # Print and log statistics about the import operation
-        # TODO: print total number of imported entries
-        console.log_message("\nFields added to the parsed the Bibliography object:")
-        instance.summarize()
-        for each_key, each_value in instance._field_type_registry.items():
-            log_file.append_line(str(each_key) + ': ' + str(each_value))
+        for each_field_name, each_count in shard_field_type_registry.items():
+            instance._field_type_registry[each_field_name] = \
+                instance._field_type_registry.get(each_field_name, 0) + each_count
 
-        # Print and log a sample from parsed entries
-        console.log_message("\n")
-        instance.write_preview_to_log(number_of_entries_to_preview=3)
 
+    def iterateBibtexEntries(instance, path_of_file_to_import, conversion_arguments_list='bib_default',
+                             file_progress=None):
+        """
+        Parses a .bib file one entry at a time, formats each entry in the same way as .importBibtex() does, and yields
+        it. Each entry is only kept in the Bibliography object until the next entry is requested, so neither the
+        parsed file nor the formatted entries accumulate in memory (e.g., for streaming entries into
+        rdfTools.RDF_File.write_entries_as_triples()). To keep memory usage flat, the Bibliography object should not
+        intern values (see intern_values parameter of Bibliography()).
 
-    def importCsv(instance,
-                  path_of_file_to_import,
-                  csv_delimiter_character,
-                  field_value_list_separator,
-                  id_column_header,
+        Args:
+            path_of_file_to_import(str): Location of the .bib file to be parsed
+            conversion_arguments_list(str or list): See .importBibtex()
+            file_progress(meta.consoleOutput.File_Progress): If provided, it is set to track the progress of reading
+                the file.
+
+        Yields:
+            tuple: (entry id, entry) pairs, in the order they appear in the file
+
+        Examples:
+            >>> my_bibliography = Bibliography(intern_values=False)
+            >>> for each_entry_id, each_entry in my_bibliography.iterateBibtexEntries('example_data//test.bib'):
+            ...     print(each_entry_id, each_entry['b_document'], len(my_bibliography.entries))
+            56fafbf2574947cc9cbbfae578a0a36d Book_with_one_author 1
+            d79d00c790984ab08240e997d077c332 Article_with_5_authors_with_and_notation 1
+            a8781aa0eae047d1826a658f3545ce3f Article_with_3_authors_with_mixed_notation 1
+            01b9c957875b4a96839c1bfd05ec6a31 Article_with_non-uri_safe_characters%3A%3C%3E%5B%5D_%40%25_to_WW_%E2%88%97%E2%86%92e%CE%BD%CE%BC%CE%BD_with_the_ATLAS_detector_at_%E2%88%9As%3D8_TeV 1
+            >>> my_bibliography.entries
+            {}
+
+            >>> # the entries are the same as those imported by .importBibtex()
+            >>> my_imported_bibliography = Bibliography()
+            >>> my_imported_bibliography.importBibtex('example_data//test.bib', streaming=True)  #doctest: +ELLIPSIS
+            Parsing of example_data//test.bib started
+            ...
+            >>> dict(my_bibliography.iterateBibtexEntries('example_data//test.bib')) == my_imported_bibliography.entries
+            True
+        """
+        from triplicator.pybtexImporter import iterate_pybtex_entries
+
+        conversion_arguments_list = Bibliography._getBibtexConversionArgumentsList(conversion_arguments_list)
+
+        for each_pybtex_entry_pair in iterate_pybtex_entries(path_of_file_to_import, file_progress):
+            instance._importPybtexEntries([each_pybtex_entry_pair], conversion_arguments_list)
+
+            each_entry_id = each_pybtex_entry_pair[0]
+            if each_entry_id in instance._id_registry:  # entries without any of the converted fields are not added
+                yield each_entry_id, instance.entries[each_entry_id]
+                instance._removeEntry(each_entry_id)
+
+
+    def importCsv(instance,
+                  path_of_file_to_import,
+                  csv_delimiter_character,
+                  field_value_list_separator,
+                  id_column_header,
                   conversion_arguments_list,
                   cleaning_algorithm=None,
-                  show_progress_bar=False
+                  show_progress_bar=False,
+                  snapshot_path=None
     ):
         """
         Parses a Bibliography class object from a .csv file.
@@ -728,6 +1233,10 @@ class Bibliography:
                 ['each_entry_data["titles"]', 'pybtex_document_label', 'b_document_label']
             cleaning_algorithm(str): CSV cleaning algorithm that will be executed in .cleanAndTokenizeCsv() method of
                 CSV_Bibliography class in csvImporter module.
+            snapshot_path(str): If provided, the Bibliography object is loaded from this snapshot file (see
+                .save()) instead of being parsed, as long as the snapshot is up to date with the .csv file (and the
+                Bibliography object is empty). Otherwise, the .csv file is parsed, and a new snapshot is saved to
+                this path.
 
         Keyword Args:
             "open citations" (conversion_arguments_list): Calls a list of lists that holds arguments for .setEntry
@@ -999,7 +1508,19 @@ class Bibliography:
         from meta.consoleOutput import ConsoleOutput
 
         console = ConsoleOutput('log.txt')
+
+        import_parameters = {'import_method': 'importCsv',
+                             'csv_delimiter_character': csv_delimiter_character,
+                             'field_value_list_separator': field_value_list_separator,
+                             'id_column_header': id_column_header,
+                             'conversion_arguments_list': conversion_arguments_list,
+                             'cleaning_algorithm': cleaning_algorithm}
+
+        if instance._loadSnapshotIfUpToDate(snapshot_path, path_of_file_to_import, import_parameters):
+            return
+
         console.log_message('Parsing of "%s" started' % path_of_file_to_import, add_timestamp_in_file=True)
+        instance._recordSourceFile(path_of_file_to_import, import_parameters)
 
         # pass functions to CSV container and create an instance of CSV_Bibliography class
         csv_bibliography = CSV_Bibliography(csv_file_path=path_of_file_to_import,
@@ -1015,7 +1536,7 @@ class Bibliography:
             conversion_arguments_list = [
                 # CAUTION: If there would be any merge operation would be made with other bib files (e.g.,
                 # using 'enrich_with' method), the 'desired_field_name's should be the same with those in
-                # Bibliography.importBibtex() > conversion_arguments_list > 'bib_default' > 'desired_field_name' column
+                # Bibliography._getBibtexConversionArgumentsList() > 'bib_default' > 'desired_field_name' column
                 # If a field name differs from its counterpart in the bib conversion algorithm, then during the merge
                 # operation it will likely be added as a separate field under this differing name
                 # [target_field_value in existing data,      formatting_algorithm,                                          desired_field_name in new object]
@@ -1051,6 +1572,12 @@ class Bibliography:
                              "contains sublists of arguments.")
 
 
+        # compile the target field expressions in conversion_arguments_list once (instead of evaluating them with
+        # ...eval() for each entry)
+        extraction_plan = compileConversionArgumentsList(conversion_arguments_list,
+                                                         entry_id_variable_name='each_entry_id',
+                                                         entry_variable_name='each_entry_data')
+
         # For logging
         console.log_message("\nFormatting of Bibliography entries started", add_timestamp_in_file=True)
         maximum_progress = len(csv_bibliography.entries.keys())
@@ -1062,14 +1589,13 @@ class Bibliography:
             if show_progress_bar:
                 console.print_current_progress(i, maximum_progress, 'Formatting Bibliography object entries')
 
-            # loop through each line in the conversion_arguments_list
-            for each_argument_list in conversion_arguments_list:
-                # try using the elements of each sub-list in conversion_arguments_list as arguments of
-                # .setFormattedEntry method
+            # loop through each line in the extraction plan
+            for each_accessor, each_formatting_algorithm, each_desired_field_name in extraction_plan:
+                # try using the elements of each line in the extraction plan as arguments of .setFormattedEntry method
                 # (try-except block is necessary, as each field may not exist for each entry)
                 try:
-                    instance.setFormattedEntry(each_entry_id, eval(each_argument_list[0]),
-                                               each_argument_list[1], each_argument_list[2])
+                    instance.setFormattedEntry(each_entry_id, each_accessor(each_entry_id, each_entry_data),
+                                               each_formatting_algorithm, each_desired_field_name)
                 except:
                     # TODO: Restore this line (replaced it with a more forgiving except statement for now)
                     # except KeyError:
@@ -1087,6 +1613,62 @@ class Bibliography:
                                                                     #  ... '.summarize()' does not print to file
         instance.summarize()
 
+        if snapshot_path is not None:
+            instance.save(snapshot_path)
+
+
+    def importParquet(instance, path_of_file_to_import, columns=None, memory_map=True):
+        """
+        Imports a Parquet file written by .exportToParquet() (requires the pyarrow package). Values are read without
+        any parsing or formatting, list columns are imported as list values, and JSON-encoded columns are decoded
+        (so that each value has the type it had when it was exported).
+
+        Args:
+            path_of_file_to_import(str): Path of the .parquet file
+
+        Keyword Args:
+            columns(list): Names of the fields to be imported. If None, all fields are imported.
+            memory_map(bool): If True, the file is memory-mapped instead of being read into memory first.
+
+        Returns:
+            Nothing; modifies the object it is called from.
+
+        Examples:
+            See .exportToParquet()
+        """
+        import pyarrow.parquet
+        from meta.consoleOutput import ConsoleOutput
+
+        console = ConsoleOutput('log.txt')
+        console.log_message('Import of "%s" started' % path_of_file_to_import, add_timestamp_in_file=True)
+        instance._recordSourceFile(path_of_file_to_import, {'import_method': 'importParquet', 'columns': columns})
+
+        if columns is not None:
+            columns = [Bibliography._PARQUET_ID_COLUMN] + \
+                      [each_column for each_column in columns if each_column != Bibliography._PARQUET_ID_COLUMN]
+        table = pyarrow.parquet.read_table(path_of_file_to_import, columns=columns, memory_map=memory_map)
+
+        # columns of files that are not written by .exportToParquet() have no encoding, and are read as they are
+        column_encodings = {}
+        for each_field in table.schema:
+            each_encoding = (each_field.metadata or {}).get(Bibliography._PARQUET_ENCODING_METADATA_KEY, b'')
+            column_encodings[each_field.name] = each_encoding.decode()
+
+        no_of_imported_entries = 0
+        for each_record_batch in table.to_batches():
+            batch_columns = each_record_batch.to_pydict()
+            entry_ids = batch_columns.pop(Bibliography._PARQUET_ID_COLUMN)
+            for i, each_entry_id in enumerate(entry_ids):
+                for each_field_name, each_column_values in batch_columns.items():
+                    if each_column_values[i] is not None:
+                        instance.setEntry(each_entry_id, each_field_name,
+                                          Bibliography._decodeParquetCell(column_encodings[each_field_name],
+                                                                          each_column_values[i]))
+                no_of_imported_entries += 1
+
+        console.log_message('Import of "%s" finished (%d entries)' % (path_of_file_to_import, no_of_imported_entries),
+                            add_timestamp_in_file=True)
+
 
     ###################################################################################################################
     ############################################ MANIPULATION FUNCTIONS ###############################################
@@ -1115,13 +1697,24 @@ class Bibliography:
             >>> my_bibliography.setEntry("02", "title", "Another title")
             >>> my_bibliography.entries
             {'01': {'author': 'John Can Lokman', 'title': 'A title'}, '02': {'title': 'Another title'}}
+
+            >>> # with intern_values, equal values of categorical fields (e.g., publishers) share one object
+            >>> my_interning_bibliography = Bibliography(intern_values=True)
+            >>> my_interning_bibliography.setEntry("01", "b_publisher", "Elsevier BV")
+            >>> my_interning_bibliography.setEntry("02", "b_publisher", "".join(["Elsevier", " BV"]))
+            >>> my_interning_bibliography.entries["02"]["b_publisher"] is my_interning_bibliography.entries["01"]["b_publisher"]
+            True
         """
+        # use the pooled object for the value, if an equal value has been added before
+        if instance._value_pool is not None and field_name in instance._interned_fields:
+            field_value = instance._value_pool.intern(field_value)
+
         # if the ID is a new entry
         if entry_id not in instance._id_registry:
             # add target id as key of a the output dictionary and a subdictionary to it as fields and values
             instance.entries[entry_id] = {field_name: field_value}
             # add an instance id to the instance._id_registry
-            instance._id_registry.append(entry_id)
+            instance._id_registry[entry_id] = None
 
         # if the ID is NOT a new entry
         else:
@@ -1201,9 +1794,15 @@ class Bibliography:
         # if the current field does not exist for the current entry
 
 
-    def enrich_with(instance, target_bibliography_object, field_to_match_in_bibliographies, method='left join'):
+    def enrich_with(instance, target_bibliography_object, field_to_match_in_bibliographies, method='left join',
+                    multiple_matches='first', add_entries_without_field_to_match=True, key_normalizer=None):
         """
-        Left joins or merges two bibliographies.
+        Left joins, merges or inner joins two bibliographies.
+
+        Entries are matched using a hash index of the values of field_to_match_in_bibliographies in the current
+        bibliography, which is built once (see .indexField()), so the run time grows linearly with the size of the
+        bibliographies. The numbers of matched, unmatched and enriched entries are logged, and are kept in the
+        'no_of_..._in_last_operation' attributes of the bibliography.
 
         Args:
             target_bibliography_object(Bibliography): The target bibliography that will be used to enrich the current
@@ -1217,6 +1816,22 @@ class Bibliography:
                 belong to exists in the instance bibliography (i.e., to self)
             'merge' (method): Left joins when possible, add if not, adds new entries from other_bibliography to the
                 instance bibliography (i.e., to self)
+            'inner join' (method): Left joins, and then removes the entries of the instance bibliography that did not
+                match any entry in the target_bibliography_object
+            'first' (multiple_matches): If a value (e.g., a DOI) matches multiple entries in the instance bibliography,
+                only the first of them is enriched
+            'all' (multiple_matches): All entries that match a value are enriched
+            'error' (multiple_matches): Raises a ValueError if a value matches multiple entries
+            add_entries_without_field_to_match(bool): Only used in 'merge' mode. If False, the entries of the
+                target_bibliography_object that do not have the field_to_match_in_bibliographies (e.g., entries without
+                a DOI) are not added to the instance bibliography.
+            key_normalizer(str or function): If provided, the values of field_to_match_in_bibliographies are
+                normalized before they are matched (see normalizeKey()). With 'doi', DOIs in different notations
+                (e.g., '10.1016--J.FUTURE.2017.04.017' and 'https://doi.org/10.1016/j.future.2017.04.017') match.
+
+        Raises:
+            ValueError: If the method or multiple_matches parameter is not one of the options above, or if
+                multiple_matches is 'error' and a value matches multiple entries.
 
         Returns:
             Nothing
@@ -1252,6 +1867,9 @@ class Bibliography:
             Existing entries enriched: 1
             Fields added to existing entries: 1
             New entries added: 0
+            Entries with a match: 1 (with multiple matches: 0)
+            Entries without a match: 0
+            Entries without the field "doi": 0
             >>> bib_one.preview()
             <BLANKLINE>
             ----------------------------------ENTRY 1----------------------------------
@@ -1267,6 +1885,9 @@ class Bibliography:
             Existing entries enriched: 0
             Fields added to existing entries: 0
             New entries added: 0
+            Entries with a match: 1 (with multiple matches: 0)
+            Entries without a match: 1
+            Entries without the field "doi": 0
             >>> bib_one.preview(10)
             <BLANKLINE>
             ----------------------------------ENTRY 1----------------------------------
@@ -1285,6 +1906,9 @@ class Bibliography:
             Existing entries enriched: 1
             Fields added to existing entries: 1
             New entries added: 1
+            Entries with a match: 2 (with multiple matches: 0)
+            Entries without a match: 1
+            Entries without the field "doi": 0
 
             >>> bib_one.preview(10)
             <BLANKLINE>
@@ -1300,6 +1924,54 @@ class Bibliography:
             <BLANKLINE>
 
 
+            >>> # multiple matches and 'inner join' mode
+            >>> bib_three = Bibliography()
+            >>> bib_three.setEntry(entry_id='a', field_name='doi', field_value='1111')
+            >>> bib_three.setEntry(entry_id='b', field_name='doi', field_value='1111')
+            >>> bib_three.setEntry(entry_id='c', field_name='doi', field_value='2222')
+            >>> bib_four = Bibliography()
+            >>> bib_four.setEntry(entry_id='x', field_name='doi', field_value='1111')
+            >>> bib_four.setEntry(entry_id='x', field_name='note', field_value='A note')
+            >>> bib_four.setEntry(entry_id='y', field_name='note', field_value='An entry without doi')
+            >>> try:
+            ...     bib_three.enrich_with(bib_four, field_to_match_in_bibliographies='doi', multiple_matches='error')
+            ... except ValueError as error_message:
+            ...     print('ValueError: ' + str(error_message))
+            ValueError: More than one ID (['a', 'b']) in the source bibliography returned with the field name 'doi' and value '1111'.
+            >>> bib_three.enrich_with(bib_four, field_to_match_in_bibliographies='doi', method='inner join',
+            ...                       multiple_matches='all')
+            <BLANKLINE>
+            Enrichment completed successfully.
+            Existing entries enriched: 2
+            Fields added to existing entries: 2
+            New entries added: 0
+            Entries with a match: 1 (with multiple matches: 1)
+            Entries without a match: 0
+            Entries without the field "doi": 1
+            Unmatched entries removed: 1
+            >>> bib_three.entries
+            {'a': {'doi': '1111', 'note': 'A note'}, 'b': {'doi': '1111', 'note': 'A note'}}
+
+
+            >>> # matching DOIs in different notations
+            >>> bib_five = Bibliography()
+            >>> bib_five.setEntry(entry_id='v1', field_name='b_doi', field_value='10.1016--J.FUTURE.2017.04.017')
+            >>> bib_six = Bibliography()
+            >>> bib_six.setEntry(entry_id='o1', field_name='b_doi', field_value='10.1016/j.future.2017.04.017')
+            >>> bib_six.setEntry(entry_id='o1', field_name='b_pmid', field_value='12713994')
+            >>> bib_five.enrich_with(bib_six, field_to_match_in_bibliographies='b_doi', key_normalizer='doi')
+            <BLANKLINE>
+            Enrichment completed successfully.
+            Existing entries enriched: 1
+            Fields added to existing entries: 1
+            New entries added: 0
+            Entries with a match: 1 (with multiple matches: 0)
+            Entries without a match: 0
+            Entries without the field "b_doi": 0
+            >>> bib_five.entries
+            {'v1': {'b_doi': '10.1016--J.FUTURE.2017.04.017', 'b_pmid': '12713994'}}
+
+
             >>> #=============================================
             >>> # EXAMPLE: IMPORT AND COMBINE TWO BIBTEX FILES
             >>> #=============================================
@@ -1450,6 +2122,9 @@ class Bibliography:
             Existing entries enriched: 2
             Fields added to existing entries: 12
             New entries added: 0
+            Entries with a match: 2 (with multiple matches: 0)
+            Entries without a match: 0
+            Entries without the field "b_doi": 0
 
             >>> bib_poor.preview(100)
             <BLANKLINE>
@@ -1729,6 +2404,9 @@ class Bibliography:
             Existing entries enriched: 2
             Fields added to existing entries: 23
             New entries added: 0
+            Entries with a match: 2 (with multiple matches: 0)
+            Entries without a match: 1
+            Entries without the field "b_doi": 0
 
 
             >>> vu_bibliography.preview(100)
@@ -1855,86 +2533,124 @@ class Bibliography:
               'b_volume': '89'})
             <BLANKLINE>
         """
+        if method not in ['left join', 'merge', 'inner join']:
+            raise ValueError('Unknown method "%s"; method must be "left join", "merge" or "inner join".' % method)
+        if multiple_matches not in ['first', 'all', 'error']:
+            raise ValueError('Unknown multiple_matches option "%s"; it must be "first", "all" or "error".'
+                             % multiple_matches)
+        if type(key_normalizer) == str and key_normalizer not in KEY_NORMALIZERS:
+            raise ValueError('Unknown key_normalizer "%s"; it must be a function or one of: %s.'
+                             % (key_normalizer, ', '.join(KEY_NORMALIZERS)))
+
         # reset instance counters (in case this is not the first merge operation on the instance, this is necessary)
         instance.no_of_entries_enriched_in_last_operation = 0
         instance.no_of_existing_fields_enriched_in_last_operation = 0
         instance.no_of_entries_added_in_last_operation = 0
         instance.no_of_fields_added_in_last_operation = 0
+        instance.no_of_matched_entries_in_last_operation = 0
+        instance.no_of_unmatched_entries_in_last_operation = 0
+        instance.no_of_entries_without_field_to_match_in_last_operation = 0
+        instance.no_of_entries_with_multiple_matches_in_last_operation = 0
+        instance.no_of_entries_removed_in_last_operation = 0
 
         other_bibliography = target_bibliography_object
         target_field_name = field_to_match_in_bibliographies
 
-        for each_entry_id_in_other_bibliography, each_entry_data_in_other_bibliography in other_bibliography.entries.items():
+        # hash index of the target field (e.g., {doi: [entry_id, ...]}). it is kept up to date by .setEntry(), so
+        # ...entries added in 'merge' mode can also be matched by the subsequent entries of the other bibliography.
+        target_field_index = instance._getFieldValuesIndex(target_field_name, key_normalizer)
+        matched_entry_ids_in_this_bibliography = {}  # used as an ordered set (for 'inner join')
 
-            # for logging
-            last_entry_is_enriched = False
-            last_entry_is_added = False
+        for each_entry_id_in_other_bibliography, each_entry_data_in_other_bibliography in other_bibliography.entries.items():
 
-            # if a field name and value(e.g., doi) from other bibliography is found in the current one, enrich
-            # the corresponding entry in the current dataset with this field name and its value
-            # TODO: This try-except block should either be made more specific or replaced with an if-else block
-            try:
+            # find the entries in this bibliography whose target field has the same value (e.g., doi)
+            matching_entry_ids_in_this_bibliography = None
+            if target_field_name not in each_entry_data_in_other_bibliography:
+                instance.no_of_entries_without_field_to_match_in_last_operation += 1
+                entry_can_be_added = add_entries_without_field_to_match
+            else:
                 each_target_value_in_other_bibliography = each_entry_data_in_other_bibliography[target_field_name]
-
-                # Make sure that only one entry in self matches the target value (e.g., doi)
-                matching_entry_in_this_bibliography = instance.getEntriesByField(field_name=target_field_name, field_value=each_target_value_in_other_bibliography)
-                matching_entry_ids_in_this_bibliography = instance._field_values_registry[target_field_name][each_target_value_in_other_bibliography]
-
-                if len(matching_entry_ids_in_this_bibliography) > 1:
-
-                    # TODO: If a DOI (or another target value) appears in multiple entries, only the first entry is
-                    # TODO: ... enriched, and the other occurrences is simply left alone.
-                    # TODO: ... A 'merge_duplicate_entries' function should be implemented and used during cleaning for
+                if key_normalizer is not None:
+                    each_target_value_in_other_bibliography = normalizeKey(each_target_value_in_other_bibliography,
+                                                                           key_normalizer)
+                try:
+                    matching_entry_ids_in_this_bibliography = target_field_index.get(each_target_value_in_other_bibliography)
+                except TypeError:  # values that cannot be matched (e.g., lists of values) are treated as non-matches
+                    pass
+                entry_can_be_added = True
+
+            # if there is no match, add the entry to this bibliography (if in merge mode)
+            if not matching_entry_ids_in_this_bibliography:
+                if target_field_name in each_entry_data_in_other_bibliography:
+                    instance.no_of_unmatched_entries_in_last_operation += 1
+
+                if method == 'merge' and entry_can_be_added:
+                    for each_field_name_in_entry_from_other_bibliography, each_field_value_in_entry_from_other_bibliography in each_entry_data_in_other_bibliography.items():
+                        instance.setEntry(each_entry_id_in_other_bibliography, each_field_name_in_entry_from_other_bibliography, each_field_value_in_entry_from_other_bibliography)
+                        instance.no_of_fields_added_in_last_operation += 1
+                    instance.no_of_entries_added_in_last_operation += 1
+                continue
+
+            instance.no_of_matched_entries_in_last_operation += 1
+
+            if len(matching_entry_ids_in_this_bibliography) > 1:
+                instance.no_of_entries_with_multiple_matches_in_last_operation += 1
+
+                if multiple_matches == 'error':
+                    raise ValueError("More than one ID (%s) in the source bibliography returned with the field name '%s' and value '%s'."
+                                     % (matching_entry_ids_in_this_bibliography, target_field_name, each_target_value_in_other_bibliography))
+                elif multiple_matches == 'first':
+                    # TODO: A 'merge_duplicate_entries' function should be implemented and used during cleaning for
                     # TODO: ... cleaner behavior
-                    # If multiple matches is the case (e.g., a DOI appears in multiple entries in self bibliography)
-                    # only set the first occurrence for enrichment
-                    matching_entry_id_in_this_bibliography = matching_entry_ids_in_this_bibliography[0]
+                    matching_entry_ids_in_this_bibliography = matching_entry_ids_in_this_bibliography[:1]
+            # (copied, as the index is updated while the fields of the matching entries are enriched)
+            matching_entry_ids_in_this_bibliography = list(matching_entry_ids_in_this_bibliography)
 
-                    # the old error in case there is more than one matching (e.g.) DOI:
-                    #raise ValueError("More than one ID (%s) in the source bibliography returned with the field name '%s' and value '%s'."
-                    #                % (matching_entry_ids_in_this_bibliography, target_field_name, each_target_value_in_other_bibliography))
-                else:
-                    matching_entry_id_in_this_bibliography = matching_entry_ids_in_this_bibliography[0]
+            # Enrich fields of matching entries (fields that already exist in this bibliography are left alone)
+            for each_matching_entry_id_in_this_bibliography in matching_entry_ids_in_this_bibliography:
+                matched_entry_ids_in_this_bibliography[each_matching_entry_id_in_this_bibliography] = None
+                matching_entry_in_this_bibliography = instance.entries[each_matching_entry_id_in_this_bibliography]
 
-                # Enrich fields of matching entries
-                existing_field_names_in_matching_entry_of_this_bibliography = list(matching_entry_in_this_bibliography[0].keys())
+                last_entry_is_enriched = False
                 for each_field_name_in_entry_from_other_bibliography, each_field_value_in_entry_from_other_bibliography in each_entry_data_in_other_bibliography.items():
-
-                    if each_field_name_in_entry_from_other_bibliography not in existing_field_names_in_matching_entry_of_this_bibliography:
-                        instance.entries[matching_entry_id_in_this_bibliography][each_field_name_in_entry_from_other_bibliography] \
+                    if each_field_name_in_entry_from_other_bibliography not in matching_entry_in_this_bibliography:
+                        matching_entry_in_this_bibliography[each_field_name_in_entry_from_other_bibliography] \
                             = each_field_value_in_entry_from_other_bibliography
+                        instance.updateFieldValuesRegistry(each_matching_entry_id_in_this_bibliography,
+                                                           each_field_name_in_entry_from_other_bibliography,
+                                                           each_field_value_in_entry_from_other_bibliography)
 
                         # Logging
                         instance.no_of_existing_fields_enriched_in_last_operation += 1
                         last_entry_is_enriched = True
 
-                    else:  # if field already exists in self bibliography, do nothing
-                        pass
-            # TODO: Merge function is not thoroughly tested and it should be
-            except:  # if the field name and value from the other bib is not found
-               if method == 'merge':  # add field name and value to a new entry (if in merge mode)
-                   for each_field_name_in_entry_from_other_bibliography, each_field_value_in_entry_from_other_bibliography in each_entry_data_in_other_bibliography.items():
-                       instance.setEntry(each_entry_id_in_other_bibliography, each_field_name_in_entry_from_other_bibliography, each_field_value_in_entry_from_other_bibliography)
-
-   ###### Logging ######################################################################################################
-                       instance.no_of_fields_added_in_last_operation += 1
-
-                   last_entry_is_added = True
-               else:  # not in merge mode, do nothing
-                   pass
+                if last_entry_is_enriched:
+                    instance.no_of_entries_enriched_in_last_operation += 1
 
-            if last_entry_is_enriched:
-                instance.no_of_entries_enriched_in_last_operation += 1
-            elif last_entry_is_added:
-                instance.no_of_entries_added_in_last_operation += 1
+        if method == 'inner join':
+            for each_entry_id in list(instance.entries.keys()):
+                if each_entry_id not in matched_entry_ids_in_this_bibliography:
+                    instance._removeEntry(each_entry_id)
+                    instance.no_of_entries_removed_in_last_operation += 1
 
+   ###### Logging ######################################################################################################
         lines_of_console_message = [
             'Existing entries enriched: %d' % instance.no_of_entries_enriched_in_last_operation,
             'Fields added to existing entries: %d' % instance.no_of_existing_fields_enriched_in_last_operation,
-            'New entries added: %d' % instance.no_of_entries_added_in_last_operation
+            'New entries added: %d' % instance.no_of_entries_added_in_last_operation,
             #'New fields added with new entries: %d' % instance.no_of_fields_added_in_last_operation #  currently
                                                                                         # ... unnecessary  to report
+            'Entries with a match: %d (with multiple matches: %d)'
+            % (instance.no_of_matched_entries_in_last_operation,
+               instance.no_of_entries_with_multiple_matches_in_last_operation),
+            'Entries without a match: %d' % instance.no_of_unmatched_entries_in_last_operation,
+            'Entries without the field "%s": %d'
+            % (target_field_name, instance.no_of_entries_without_field_to_match_in_last_operation)
         ]
+        if method == 'inner join':
+            lines_of_console_message.append('Unmatched entries removed: %d'
+                                            % instance.no_of_entries_removed_in_last_operation)
+
         from meta.consoleOutput import ConsoleOutput
         console = ConsoleOutput('log.txt')
         console.log_list_with_caption('\nEnrichment completed successfully.', lines_of_console_message,
@@ -2031,8 +2747,8 @@ class Bibliography:
                 2016
 
         """
-        # Get matching ids from registry based on field name-value combination
-        matching_ids_list = instance._field_values_registry[field_name][field_value]
+        # Get matching ids from registry based on field name-value combination (the field is indexed if it is not yet)
+        matching_ids_list = instance._getFieldValuesIndex(field_name)[field_value]
 
         # Use matching ids that are returned to retrieve entities these ids correspond to
         matching_entries_list = []
@@ -2041,6 +2757,94 @@ class Bibliography:
         return matching_entries_list
 
 
+    def getEntriesByFieldPrefix(instance, field_name, prefix, case_sensitive=False):
+        """
+        Returns the entries that have a value starting with the prefix in the given field (e.g., authors whose
+        names start with 'Lokman'). The query is answered using a search index of the field (see
+        Text_Search_Index), which is built on the first search of the field, and kept up to date as entries are added.
+
+        Args:
+            field_name(str): Name of the field to be searched (e.g., "b_author_labels").
+            prefix(str): The beginning of the values that are searched (e.g., "Lokman").
+            case_sensitive(bool)
+
+        Returns:
+            A list of bibliography entries (each matching entry is returned once).
+
+        Examples:
+            >>> bibx = Bibliography()
+            >>> bibx.setEntry("01", "b_author_labels", ["Lokman, JC", "Schlobach, S"])
+            >>> bibx.setEntry("02", "b_author_labels", ["Lokman, JC"])
+            >>> bibx.setEntry("03", "b_author_labels", ["Lohr, A"])
+            >>> bibx.getEntriesByFieldPrefix("b_author_labels", "lok")
+            [{'b_author_labels': ['Lokman, JC', 'Schlobach, S']}, {'b_author_labels': ['Lokman, JC']}]
+            >>> bibx.getEntriesByFieldPrefix("b_author_labels", "lok", case_sensitive=True)
+            []
+
+            >>> # the index is updated as entries are added
+            >>> bibx.setEntry("04", "b_author_labels", ["Lokhorst, GJ"])
+            >>> len(bibx.getEntriesByFieldPrefix("b_author_labels", "Lok"))
+            3
+        """
+        search_index = instance._getSearchIndex(field_name)
+        return instance._getEntriesByValues(field_name, search_index.find_prefix(prefix, case_sensitive))
+
+
+    def searchEntries(instance, field_name, substring, case_sensitive=False):
+        """
+        Returns the entries that have a value containing the substring in the given field (e.g., titles that contain
+        'lepton'). The query is answered using the n-gram index of the field (see Text_Search_Index), which is built
+        on the first search of the field, and kept up to date as entries are added.
+
+        Args:
+            field_name(str): Name of the field to be searched (e.g., "b_document_label").
+            substring(str): The part of the values that is searched (e.g., "lepton flavour").
+            case_sensitive(bool)
+
+        Returns:
+            A list of bibliography entries (each matching entry is returned once).
+
+        Examples:
+            >>> bibx = Bibliography()
+            >>> bibx.setEntry("01", "b_document_label", "A search for lepton flavour violation")
+            >>> bibx.setEntry("02", "b_document_label", "Tax compliance and auditing")
+            >>> bibx.setEntry("03", "b_topic_labels", ["Lepton flavour", "Tax"])
+            >>> bibx.searchEntries("b_document_label", "LEPTON FLAV")
+            [{'b_document_label': 'A search for lepton flavour violation'}]
+            >>> bibx.searchEntries("b_topic_labels", "ax")
+            [{'b_topic_labels': ['Lepton flavour', 'Tax']}]
+            >>> bibx.searchEntries("b_document_label", "not in any title")
+            []
+        """
+        search_index = instance._getSearchIndex(field_name)
+        return instance._getEntriesByValues(field_name, search_index.find_substring(substring, case_sensitive))
+
+
+    def _getSearchIndex(instance, field_name):
+        """
+        Returns the search index of a field, and builds it (from the distinct values of the field) if it does not
+        exist yet.
+        """
+        try:
+            return instance._search_indexes[field_name]
+        except KeyError:
+            search_index = Text_Search_Index(instance._getFieldValuesIndex(field_name))
+            instance._search_indexes[field_name] = search_index
+            return search_index
+
+
+    def _getEntriesByValues(instance, field_name, field_values):
+        """
+        Returns the entries that have any of the given values in the field (each entry is returned once).
+        """
+        field_values_index = instance._getFieldValuesIndex(field_name)
+        matching_entry_ids = {}  # used as an ordered set
+        for each_field_value in field_values:
+            for each_entry_id in field_values_index.get(each_field_value, []):
+                matching_entry_ids[each_entry_id] = None
+        return [instance.entries[each_entry_id] for each_entry_id in matching_entry_ids]
+
+
     def summarize(instance, print_header_text=False):
         """
         Prints summary statistsics of the bibliograpghy.
@@ -2113,6 +2917,9 @@ class Bibliography:
             Updates instance registry each time an entry is added to the bibliography instance. The registry allows
             fast searching entries in the bibliography.
 
+            Only the fields that are already indexed are updated (see the indexed_fields parameter of the constructor
+            and .indexField()); the values of other fields are indexed when they are first looked up.
+
             Args:
                  entry_id (str): id to be assigned to entry (e.g., '2341230u9078').
                  field_name(str): name of field (e.g., 'author')
@@ -2126,122 +2933,130 @@ class Bibliography:
                 >>> from triplicator.bibTools import Bibliography
                 >>> bibx = Bibliography()
 
-                >>> # add first entry and see how instance registry is updated afterwards
+                >>> # add first entry and see that fields are not indexed until they are looked up
                 >>> bibx.setEntry("01", "author", "John Can Lokman")
                 >>> bibx.setEntry("01", "title", "Test Book 1")
                 >>> print(bibx._field_values_registry)
-                {'author': {'John Can Lokman': ['01']}, 'title': {'Test Book 1': ['01']}}
+                {}
+                >>> bibx.getEntriesByField("author", "John Can Lokman")
+                [{'author': 'John Can Lokman', 'title': 'Test Book 1'}]
+                >>> print(bibx._field_values_registry)
+                {'author': {'John Can Lokman': ['01']}}
 
                 >>> # add second entry and see how instance registry is updated afterwards
                 >>> bibx.setEntry("02", "title", "Test Book 2")
                 >>> bibx.setEntry("02", "author", "Stefan Schlobach")
                 >>> print(bibx._field_values_registry)
+                {'author': {'John Can Lokman': ['01'], 'Stefan Schlobach': ['02']}}
+
+                >>> # all fields are indexed as entries are added if indexed_fields='all'
+                >>> biby = Bibliography(indexed_fields='all')
+                >>> biby.setEntry("01", "author", "John Can Lokman")
+                >>> biby.setEntry("01", "title", "Test Book 1")
+                >>> biby.setEntry("02", "title", "Test Book 2")
+                >>> biby.setEntry("02", "author", "Stefan Schlobach")
+                >>> print(biby._field_values_registry)
                 {'author': {'John Can Lokman': ['01'], 'Stefan Schlobach': ['02']}, 'title': {'Test Book 1': ['01'], 'Test Book 2': ['02']}}
 
-            TODO:
-                - Input should be treated as a search string rather than an exact string, so, for instance, a partial
-                    author name can also be searched.
+            See .getEntriesByFieldPrefix() and .searchEntries() for searching partial values (e.g., a partial author
+            name).
         """
-        # function must be able to accept a list of items, as this is sometimes the case (e.g., multiple authors
-        # ...for author field).
-        # Therefore, strings inputs are converted to lists to be compatible with the list processing facilities
-        field_value_list = []
+        if field_name in Bibliography._class_field_values_registry:
+            instance._addToGlobalFieldValuesIndex(entry_id, field_name, field_value)
 
-        if type(field_value) == str:
-            field_value_list = [field_value]
+        # if field_name (e.g., 'abstract') is not indexed, there is nothing to update
+        if field_name not in instance._field_values_registry:
+            if not instance._index_all_fields:
+                return
+            instance._field_values_registry[field_name] = {}
 
-            # Debugger
-            #print("input is this string:")
-            #print(field_value_list)
+        instance._addToFieldValuesIndex(instance._field_values_registry[field_name], entry_id, field_value)
 
-        # Explicit statement. If the parameter is already a list, take it as it is
-        elif type(field_value) == list:
-            field_value_list = field_value
+        if field_name in instance._search_indexes:
+            instance._search_indexes[field_name].add(field_value)
 
-            # Debugger
-            # print("input is this list:")
-            # print(field_value_list)
+        if field_name in instance._normalized_field_values_registry:
+            for each_key_normalizer, each_normalized_index in \
+                    instance._normalized_field_values_registry[field_name].items():
+                instance._addToFieldValuesIndex(each_normalized_index, entry_id,
+                                                normalizeKey(field_value, each_key_normalizer))
 
-        elif type(field_value) is None:
-            pass
 
-        #else:
-        #    #raise Exception("'field_value' must be string or list. It is currently: " + str(field_value))
-
-        if field_value_list != []:
-            for each_field_value in field_value_list:
-                # if field_name (e.g., author) has never been added to the registry
-                if field_name not in instance._field_values_registry:
-
-                    # Debugger
-                    #print("SCENARIO 1")
-                    #print("field_values_registry is currently:")
-                    #print(instance._field_values_registry)
-
-                    # Add dictionary entry for the field name-value pair and the entry id (e.g., {author:{"john x":[124515152])}
-                    # NOTE: Below line can instead use instance._field_type_registry for more efficient search. This has to be tested
-                    instance._field_values_registry[field_name] = {each_field_value: [entry_id]}
-
-                    # Debugger
-                    #print("field_name '" + str(field_name) + "' is not in registry")
-                    #print("the current field value is: '" + each_field_value + "' (and it is not in registry).")
-                    #print("field name and current field value is now added to registry with the following command:")
-                    #print("instance._field_values_registry[field_name] = {each_field_value: [entry_id]}")
-                    #print("the field_values_registry has now become:")
-                    #print(instance._field_values_registry)
-
-                # if field name (e.g., 'author' field) is previously added to the registry...
-                elif field_name in instance._field_values_registry:
-
-                    # Debugger
-                    #print("SCENARIO 2")
-                    #print("field_values_registry is currently:")
-                    #print(instance._field_values_registry)
-
-                    # ...but if field_value (e.g., author's name) has never been added to the registry
-                    if each_field_value not in instance._field_values_registry[field_name]:
-                        # add this field value (e.g., author) and set its value to a LIST that contains current entry_id
-                        # so that this list can later be appended with other entry_ids.
-                        # an example operation performed by the line below would be equivalent to:
-                        # instance._field_values_registry[author] = {"John x": ["14578436002"]}
-                        # which creates this dictionary entry:
-                        # _field_values_registry:{ author:{ "John x": ["14578436002"] } }
-                        instance._field_values_registry[field_name][each_field_value] = [entry_id]
-
-                        # Debugger
-                        #print("field_name '" + str(field_name) + "' has been found in the registry")
-                        #print("current field value '" + each_field_value + "' has NOT been found in the registry")
-                        #print("field name and current field value is now added to registry with the following command:")
-                        #print("instance._field_values_registry[field_name] = {each_field_value: [entry_id]}")
-                        #print("the field_values_registry has now become:")
-                        #print(instance._field_values_registry)
-
-                    # if field_value (e.g., author's name) is previously added to the registry
-                    elif each_field_value in instance._field_values_registry[field_name]:
-                        # Debugger
-                        #print("SCENARIO 3")
-                        #print("field_values_registry is currently:")
-                        #print(instance._field_values_registry)
-
-                        # append entry id to corresponding field value (e.g.,add entry_id to author name)
-                        # an example operation performed by the line below would be equivalent to:
-                        # instance._field_values_registry[author]["John x"].append["14578436002"]
-                        # which creates this dictionary entry:
-                        # _field_values_registry:{ author:{ "John x": ["some_previous_id", "14578436002"] } }
-                        instance._field_values_registry[field_name][each_field_value].append(entry_id)
-
-                        # Debugger
-                        #print("field_name '" + str(field_name) + "' has been found in the registry")
-                        #print("current field value '" + each_field_value + "' HAS been found in the registry")
-                        #print("field name and current field value is now added to registry with the following command:")
-                        #print("instance._field_values_registry[field_name] = {each_field_value: [entry_id]}")
-                        #print("the field_values_registry has now become:")
-                        #print(instance._field_values_registry)
-
-                        # Debugger
-                        #print("instance._field_values_registry is")
-                        #print(instance._field_values_registry)
-                        #print("")
+    def indexField(instance, field_name):
+        """
+            Builds the index of the values of a field (e.g., 'b_doi') from the current entries of the bibliography
+            instance. From then on, the index is kept up to date as entries are added with .setEntry(). Called
+            automatically on the first lookup of a field (e.g., by .getEntriesByField()).
+
+            Args:
+                field_name(str): name of field (e.g., 'author')
+
+            Returns:
+                dict: The index of the field, in the form of {field_value: [entry_id, ...]}
+
+            Examples:
+                >>> bibx = Bibliography()
+                >>> bibx.setEntry("01", "author", ["John Can Lokman", "Stefan Schlobach"])
+                >>> bibx.setEntry("02", "author", "John Can Lokman")
+                >>> bibx.indexField("author")
+                {'John Can Lokman': ['01', '02'], 'Stefan Schlobach': ['01']}
+        """
+        field_values_index = {}
+        for each_entry_id, each_entry_data in instance.entries.items():
+            if field_name in each_entry_data:
+                instance._addToFieldValuesIndex(field_values_index, each_entry_id, each_entry_data[field_name])
+
+        instance._field_values_registry[field_name] = field_values_index
+        return field_values_index
+
+
+    def _getFieldValuesIndex(instance, field_name, key_normalizer=None):
+        """
+            Returns the index of the values of a field, and builds it first if the field is not indexed yet. If a
+            key_normalizer is given (see normalizeKey()), the index of the normalized values of the field is returned
+            instead; it is built from the index of the field, so each distinct value is normalized only once.
+
+            Examples:
+                >>> bibx = Bibliography()
+                >>> bibx.setEntry("01", "b_doi", "10.1016--J.FUTURE.2017.04.017")
+                >>> bibx.setEntry("02", "b_doi", "https://doi.org/10.1016/j.future.2017.04.017")
+                >>> bibx._getFieldValuesIndex("b_doi", key_normalizer='doi')
+                {'10.1016/j.future.2017.04.017': ['01', '02']}
+
+                >>> # the normalized index is kept up to date as entries are added
+                >>> bibx.setEntry("03", "b_doi", "DOI: 10.1186/s13034-015-0062-7")
+                >>> bibx._getFieldValuesIndex("b_doi", key_normalizer='doi')
+                {'10.1016/j.future.2017.04.017': ['01', '02'], '10.1186/s13034-015-0062-7': ['03']}
+        """
+        if key_normalizer is None:
+            try:
+                return instance._field_values_registry[field_name]
+            except KeyError:
+                return instance.indexField(field_name)
+
+        normalized_indexes_of_field = instance._normalized_field_values_registry.setdefault(field_name, {})
+        try:
+            return normalized_indexes_of_field[key_normalizer]
+        except KeyError:
+            normalized_index = {}
+            for each_field_value, each_entry_ids in instance._getFieldValuesIndex(field_name).items():
+                normalized_index.setdefault(normalizeKey(each_field_value, key_normalizer), []).extend(each_entry_ids)
+            normalized_indexes_of_field[key_normalizer] = normalized_index
+            return normalized_index
+
+
+    @staticmethod
+    def _addToFieldValuesIndex(field_values_index, entry_id, field_value):
+        """
+            Adds the entry id to the index of a field under each of the field values (which may be a single value or
+            a list of values; e.g., multiple authors in the author field).
+        """
+        if type(field_value) == str:
+            field_values_index.setdefault(field_value, []).append(entry_id)
+
+        elif isinstance(field_value, list):
+            for each_field_value in field_value:
+                field_values_index.setdefault(each_field_value, []).append(entry_id)
 
     def updateFieldTypesRegistry(instance, entry_id, field_name, field_value):
 
@@ -2261,14 +3076,218 @@ class Bibliography:
                 instance._field_type_registry[field_name] += 1
 
 
+    def _removeEntry(instance, entry_id):
+        """
+        Removes an entry from the bibliography instance, and removes its fields and values from the registries.
+
+        Examples:
+            >>> bibx = Bibliography(indexed_fields='all')
+            >>> bibx.setEntry("01", "author", ["John Can Lokman", "Stefan Schlobach"])
+            >>> bibx.setEntry("02", "author", "John Can Lokman")
+            >>> bibx._removeEntry("01")
+            >>> bibx.entries
+            {'02': {'author': 'John Can Lokman'}}
+            >>> bibx._field_values_registry
+            {'author': {'John Can Lokman': ['02']}}
+            >>> bibx._field_type_registry
+            {'author': 1}
+        """
+        entry_data = instance.entries.pop(entry_id)
+        del instance._id_registry[entry_id]
+
+        for each_field_name, each_field_value in entry_data.items():
+            if each_field_name in instance._field_type_registry \
+                    and not (each_field_value == None or each_field_value == ' ' or each_field_value == '_'):
+                instance._field_type_registry[each_field_name] -= 1
+                if instance._field_type_registry[each_field_name] == 0:
+                    del instance._field_type_registry[each_field_name]
+
+            # normalized indexes of the field are rebuilt on their next lookup
+            instance._normalized_field_values_registry.pop(each_field_name, None)
+
+            if each_field_name in Bibliography._class_field_values_registry:
+                global_field_values_index = Bibliography._class_field_values_registry[each_field_name]
+                field_value_list = each_field_value if isinstance(each_field_value, list) else [each_field_value]
+                for each_value in field_value_list:
+                    entry_ids_by_bibliography = global_field_values_index.get(each_value, {})
+                    if entry_id in entry_ids_by_bibliography.get(instance._registry_number, []):
+                        entry_ids_by_bibliography[instance._registry_number].remove(entry_id)
+
+            if each_field_name in instance._field_values_registry:
+                field_values_index = instance._field_values_registry[each_field_name]
+                field_value_list = each_field_value if isinstance(each_field_value, list) else [each_field_value]
+                for each_value in field_value_list:
+                    if entry_id in field_values_index.get(each_value, []):
+                        field_values_index[each_value].remove(entry_id)
+                        if not field_values_index[each_value]:
+                            del field_values_index[each_value]
+
+
+    ###################################################################################################################
+    ########################################### CLASS REGISTRY FUNCTIONS ##############################################
+    ###################################################################################################################
+
+    @staticmethod
+    def _registerInstance(instance):
+        """
+            Adds a new bibliography to the (weak) registry of all instances, with a registry number that is unique
+            for the bibliography.
+        """
+        instance._registry_number = next(Bibliography._class_instance_counter)
+        Bibliography._class_instance_registry[instance._registry_number] = instance
+
+        # when the bibliography is garbage collected, its values are removed from the global index
+        weakref.finalize(instance, Bibliography._removeFromGlobalIndex, instance._registry_number)
+
+
+    @staticmethod
+    def getLiveBibliographies():
+        """
+            Returns:
+                list: All Bibliography objects that are still in use, in order of creation.
+
+            Examples:
+                >>> my_bibliography = Bibliography()
+                >>> Bibliography.getLiveBibliographies()[-1] is my_bibliography
+                True
+
+                >>> # bibliographies that are no longer used are not kept in the registry
+                >>> my_registry_number = my_bibliography._registry_number
+                >>> del my_bibliography
+                >>> my_registry_number in Bibliography._class_instance_registry
+                False
+        """
+        return [Bibliography._class_instance_registry[each_registry_number]
+                for each_registry_number in sorted(Bibliography._class_instance_registry.keys())]
+
+
+    @staticmethod
+    def indexFieldGlobally(field_name):
+        """
+            Starts indexing the values of a field (e.g., 'b_doi') across all bibliographies, in
+            Bibliography._class_field_values_registry. The values in all live bibliographies are indexed immediately;
+            from then on, the index is kept up to date as entries are added to any bibliography. Called automatically
+            by .searchAllBibliographies() on the first search of a field.
+
+            Args:
+                field_name(str): name of field (e.g., 'author')
+
+            Returns:
+                Nothing; updates Bibliography._class_field_values_registry
+        """
+        if field_name in Bibliography._class_field_values_registry:
+            return
+
+        Bibliography._class_field_values_registry[field_name] = {}
+        for each_bibliography in Bibliography.getLiveBibliographies():
+            each_bibliography._addFieldToGlobalIndex(field_name)
+
+
+    @staticmethod
+    def searchAllBibliographies(field_name, field_value):
+        """
+            Searches all live bibliographies for entries with the given field name-value combination (e.g., a DOI or
+            an author), with a single lookup in the global index of the field (see .indexFieldGlobally()).
+
+            Args:
+                field_name(str): Name of the field to be searched (e.g., 'b_doi').
+                field_value(str): Value of the field that is being searched.
+
+            Returns:
+                list: (Bibliography, entry_id) pairs of the matching entries.
+
+            Examples:
+                >>> vu_bibliography = Bibliography()
+                >>> vu_bibliography.setEntry('vu_01', 'b_doi', '10.9999/global.index.example')
+                >>> uva_bibliography = Bibliography()
+                >>> uva_bibliography.setEntry('uva_01', 'b_doi', '10.9999/global.index.example')
+
+                >>> for each_bibliography, each_entry_id in Bibliography.searchAllBibliographies(
+                ...         'b_doi', '10.9999/global.index.example'):
+                ...     print(each_bibliography is vu_bibliography, each_bibliography is uva_bibliography, each_entry_id)
+                True False vu_01
+                False True uva_01
+
+                >>> # the index is kept up to date as entries are added to (or removed from) bibliographies
+                >>> oc_bibliography = Bibliography()
+                >>> oc_bibliography.setEntry('oc_01', 'b_doi', '10.9999/global.index.example')
+                >>> uva_bibliography._removeEntry('uva_01')
+                >>> [each_entry_id for each_bibliography, each_entry_id in
+                ...  Bibliography.searchAllBibliographies('b_doi', '10.9999/global.index.example')]
+                ['vu_01', 'oc_01']
+
+                >>> # and bibliographies that are no longer used are removed from it
+                >>> del vu_bibliography
+                >>> [each_entry_id for each_bibliography, each_entry_id in
+                ...  Bibliography.searchAllBibliographies('b_doi', '10.9999/global.index.example')]
+                ['oc_01']
+        """
+        Bibliography.indexFieldGlobally(field_name)
+
+        matching_entries = []
+        entry_ids_by_bibliography = Bibliography._class_field_values_registry[field_name].get(field_value, {})
+        for each_registry_number, each_entry_ids in sorted(entry_ids_by_bibliography.items()):
+            each_bibliography = Bibliography._class_instance_registry.get(each_registry_number)
+            if each_bibliography is not None:
+                for each_entry_id in each_entry_ids:
+                    matching_entries.append((each_bibliography, each_entry_id))
+        return matching_entries
+
+
+    def _addFieldToGlobalIndex(instance, field_name):
+        """
+            Adds the values of a field in all entries of the bibliography to the global index of the field.
+        """
+        for each_entry_id, each_entry_data in instance.entries.items():
+            if field_name in each_entry_data:
+                instance._addToGlobalFieldValuesIndex(each_entry_id, field_name, each_entry_data[field_name])
+
+
+    def _addToGlobalFieldValuesIndex(instance, entry_id, field_name, field_value):
+        """
+            Adds an entry id to the global index of a field, under each of the field values.
+        """
+        global_field_values_index = Bibliography._class_field_values_registry[field_name]
+        if type(field_value) == str:
+            field_value_list = [field_value]
+        elif isinstance(field_value, list):
+            field_value_list = field_value
+        else:
+            return
+
+        for each_field_value in field_value_list:
+            global_field_values_index.setdefault(each_field_value, {})\
+                .setdefault(instance._registry_number, []).append(entry_id)
+
+
+    @staticmethod
+    def _removeFromGlobalIndex(registry_number):
+        """
+            Removes the entries of a bibliography (e.g., one that has been garbage collected) from the global index.
+        """
+        for each_global_field_values_index in Bibliography._class_field_values_registry.values():
+            for each_field_value in list(each_global_field_values_index.keys()):
+                entry_ids_by_bibliography = each_global_field_values_index[each_field_value]
+                entry_ids_by_bibliography.pop(registry_number, None)
+                if not entry_ids_by_bibliography:
+                    del each_global_field_values_index[each_field_value]
+
+
     ###################################################################################################################
     ################################################ EXPORT FUNCTIONS #################################################
     ###################################################################################################################
+
+    # name of the column that holds the entry ids in Parquet files (see .exportToParquet() and .importParquet())
+    _PARQUET_ID_COLUMN = '_entry_id'
+
     def exportToCsv(instance, output_file_path, columns_to_ignore=None, new_header_names=None):
-        # TODO: This is a draft method, and it must be cleaned.
         """
         Converts a Bibliography object file to CSV format with custom formatting options and writes a .csv file.
 
+        The file is written in a single pass, row by row, directly from the entries of the bibliography. List values
+        (e.g., authors) are written as comma-separated values, and the characters '[', ']', "'", '{' and '}' are
+        removed from all cells.
+
         Args:
             output_file_path(str): path of the .csv file to be written
             columns_to_ignore(list): a list of strings that consists of column headers to be ignored during
@@ -2281,136 +3300,1195 @@ class Bibliography:
 
         Returns:
             New .csv file
+
+        Examples:
+            >>> my_bibliography = Bibliography()
+            >>> my_bibliography.setEntry('01', 'b_authors', ['Lokman_JC', 'Schlobach_S'])
+            >>> my_bibliography.setEntry('01', 'b_document_label', "A 'quoted' {title}; with a semicolon")
+            >>> my_bibliography.setEntry('02', 'b_document_label', 'Another title')
+            >>> my_bibliography.setEntry('02', 'b_doi', '10.1016/j.adolescence.2016.09.008')
+            >>> my_bibliography.exportToCsv('example_data//export_test.csv', columns_to_ignore=['b_doi'],
+            ...                             new_header_names=['Authors', 'Title'])
+            <BLANKLINE>
+            Bibliography is written to .csv file.
+            >>> with open('example_data//export_test.csv', encoding='UTF-8') as csv_file:
+            ...     print(csv_file.read())
+            "Authors";"Title"
+            "Lokman_JC, Schlobach_S";"A quoted title; with a semicolon"
+            " ";"Another title"
+            <BLANKLINE>
+
+            >>> import os
+            >>> os.remove('example_data//export_test.csv')
         """
         import csv
-        from preprocessor.ListData import ListData
-
-        list_data_bibliography = ListData()
-        list_data_bibliography.import_bibliography_object(instance)
-        #if columns_to_ignore != None:
-        list_data_bibliography.remove_columns(columns_to_ignore)
-        #if new_header_names != None:
-        list_data_bibliography.replace_headers(new_header_names)
-
-        #print(list_data_bibliography.headers_row)
-        #print(list_data_bibliography.data_rows)
-        #print(list_data_bibliography.dataset)
-        file = open(output_file_path, 'w', newline='', encoding='UTF-8')
-        writer = csv.writer(file, delimiter=';', quoting=csv.QUOTE_NONNUMERIC)
-        for row in list_data_bibliography.dataset:
-            writer.writerow(row)
-        print("\nBibliography is written to .csv file.")
-        file.close()
-
-        ### CLEANING ###
         import re
-        csv_file = open(output_file_path, 'r', encoding='UTF-8')
-        csv_string = csv_file.read()
-        csv_file.close()
 
-        csv_string_cleaned = re.sub('[\[\]\'\}{]', "", csv_string)
+        missing_data_character = ' '
+        pattern_of_characters_to_remove = re.compile('[\[\]\'\}{]')
 
-        csv_file = open(output_file_path, 'w', encoding='UTF-8')
-        csv_file.write(csv_string_cleaned)
-        csv_file.close()
+        def format_cell(cell_value):
+            # numbers (and None) are written as they are; everything else (e.g., lists) as a cleaned string
+            if cell_value is None or (type(cell_value) in (int, float)):
+                return cell_value
+            return pattern_of_characters_to_remove.sub('', str(cell_value))
 
+        headers = instance._getFieldNames()
 
-###################################################################################################################
-############################################## FORMATTING FUNCTIONS ###############################################
-###################################################################################################################
+        for each_column_to_ignore in columns_to_ignore or []:
+            if each_column_to_ignore not in headers:
+                raise ValueError('Column "%s" cannot be ignored, because it is not in the bibliography.'
+                                 % each_column_to_ignore)
+            headers.remove(each_column_to_ignore)
 
-def replacePatternsAsPerDictionary(input_string, patterns_dictionary):
-    """
-    Replaces patterns in an inputted string according to the key:value combinations in a dictionary. Useful for replacing
-    long name segments such as "_-_" with "-" in instance names during their creation.
+        if new_header_names is None:
+            header_names = headers
+        elif len(new_header_names) == len(headers):
+            header_names = new_header_names
+        else:
+            raise Exception('new_header_names should be the same length with the headers of the bibliography' + '\n' +
+                            'new_header_names length: ' + str(len(new_header_names)) + '\n' +
+                            'headers length: ' + str(len(headers)))
+
+        with open(output_file_path, 'w', encoding='UTF-8') as file:
+            writer = csv.writer(file, delimiter=';', quoting=csv.QUOTE_NONNUMERIC, lineterminator='\n')
+            writer.writerow([format_cell(each_header_name) for each_header_name in header_names])
+            for each_entry_data in instance.entries.values():
+                writer.writerow([format_cell(each_entry_data.get(each_header, missing_data_character))
+                                 for each_header in headers])
+        print("\nBibliography is written to .csv file.")
 
-    Args:
-        input_string (str): String to be processed
-        patterns_dictionary(dict): A dictionary that contains the key:value combinations to be used in replacement.
-             Keys in the patterns dictionary should be target patterns, while values of the dictionary should be
-             the desired replacement patterns or characters.
 
-    Returns:
-        A string
+    def exportToParquet(instance, output_file_path, compression='snappy', rows_per_group=10000):
+        """
+        Writes the bibliography to a Parquet file (requires the pyarrow package), with one column per field and a
+        '_entry_id' column for entry ids. Fields whose values are all strings are written as string columns, and
+        fields whose values are all lists of strings (e.g., 'b_authors') as list columns. Other fields (e.g., a field
+        that is a list in some entries and a string in others, or that has numbers) are written as string columns of
+        JSON-encoded values, so that .importParquet() returns each value with its original type. Missing fields are
+        written as nulls. The file is written in row groups, so that only one group of rows is held in memory at a
+        time.
 
-    Examples:
-        >>> patterns_dictionary = {"_-_" : "-",
-        ...                        ": "  : "-" }
-        >>> target_string = "Case_1_-_12:_Unknown"
-        >>> formatted_string = replacePatternsAsPerDictionary(target_string, patterns_dictionary)
-        >>> print(formatted_string)
-        Case_1-12:_Unknown
-    """
-    import re
+        Args:
+            output_file_path(str): path of the .parquet file to be written
 
-    output_string = input_string
+        Keyword Args:
+            compression(str): Compression codec of the Parquet file (e.g., 'snappy', 'gzip', 'zstd' or 'none')
+            rows_per_group(int): Number of entries in each row group
 
-    # replace undesired characters with the desired ones (e.g., ':' -> '-') using dictionary_of_patterns_to_replace
-    for each_target_pattern, each_replacement_pattern in patterns_dictionary.items():
-        output_string = re.sub(each_target_pattern, each_replacement_pattern, output_string)
+        Returns:
+            New .parquet file
 
-    return output_string
+        Examples:
+            >>> # (requires pyarrow)
+            >>> my_bibliography = Bibliography()
+            >>> my_bibliography.setEntry('01', 'b_authors', ['Lokman_JC', 'Schlobach_S'])
+            >>> my_bibliography.setEntry('01', 'b_document_label', 'A title')
+            >>> my_bibliography.setEntry('01', 'b_cited', ['https://w3id.org/oc/corpus/br/1'])
+            >>> my_bibliography.setEntry('02', 'b_document_label', 'Another title')
+            >>> my_bibliography.setEntry('02', 'b_cited', 'https://w3id.org/oc/corpus/br/2')
+            >>> my_bibliography.setEntry('02', 'b_citation_count', 2)
+            >>> my_bibliography.exportToParquet('example_data//export_test.parquet')  #doctest: +SKIP
+            <BLANKLINE>
+            Bibliography is written to .parquet file.
+
+            >>> my_imported_bibliography = Bibliography()
+            >>> my_imported_bibliography.importParquet('example_data//export_test.parquet')  #doctest: +SKIP
+            Import of "example_data//export_test.parquet" started
+            Import of "example_data//export_test.parquet" finished (2 entries)
+            >>> my_imported_bibliography.entries == my_bibliography.entries  #doctest: +SKIP
+            True
+
+            >>> # only the needed columns can be read
+            >>> my_labels = Bibliography()
+            >>> my_labels.importParquet('example_data//export_test.parquet', columns=['b_document_label'])  #doctest: +SKIP
+            Import of ...
+            >>> my_labels.entries  #doctest: +SKIP
+            {'01': {'b_document_label': 'A title'}, '02': {'b_document_label': 'Another title'}}
+
+            >>> import os
+            >>> os.remove('example_data//export_test.parquet')  #doctest: +SKIP
+        """
+        import pyarrow
+        import pyarrow.parquet
+
+        column_encodings = Bibliography._getParquetColumnEncodings(instance.entries)
+        field_names = list(column_encodings)
+
+        schema = pyarrow.schema(
+            [pyarrow.field(Bibliography._PARQUET_ID_COLUMN, pyarrow.string(), nullable=False)] +
+            [pyarrow.field(each_field_name,
+                           pyarrow.list_(pyarrow.string()) if each_encoding == 'list' else pyarrow.string(),
+                           metadata={Bibliography._PARQUET_ENCODING_METADATA_KEY: each_encoding})
+             for each_field_name, each_encoding in column_encodings.items()])
+
+        def write_row_group(writer, entry_ids, rows):
+            columns = [pyarrow.array(entry_ids, type=pyarrow.string())]
+            for each_field_name in field_names:
+                each_encoding = column_encodings[each_field_name]
+                columns.append(pyarrow.array([Bibliography._encodeParquetCell(each_encoding, each_row[each_field_name])
+                                              if each_field_name in each_row else None
+                                              for each_row in rows],
+                                             type=schema.field(each_field_name).type))
+            writer.write_table(pyarrow.Table.from_arrays(columns, schema=schema))
+
+        with pyarrow.parquet.ParquetWriter(output_file_path, schema, compression=compression) as writer:
+            entry_ids, rows = [], []
+            for each_entry_id, each_entry_data in instance.entries.items():
+                entry_ids.append(each_entry_id)
+                rows.append(each_entry_data)
+                if len(rows) == rows_per_group:
+                    write_row_group(writer, entry_ids, rows)
+                    entry_ids, rows = [], []
+            if rows:
+                write_row_group(writer, entry_ids, rows)
+        print("\nBibliography is written to .parquet file.")
+
+
+    # key of the Parquet field metadata that holds how the values of a column are encoded (see .exportToParquet())
+    _PARQUET_ENCODING_METADATA_KEY = b'bibliography_encoding'
+
+    @staticmethod
+    def _getParquetColumnEncodings(entries):
+        """
+        Determines how the values of each field are written to a Parquet file: 'string' if all values of the field are
+        strings, 'list' if all of them are lists of strings, and 'json' otherwise.
 
+        Args:
+            entries(dict): Entries of a bibliography
 
-def standardizeCapitalization(input_string, algorithm):
-    """
-    Converts title case words (e.g., ' The ') to lowercase e.g., ' the '). Allows conversion algorithms for multiple
-    scenarios (e.g., author names vs titles) and languages via keyword arguments of 'algorithm' parameter.
+        Returns:
+            dict: {field_name: encoding}, in the order the fields first appear in the entries
 
-    Args:
-        input_string (str): the string to be converted.
-        algorithm: capitalization algorithm to be used
+        Examples:
+            >>> my_entries = {'01': {'b_authors': ['Lokman_JC'], 'b_cited': ['br/1'], 'b_label': 'A title'},
+            ...               '02': {'b_cited': 'br/2', 'b_label': 'Another title', 'b_count': 2, 'b_note': None}}
+            >>> my_encodings = Bibliography._getParquetColumnEncodings(my_entries)
+            >>> my_encodings
+            {'b_authors': 'list', 'b_cited': 'json', 'b_label': 'string', 'b_count': 'json', 'b_note': 'json'}
+
+            >>> # values are decoded with their original types
+            >>> my_decoded_entries = {
+            ...     each_entry_id: {each_field_name: Bibliography._decodeParquetCell(
+            ...                         my_encodings[each_field_name],
+            ...                         Bibliography._encodeParquetCell(my_encodings[each_field_name], each_value))
+            ...                     for each_field_name, each_value in each_entry.items()}
+            ...     for each_entry_id, each_entry in my_entries.items()}
+            >>> my_decoded_entries == my_entries
+            True
+        """
+        column_encodings = {}
+        for each_entry_data in entries.values():
+            for each_field_name, each_field_value in each_entry_data.items():
+                if type(each_field_value) == str:
+                    each_encoding = 'string'
+                elif isinstance(each_field_value, list) and all(type(each_item) == str for each_item in each_field_value):
+                    each_encoding = 'list'
+                else:
+                    each_encoding = 'json'
 
-    Keyword Args:
-        "English title" (algorithm):
+                previous_encoding = column_encodings.setdefault(each_field_name, each_encoding)
+                if previous_encoding != each_encoding:
+                    column_encodings[each_field_name] = 'json'
+        return column_encodings
+
+
+    @staticmethod
+    def _encodeParquetCell(encoding, field_value):
+        """
+        Converts a field value to the value of a Parquet cell (see ._getParquetColumnEncodings()). Values that cannot
+        be encoded as JSON (i.e., objects other than strings, numbers, booleans, None, lists and dictionaries) are
+        written as their string representations.
+        """
+        import json
+
+        if encoding == 'json':
+            return json.dumps(field_value, default=str)
+        elif encoding == 'list':
+            return list(field_value)
+        return field_value
+
+
+    @staticmethod
+    def _decodeParquetCell(encoding, cell_value):
+        """
+        Converts the value of a Parquet cell back to a field value (see ._encodeParquetCell()).
+        """
+        import json
+
+        if encoding == 'json':
+            return json.loads(cell_value)
+        return cell_value
+
+
+    def _getFieldNames(instance):
+        """
+        Returns:
+            list: The names of all fields in the bibliography, in the order they first appear in the entries.
+        """
+        field_names = {}  # used as an ordered set
+        for each_entry_data in instance.entries.values():
+            for each_field_name in each_entry_data:
+                field_names[each_field_name] = None
+        return list(field_names)
+
+
+    ###################################################################################################################
+    ############################################### SNAPSHOT FUNCTIONS ################################################
+    ###################################################################################################################
+
+    # marks the beginning of snapshot files written by .save()
+    _SNAPSHOT_FILE_SIGNATURE = b'KFIR Bibliography snapshot v1\n'
+
+    # attributes of the Bibliography object that are stored in snapshots
+    _SNAPSHOT_ATTRIBUTES = ['entries', '_field_type_registry', '_field_values_registry']
+
+    def save(instance, snapshot_path):
+        """
+        Saves the Bibliography object to a binary snapshot file, from which it can later be loaded (with .load())
+        without parsing its source files again. The snapshot holds the entries and the registries of the object, as
+        well as the size, modification time and hash of each file that was imported into the object (and the import
+        method and conversion parameters it was imported with); these are used to determine whether the snapshot is
+        still up to date with its source files.
+
+        Args:
+            snapshot_path(str): Path of the snapshot file to be written
+
+        Returns:
+            Nothing; writes a snapshot file.
+
+        Examples:
+            >>> my_bibliography = Bibliography()
+            >>> my_bibliography.importBibtex('example_data//test.bib')  #doctest: +ELLIPSIS
+            Parsing of example_data//test.bib started
+            ...
+            >>> my_bibliography.save('example_data//test_snapshot.pickle')
+
+            >>> # load the snapshot into another Bibliography object
+            >>> my_loaded_bibliography = Bibliography()
+            >>> my_loaded_bibliography.load('example_data//test_snapshot.pickle')
+            >>> my_loaded_bibliography.entries == my_bibliography.entries
+            True
+            >>> my_loaded_bibliography._field_values_registry == my_bibliography._field_values_registry
+            True
+            >>> my_loaded_bibliography.getEntriesByField('b_publication_year', '2016')[0]['b_document_label']
+            'Article with non-uri safe characters:<>{}()[] @% to WW ∗→eνμν with the ATLAS detector at √s=8 TeV'
+
+            >>> import os
+            >>> os.remove('example_data//test_snapshot.pickle')
+        """
+        import pickle
+
+        snapshot_metadata = {'source_file_fingerprints': instance._source_file_fingerprints,
+                             'source_file_import_parameters': instance._source_file_import_parameters}
+        snapshot_data = {each_attribute: getattr(instance, each_attribute)
+                         for each_attribute in Bibliography._SNAPSHOT_ATTRIBUTES}
+
+        with open(snapshot_path, 'wb') as snapshot_file:
+            snapshot_file.write(Bibliography._SNAPSHOT_FILE_SIGNATURE)
+            # metadata is written separately (before the data), so that it can be checked without loading the data
+            pickle.dump(snapshot_metadata, snapshot_file, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(snapshot_data, snapshot_file, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+    def load(instance, snapshot_path):
+        """
+        Loads a Bibliography object from a snapshot file written by .save(). The current contents of the object are
+        replaced with the contents of the snapshot.
+
+        Args:
+            snapshot_path(str): Path of the snapshot file to be loaded
+
+        Raises:
+            ValueError: If the file is not a Bibliography snapshot, or if any of the source files of the snapshot has
+                changed (or has been removed) since the snapshot was saved.
+
+        Returns:
+            Nothing; modifies the object it is called from.
+
+        Examples:
+            >>> # a snapshot becomes outdated when its source file changes
+            >>> import shutil
+            >>> shutil.copyfile('example_data//test.bib', 'example_data//test_copy.bib')  #doctest: +ELLIPSIS
+            '...test_copy.bib'
+            >>> my_bibliography = Bibliography()
+            >>> my_bibliography.importBibtex('example_data//test_copy.bib')  #doctest: +ELLIPSIS
+            Parsing of example_data//test_copy.bib started
+            ...
+            >>> my_bibliography.save('example_data//test_copy_snapshot.pickle')
+            >>> my_bibliography.is_snapshot_up_to_date('example_data//test_copy_snapshot.pickle')
+            True
+
+            >>> with open('example_data//test_copy.bib', 'a') as bib_file:
+            ...     _ = bib_file.write(' ')
+            >>> my_bibliography.is_snapshot_up_to_date('example_data//test_copy_snapshot.pickle')
+            False
+            >>> try:
+            ...     Bibliography().load('example_data//test_copy_snapshot.pickle')
+            ... except ValueError as error_message:
+            ...     print('ValueError: ' + str(error_message))
+            ValueError: Snapshot "example_data//test_copy_snapshot.pickle" is outdated: its source file "example_data//test_copy.bib" has changed since the snapshot was saved.
+
+            >>> import os
+            >>> os.remove('example_data//test_copy.bib')
+            >>> os.remove('example_data//test_copy_snapshot.pickle')
+        """
+        import pickle
+
+        with open(snapshot_path, 'rb') as snapshot_file:
+            snapshot_metadata = Bibliography._readSnapshotMetadata(snapshot_file, snapshot_path)
+
+            for each_source_file_path, each_fingerprint in snapshot_metadata['source_file_fingerprints'].items():
+                if fileHasChanged(each_source_file_path, each_fingerprint):
+                    raise ValueError('Snapshot "%s" is outdated: its source file "%s" has changed since the snapshot '
+                                     'was saved.' % (snapshot_path, each_source_file_path))
+
+            snapshot_data = pickle.load(snapshot_file)
+
+        for each_attribute, each_value in snapshot_data.items():
+            setattr(instance, each_attribute, each_value)
+        instance._id_registry = dict.fromkeys(instance.entries)
+        instance._normalized_field_values_registry = {}
+        instance._search_indexes = {}
+
+        Bibliography._removeFromGlobalIndex(instance._registry_number)
+        for each_field_name in Bibliography._class_field_values_registry:
+            instance._addFieldToGlobalIndex(each_field_name)
+        instance._source_file_fingerprints = snapshot_metadata['source_file_fingerprints']
+        instance._source_file_import_parameters = snapshot_metadata.get('source_file_import_parameters', {})
+
+
+    def is_snapshot_up_to_date(instance, snapshot_path):
+        """
+        Checks whether a snapshot file exists, and whether none of its source files has changed since it was saved.
+        A source file is considered changed if its size is different, or if its modification time and its hash are
+        both different from the time the snapshot was saved (i.e., a file that is only 'touched' does not outdate
+        a snapshot).
+
+        Args:
+            snapshot_path(str): Path of the snapshot file
+
+        Returns:
+            bool
+
+        Examples:
+            >>> Bibliography().is_snapshot_up_to_date('example_data//nonexistent_snapshot.pickle')
+            False
+        """
+        import os
+
+        if not os.path.isfile(snapshot_path):
+            return False
+
+        try:
+            with open(snapshot_path, 'rb') as snapshot_file:
+                snapshot_metadata = Bibliography._readSnapshotMetadata(snapshot_file, snapshot_path)
+        except ValueError:
+            return False
+
+        for each_source_file_path, each_fingerprint in snapshot_metadata['source_file_fingerprints'].items():
+            if fileHasChanged(each_source_file_path, each_fingerprint):
+                return False
+        return True
+
+
+    @staticmethod
+    def _readSnapshotMetadata(snapshot_file, snapshot_path):
+        """
+        Reads the signature and the metadata from the beginning of an open snapshot file.
+        """
+        import pickle
+
+        if snapshot_file.read(len(Bibliography._SNAPSHOT_FILE_SIGNATURE)) != Bibliography._SNAPSHOT_FILE_SIGNATURE:
+            raise ValueError('"%s" is not a Bibliography snapshot file (or was saved with an incompatible version).'
+                             % snapshot_path)
+        return pickle.load(snapshot_file)
+
+
+    def _recordSourceFile(instance, path_of_file_to_import, import_parameters):
+        """
+        Used by import methods. Records the fingerprint of an imported file, and the import method and conversion
+        parameters it is imported with (see .save()).
+        """
+        instance._source_file_fingerprints[path_of_file_to_import] = getFileFingerprint(path_of_file_to_import)
+        instance._source_file_import_parameters[path_of_file_to_import] = import_parameters
+
+
+    def _loadSnapshotIfUpToDate(instance, snapshot_path, path_of_file_to_import, import_parameters):
+        """
+        Used by import methods. Loads the snapshot if it is provided and up to date, if it was made by importing only
+        the requested file, with the same import method and conversion parameters (so that a snapshot of another file
+        or of another kind of import is never returned), and if the Bibliography object is empty (so that no
+        previously imported entries would be replaced).
+
+        Returns:
+            True if the snapshot is loaded, otherwise False.
+
+        Examples:
+            >>> my_bibliography = Bibliography()
+            >>> my_bibliography.importBibtex('example_data//test.bib',
+            ...                              snapshot_path='example_data//test_snapshot_key.pickle')  #doctest: +ELLIPSIS
+            Parsing of example_data//test.bib started
+            ...
+
+            >>> # the snapshot of test.bib is not used for another file (which is parsed, and saved to the snapshot)...
+            >>> my_other_bibliography = Bibliography()
+            >>> my_other_bibliography.importBibtex('example_data//merge_test_file_rich.bib',
+            ...                                    snapshot_path='example_data//test_snapshot_key.pickle')  #doctest: +ELLIPSIS
+            Parsing of example_data//merge_test_file_rich.bib started
+            ...
+            >>> my_other_bibliography.entries == my_bibliography.entries
+            False
+
+            >>> # ...or for the same file with another conversion arguments list
+            >>> Bibliography()._loadSnapshotIfUpToDate('example_data//test_snapshot_key.pickle',
+            ...                                        'example_data//merge_test_file_rich.bib',
+            ...                                        {'import_method': 'importBibtex',
+            ...                                         'conversion_arguments_list': [['each_pybtex_entry.fields["title"]',
+            ...                                                                        'pybtex_document_label',
+            ...                                                                        'b_document_label']]})
+            False
+
+            >>> # but it is used for the same file and parameters
+            >>> my_loaded_bibliography = Bibliography()
+            >>> my_loaded_bibliography.importBibtex('example_data//merge_test_file_rich.bib',
+            ...                                     snapshot_path='example_data//test_snapshot_key.pickle')  #doctest: +ELLIPSIS
+            example_data//merge_test_file_rich.bib loaded from the up-to-date snapshot "example_data//test_snapshot_key.pickle" (... entries)
+            >>> my_loaded_bibliography.entries == my_other_bibliography.entries
+            True
+
+            >>> import os
+            >>> os.remove('example_data//test_snapshot_key.pickle')
+        """
+        from meta.consoleOutput import ConsoleOutput
+
+        if snapshot_path is None or instance.entries or not instance.is_snapshot_up_to_date(snapshot_path):
+            return False
+
+        with open(snapshot_path, 'rb') as snapshot_file:
+            snapshot_metadata = Bibliography._readSnapshotMetadata(snapshot_file, snapshot_path)
+        if snapshot_metadata.get('source_file_import_parameters') != {path_of_file_to_import: import_parameters}:
+            return False
+
+        console = ConsoleOutput(log_file_path='log.txt')
+        instance.load(snapshot_path)
+        console.log_message('%s loaded from the up-to-date snapshot "%s" (%d entries)'
+                            % (path_of_file_to_import, snapshot_path, len(instance.entries)),
+                            add_timestamp_in_file=True)
+        return True
+
+
+###################################################################################################################
+############################################ FILE FINGERPRINT FUNCTIONS ###########################################
+###################################################################################################################
+
+def getFileFingerprint(file_path):
+    """
+    Returns the size, modification time and (SHA-1) hash of a file. Used to determine whether a file has changed since
+    a Bibliography snapshot of it was saved.
+
+    Args:
+        file_path(str)
 
     Returns:
-        The converted string
+        dict
 
     Examples:
-        >>> from triplicator.bibTools import standardizeCapitalization
-        >>> standardizeCapitalization("Phantom Of The Opera", "en_title")
+        >>> my_fingerprint = getFileFingerprint('example_data//test.bib')
+        >>> sorted(my_fingerprint.keys())
+        ['hash', 'modification_time', 'size']
+        >>> fileHasChanged('example_data//test.bib', my_fingerprint)
+        False
+    """
+    import os
+    import hashlib
+
+    file_hash = hashlib.sha1()
+    with open(file_path, 'rb') as file:
+        for each_block in iter(lambda: file.read(1024 * 1024), b''):
+            file_hash.update(each_block)
+
+    file_status = os.stat(file_path)
+    return {'size': file_status.st_size,
+            'modification_time': file_status.st_mtime,
+            'hash': file_hash.hexdigest()}
+
+
+def fileHasChanged(file_path, fingerprint):
+    """
+    Checks a file against a fingerprint returned by getFileFingerprint(). The hash of the file is only calculated if
+    its size is the same but its modification time is different.
+
+    Args:
+        file_path(str)
+        fingerprint(dict)
+
+    Returns:
+        bool: True if the file has been changed or removed.
+
+    Examples:
+        >>> fileHasChanged('example_data//nonexistent_file.bib', {'size': 0, 'modification_time': 0, 'hash': ''})
+        True
+    """
+    import os
+
+    try:
+        file_status = os.stat(file_path)
+    except FileNotFoundError:
+        return True
+
+    if file_status.st_size != fingerprint['size']:
+        return True
+    if file_status.st_mtime == fingerprint['modification_time']:
+        return False
+    return getFileFingerprint(file_path)['hash'] != fingerprint['hash']
+
+
+###################################################################################################################
+############################################### CLEANING FUNCTIONS ################################################
+###################################################################################################################
+
+def _cleanBibtexChunk(raw_lines, convert_to_ascii, patterns_to_replace, validation_batch_size):
+    """
+    Cleans a chunk of consecutive lines of a .bib file, and checks and cleans the entries that start and end within the
+    chunk. Runs in worker processes started by Bibtex_File.clean_bibtex_file_and_write_output_to_another_file(
+    workers=N), or in the main process if workers=1.
+
+    Args:
+        raw_lines(list): Lines of the .bib file (with newline characters)
+        convert_to_ascii(bool), patterns_to_replace(dict), validation_batch_size(int): See
+            Bibtex_File.clean_bibtex_file_and_write_output_to_another_file()
+
+    Returns:
+        A tuple of: the cleaned lines before the first start of entry in the chunk (which belong to the entry in the
+        previous chunk); the cleaned lines of the entries that are balanced and parsable; the number of unbalanced
+        entries; the number of nonparsable entries; the cleaned lines of the last entry in the chunk (which may continue
+        in the next chunk), or None if no entry starts in the chunk.
+
+    Examples:
+        >>> _cleanBibtexChunk(['% comment\\n', 'year = "2015",\\n', '}\\n',
+        ...                    '@article{01,\\n', 'title = "A title",\\n', '}\\n',
+        ...                    '@article{02,\\n', 'title = "A {title",\\n', '}\\n',
+        ...                    '@article{03,\\n'],
+        ...                   convert_to_ascii=True, patterns_to_replace={'': ''}, validation_batch_size=10)
+        (['year = "2015",', '}'], ['@article{01,', 'title = "A title",', '}'], 1, 0, ['@article{03,'])
+    """
+    from preprocessor.string_tools import String, Pattern_Replacer
+
+    # the patterns are compiled once for the whole chunk
+    pattern_replacer = Pattern_Replacer(patterns_to_replace)
+
+    entries = [[]]
+    for each_line in raw_lines:
+        current_line = String(each_line).\
+            clean_from_newline_characters().\
+            replace_patterns(pattern_replacer)
+
+        if convert_to_ascii:
+            current_line.clean_from_non_ascii_characters()
+
+        # new entry line
+        if current_line.is_line_type('bibtex', 'start of entry'):
+            entries.append([current_line.content])
+
+        # regular line (comments are left out)
+        elif not current_line.is_line_type('bibtex', 'comment'):
+            entries[-1].append(current_line.content)
+
+    leading_lines = entries[0]
+    if len(entries) == 1:
+        return leading_lines, [], 0, 0, None
+
+    cleaned_lines, no_of_unbalanced_entries, no_of_nonparsable_entries = \
+        _validateBibtexEntries(entries[1:-1], validation_batch_size)
+    return leading_lines, cleaned_lines, no_of_unbalanced_entries, no_of_nonparsable_entries, entries[-1]
+
+
+def _validateBibtexEntries(entries, validation_batch_size):
+    """
+    Checks whether each entry (a list of cleaned lines) is balanced and can be parsed.
+
+    Returns:
+        A tuple of the lines of the balanced and parsable entries (in original order), the number of unbalanced entries
+        and the number of nonparsable entries.
+    """
+    from preprocessor.ListData import ListBuffer
+
+    balanced_entries = []
+    no_of_unbalanced_entries = 0
+    for each_entry in entries:
+        buffer = ListBuffer()
+        buffer.dataset = each_entry
+        if buffer.is_each_row_balanced(exclude_special_rows_of_syntax='bibtex'):
+            balanced_entries.append(each_entry)
+        else:
+            # currently, when an unbalanced row is detected, the entry it belongs to is simply not written to the
+            # output file. If a more precise procedure (e.g., an unbalanced character removal algorithm) is to be added,
+            # it should be added here.
+            no_of_unbalanced_entries += 1
+
+    cleaned_lines = []
+    no_of_nonparsable_entries = 0
+    for i in range(0, len(balanced_entries), validation_batch_size):
+        batch = balanced_entries[i:i + validation_batch_size]
+        for each_entry, each_entry_is_parsable in zip(batch, ListBuffer.are_parsable(batch, 'bibtex')):
+            if each_entry_is_parsable:
+                cleaned_lines.extend(each_entry)
+            else:
+                no_of_nonparsable_entries += 1
+
+    return cleaned_lines, no_of_unbalanced_entries, no_of_nonparsable_entries
+
+
+###################################################################################################################
+############################################## CONVERSION FUNCTIONS ###############################################
+###################################################################################################################
+
+def _importBibtexShard(shard_string, conversion_arguments_list):
+    """
+    Parses and formats a shard of a .bib file (see pybtexImporter.split_bibtex_file_into_shards()) in a separate
+    Bibliography object. Runs in worker processes started by Bibliography.importBibtex(workers=N).
+
+    Args:
+        shard_string(str): Text of consecutive entries from a .bib file
+        conversion_arguments_list(list): See Bibliography.importBibtex()
+
+    Returns:
+        A tuple of the entries and the field type registry of the formatted shard, to be merged using
+        Bibliography._mergeShard().
+    """
+    from pybtex.database.input import bibtex
+
+    pybtex_data = bibtex.Parser().parse_string(shard_string)
+
+    shard_bibliography = Bibliography()
+    shard_bibliography._importPybtexEntries(pybtex_data.entries.items(), conversion_arguments_list)
+
+    return shard_bibliography.entries, shard_bibliography._field_type_registry
+
+
+def compileConversionArgumentsList(conversion_arguments_list, entry_id_variable_name, entry_variable_name):
+    """
+    Compiles a conversion arguments list (as used by Bibliography.importBibtex() and Bibliography.importCsv()) into
+    a field extraction plan, so that the target field expressions (e.g., 'each_pybtex_entry.fields["title"]') do not
+    have to be evaluated with eval() for each entry.
+
+    Expressions in the form of 'entry_id', 'entry.attribute(.attribute...)', 'entry["key"]' or
+    'entry.attribute["key"]' are converted to plain accessor functions. Any other (custom) expression is compiled
+    once, and then evaluated with the entry id and the entry as its only variables.
+
+    Args:
+        conversion_arguments_list(list): A list of lists in the format of [target_field_value in existing data,
+            formatting_algorithm, desired_field_name in new object]
+        entry_id_variable_name(str): The name used for the entry id in the target field expressions
+            (e.g., 'each_pybtex_entry_id')
+        entry_variable_name(str): The name used for the entry in the target field expressions
+            (e.g., 'each_pybtex_entry')
+
+    Returns:
+        A list of (accessor, formatting_algorithm, desired_field_name) tuples. Each accessor takes an entry id and
+        an entry as arguments and returns the target field value (or raises KeyError if the field does not exist).
+
+    Examples:
+        >>> plan = compileConversionArgumentsList([['each_entry_data["title"]', 'none', 'b_document'],
+        ...                                        ['each_entry_id', 'none', 'b_id']],
+        ...                                       entry_id_variable_name='each_entry_id',
+        ...                                       entry_variable_name='each_entry_data')
+        >>> [(each_accessor('01', {'title': 'A title'}), each_algorithm, each_field_name)
+        ...  for each_accessor, each_algorithm, each_field_name in plan]
+        [('A title', 'none', 'b_document'), ('01', 'none', 'b_id')]
+
+        >>> # missing fields raise KeyError, as they would with eval()
+        >>> plan[0][0]('02', {'author': 'John Doe'})
+        Traceback (most recent call last):
+        ...
+        KeyError: 'title'
+
+        >>> # attribute access
+        >>> from collections import namedtuple
+        >>> Entry = namedtuple('Entry', ['type', 'fields'])
+        >>> plan = compileConversionArgumentsList([['each_pybtex_entry.type', 'none', 'b_type'],
+        ...                                        ['each_pybtex_entry.fields["year"]', 'none', 'b_year']],
+        ...                                       entry_id_variable_name='each_pybtex_entry_id',
+        ...                                       entry_variable_name='each_pybtex_entry')
+        >>> [each_accessor('01', Entry('article', {'year': '2017'})) for each_accessor, _, _ in plan]
+        ['article', '2017']
+
+        >>> # other expressions are compiled once and evaluated per entry
+        >>> plan = compileConversionArgumentsList([['each_entry_data["title"].upper()', 'none', 'b_document']],
+        ...                                       entry_id_variable_name='each_entry_id',
+        ...                                       entry_variable_name='each_entry_data')
+        >>> plan[0][0]('01', {'title': 'A title'})
+        'A TITLE'
+    """
+    import re
+    from operator import attrgetter, itemgetter
+
+    simple_expression_pattern = re.compile(r'^\s*(\w+)((?:\.\w+)*)\s*(?:\[\s*(["\'])(.*?)\3\s*\])?\s*$')
+
+    extraction_plan = []
+    for each_argument_list in conversion_arguments_list:
+        target_field_expression, formatting_algorithm, desired_field_name = each_argument_list
+
+        match = simple_expression_pattern.match(target_field_expression)
+        variable_name, attribute_chain, _, key = match.groups() if match else (None, '', None, None)
+
+        # e.g., 'each_pybtex_entry_id'
+        if variable_name == entry_id_variable_name and not attribute_chain and key is None:
+            accessor = lambda entry_id, entry: entry_id
+
+        # e.g., 'each_pybtex_entry.type', 'each_pybtex_entry.fields["title"]' or 'each_entry_data["title"]'
+        elif variable_name == entry_variable_name:
+            get_attribute = attrgetter(attribute_chain[1:]) if attribute_chain else None
+            get_item = itemgetter(key) if key is not None else None
+
+            def accessor(entry_id, entry, get_attribute=get_attribute, get_item=get_item):
+                if get_attribute is not None:
+                    entry = get_attribute(entry)
+                if get_item is not None:
+                    entry = get_item(entry)
+                return entry
+
+        # any other expression: compile once, evaluate per entry
+        else:
+            compiled_expression = compile(target_field_expression, target_field_expression, 'eval')
+
+            def accessor(entry_id, entry, compiled_expression=compiled_expression):
+                return eval(compiled_expression, globals(), {entry_id_variable_name: entry_id,
+                                                             entry_variable_name: entry})
+
+        extraction_plan.append((accessor, formatting_algorithm, desired_field_name))
+
+    return extraction_plan
+
+
+###################################################################################################################
+############################################## FORMATTING FUNCTIONS ###############################################
+###################################################################################################################
+
+# shared by all calls to cleanAndFormatValues(); its statistics can be inspected with
+# ...formatting_cache.get_statistics(), and its size can be changed (or caching disabled with 0) via
+# ...formatting_cache.maximum_size
+formatting_cache = Formatting_Cache(maximum_size=100000)
+
+
+class Value_Pool():
+    """
+    A dictionary of distinct field values (an intern pool). Journal names, publishers, types and author names occur
+    thousands of times in large bibliographies; interning makes all occurrences of a value share one object.
+
+    Examples:
+        >>> my_pool = Value_Pool()
+        >>> first_value = my_pool.intern('Elsevier BV')
+        >>> second_value = my_pool.intern(''.join(['Elsevier', ' BV']))
+        >>> first_value is second_value
+        True
+
+        >>> # list items are interned (in a new list), other values are returned as they are
+        >>> my_pool.intern(['Elsevier BV', 'Springer'])[0] is first_value
+        True
+        >>> my_pool.intern(None) is None
+        True
+        >>> len(my_pool)
+        2
+    """
+
+    def __init__(self):
+        self._values = {}   # each distinct value, by itself
+
+
+    def __len__(self):
+        return len(self._values)
+
+
+    def intern(self, value):
+        """
+        Returns the pooled object that is equal to the value (adding the value to the pool if it is new). Strings and
+        the strings in lists are interned; other values are returned without change.
+        """
+        if type(value) == str:
+            return self._values.setdefault(value, value)
+        elif isinstance(value, list):
+            return [self.intern(each_item) for each_item in value]
+        else:
+            return value
+
+
+    def clear(self):
+        """
+        Empties the pool. Values that are already in bibliographies are not affected.
+        """
+        self._values.clear()
+
+
+class Text_Search_Index():
+    """
+    An index of distinct (string) field values for prefix and substring search, used by
+    Bibliography.getEntriesByFieldPrefix() and Bibliography.searchEntries(). Values can be added one by one, so the
+    index can be kept up to date as entries are added to a bibliography.
+
+    Prefix queries are answered with a binary search in the (lowercased) values, kept in sorted order. Substring
+    queries are answered by intersecting the sets of values that contain each trigram (i.e., sequence of three
+    characters) of the query, and then checking only these candidates. Queries shorter than a trigram are checked
+    against all distinct values.
+
+    Examples:
+        >>> my_index = Text_Search_Index()
+        >>> my_index.add(['Lokman, JC', 'Schlobach, S'])
+        >>> my_index.add('Lohr, A')
+        >>> my_index.find_prefix('lo')
+        ['Lohr, A', 'Lokman, JC']
+        >>> my_index.find_substring('bach')
+        ['Schlobach, S']
+        >>> my_index.find_substring('LO', case_sensitive=True)
+        []
+
+        >>> # an index built from initial values (sorted once) is the same as one built by adding them one by one
+        >>> my_built_index = Text_Search_Index([['Lokman, JC', 'Schlobach, S'], 'Lohr, A'])
+        >>> my_built_index._sorted_keys == my_index._sorted_keys
+        True
+        >>> my_built_index.add('Lo, B')
+        >>> my_built_index.find_prefix('lo')
+        ['Lo, B', 'Lohr, A', 'Lokman, JC']
+    """
+
+    NGRAM_LENGTH = 3
+
+    def __init__(self, field_values=()):
+        """
+        Args:
+            field_values(iterable): Initial values of the index (each a value or a list of values). Their keys are
+                sorted once, after all of them are added.
+        """
+        self._values = []           # distinct values, by code
+        self._codes = {}            # codes of distinct values
+        self._sorted_keys = []      # (lowercased value, code) pairs, in sorted order
+        self._ngram_codes = {}      # codes of the values that contain each (lowercased) n-gram
+
+        for each_field_value in field_values:
+            self._add_value(each_field_value, keep_sorted=False)
+        self._sorted_keys.sort()
+
+
+    def add(self, field_value):
+        """
+        Adds a value (or each value in a list of values) to the index. Values that are not strings are ignored.
+        """
+        self._add_value(field_value, keep_sorted=True)
+
+
+    def _add_value(self, field_value, keep_sorted):
+        """
+        Args:
+            keep_sorted(bool): If True, the key of the value is inserted in its sorted position. Otherwise, it is
+                appended, and ._sorted_keys must be sorted afterwards.
+        """
+        import bisect
+
+        if isinstance(field_value, list):
+            for each_field_value in field_value:
+                self._add_value(each_field_value, keep_sorted)
+            return
+        if type(field_value) != str or field_value in self._codes:
+            return
+
+        code = len(self._values)
+        self._values.append(field_value)
+        self._codes[field_value] = code
+
+        key = field_value.lower()
+        if keep_sorted:
+            bisect.insort(self._sorted_keys, (key, code))
+        else:
+            self._sorted_keys.append((key, code))
+        for each_ngram in self._get_ngrams(key):
+            self._ngram_codes.setdefault(each_ngram, set()).add(code)
+
+
+    def find_prefix(self, prefix, case_sensitive=False):
+        """
+        Returns the values that start with the prefix, in alphabetical (case-insensitive) order.
+        """
+        import bisect
+
+        key_prefix = prefix.lower()
+        matching_values = []
+        position = bisect.bisect_left(self._sorted_keys, (key_prefix,))
+        while position < len(self._sorted_keys) and self._sorted_keys[position][0].startswith(key_prefix):
+            each_value = self._values[self._sorted_keys[position][1]]
+            if not case_sensitive or each_value.startswith(prefix):
+                matching_values.append(each_value)
+            position += 1
+        return matching_values
+
+
+    def find_substring(self, substring, case_sensitive=False):
+        """
+        Returns the values that contain the substring, in the order they were added to the index.
+        """
+        key_substring = substring.lower()
+        query_ngrams = self._get_ngrams(key_substring)
+
+        if query_ngrams:
+            candidate_code_sets = []
+            for each_ngram in query_ngrams:
+                if each_ngram not in self._ngram_codes:
+                    return []
+                candidate_code_sets.append(self._ngram_codes[each_ngram])
+            candidate_code_sets.sort(key=len)
+            candidate_codes = sorted(set.intersection(*candidate_code_sets))
+        else:
+            candidate_codes = range(len(self._values))
+
+        matching_values = []
+        for each_code in candidate_codes:
+            each_value = self._values[each_code]
+            if (each_value if case_sensitive else each_value.lower()).find(
+                    substring if case_sensitive else key_substring) != -1:
+                matching_values.append(each_value)
+        return matching_values
+
+
+    def _get_ngrams(self, key):
+        return {key[i:i + self.NGRAM_LENGTH] for i in range(len(key) - self.NGRAM_LENGTH + 1)}
+
+
+class Formatting_Engine():
+    """
+    Holds the patterns used by cleanAndFormatValues() and standardizeCapitalization() in compiled form, so that they
+    are not compiled again (with one re.sub() call per pattern) for every value:
+
+        - capitalization: all title case words (e.g., ' The ') are lowercased with one compiled pattern
+        - replacement: PATTERNS_TO_REPLACE are compiled once into a Pattern_Replacer (which applies them one by one,
+          in order, as replacing a pattern can form another one, e.g., ': ' in ' :  - ')
+        - omission: all CHARACTERS_TO_OMIT are removed with one str.translate() call
+
+    The outputs are the same as those of applying the patterns one by one, in the order they are listed.
+
+    Examples:
+        >>> my_engine = Formatting_Engine()
+        >>> my_engine.standardize_capitalization('Phantom Of The Opera')
         'Phantom of the Opera'
+        >>> my_engine.replace_patterns('Title: Subtitle - {"}Quote{"}')
+        "Title-Subtitle-'Quote'"
+        >>> my_engine.omit_characters('Title (with; "punctuation").')
+        'Title with punctuation'
+
+        >>> # document instance names and labels
+        >>> my_engine.format_document_instance_name('Phantom Of The Opera: A Study')
+        'Phantom_of_the_Opera-a_Study'
+        >>> my_engine.format_document_label('Phantom Of The Opera: A Study')
+        'Phantom of the Opera-a Study'
+        >>> my_engine.format_document_label('Title :  Subtitle')
+        'Title-Subtitle'
+        >>> my_engine.format_document_instance_name('A :  - B')
+        'A--_B'
+
+        >>> # batch formatting (each distinct title is formatted only once)
+        >>> my_engine.format_document_names(['Book Of Songs', 'In The Mood', 'Book Of Songs'])
+        ['Book_of_Songs', 'In_the_Mood', 'Book_of_Songs']
+        >>> my_engine.format_document_names(['Book Of Songs', 'In The Mood'], algorithm='pybtex_document_label')
+        ['Book of Songs', 'In the Mood']
+    """
+    # title case words that are lowercased in English titles (DBpedia format). This list is not exhaustive.
+    EN_TITLE_LOWERCASE_WORDS = ['In', 'The', 'A', 'An', 'As', 'On', 'At', 'For', 'With', 'From', 'By', 'Of', 'Vs',
+                                'And', 'Be', 'Been', 'Not', 'Is', "Isn't", 'Are', "Aren't", 'Does', "Doesn't", 'Do',
+                                "Don't", 'Was', "Wasn't", 'Were', "Weren't", 'Did', "Didn't"]
+
+    # special characters to omit from strings
+    # NOTE: currently, same characters are omitted for both labels and author names.
+    # ...for richer labels, this can be changed in a future revision.
+    CHARACTERS_TO_OMIT = '.,;\'")(}{'
+
+    # special character patterns to replace in strings (applied in this order)
+    # in this dictionary, keys are target patterns and values are replacements
+    # note the spaces in the patterns (i.e., in keys of the dictionary)
+    PATTERNS_TO_REPLACE = {
+        ': ': '-',
+        ' - ': '-',
+        # This pattern replacement is important for .bib files, as the pattern {"} is used to denote double quotation
+        # marks in .bib files. It should be used (at least) for replacing this pattern in titles and abstract strings.
+        # (otherwise, it leads to errors in .ttl files)
+        '{"}': "'"
+    }
+
+    def __init__(self):
+        import re
+        from preprocessor.string_tools import Pattern_Replacer
+
+        # a title case word is only lowercased if it is surrounded by spaces (e.g., ' The ')
+        self._lowercase_words = {each_word: each_word.lower() for each_word in self.EN_TITLE_LOWERCASE_WORDS}
+        self._en_title_pattern = re.compile(
+            '(?<= )(?:%s)(?= )' % '|'.join(re.escape(each_word) for each_word in
+                                           sorted(self.EN_TITLE_LOWERCASE_WORDS, key=len, reverse=True)))
+
+        self._pattern_replacer = Pattern_Replacer(self.PATTERNS_TO_REPLACE)
+        self._omission_table = str.maketrans('', '', self.CHARACTERS_TO_OMIT)
+
+
+    def standardize_capitalization(self, input_string):
+        """
+        Lowercases title case words (e.g., ' The ' -> ' the ') in a single pass.
+
+        The result is the same as replacing each word separately with re.sub(' The ', ' the ', ...): in that case, a
+        space that is part of a replaced occurrence of a word cannot be a part of the next occurrence of the same word
+        (e.g., only the first 'The' in ' The The ' is lowercased). This is reproduced by keeping track of where the
+        last replaced occurrence of each word ends.
+
+        Examples:
+            >>> Formatting_Engine().standardize_capitalization('War And Peace In The Time Of The War')
+            'War and Peace in the Time of the War'
+            >>> Formatting_Engine().standardize_capitalization('The The The Band')
+            'The the The Band'
+        """
+        if ' ' not in input_string:
+            return input_string
+
+        end_positions_of_replaced_words = {}
+
+        def lowercase_word(match):
+            word = match.group(0)
+            # the space before the word was a part of the previous replaced occurrence of the same word
+            if match.start() - 1 < end_positions_of_replaced_words.get(word, 0):
+                return word
+            end_positions_of_replaced_words[word] = match.end() + 1
+            return self._lowercase_words[word]
+
+        return self._en_title_pattern.sub(lowercase_word, input_string)
+
+
+    def replace_patterns(self, input_string):
+        """
+        Replaces PATTERNS_TO_REPLACE in the order they are listed.
+
+        Examples:
+            >>> # replacing ': ' forms a ' - ', which is replaced as well
+            >>> Formatting_Engine().replace_patterns('Title :  Subtitle')
+            'Title-Subtitle'
+            >>> Formatting_Engine().replace_patterns('A :  - B')
+            'A-- B'
+        """
+        return self._pattern_replacer.replace(input_string)
+
+
+    def omit_characters(self, input_string):
+        """
+        Removes all CHARACTERS_TO_OMIT in a single pass.
+        """
+        return input_string.translate(self._omission_table)
+
+
+    def format_document_label(self, title):
+        """
+        Formats a title (or e.g., a journal or publisher name) as a label (see 'pybtex_document_label' algorithm of
+        cleanAndFormatValues()).
+        """
+        return self.replace_patterns(self.standardize_capitalization(title))
+
+
+    def format_document_instance_name(self, title):
+        """
+        Formats a title (or e.g., a journal or publisher name) as a uri-safe instance name (see
+        'pybtex_document_instance_name' algorithm of cleanAndFormatValues()).
+        """
+        from urllib.parse import quote
+
+        document_instance_name = self.format_document_label(title)
+        # omit undesired characters, and replace the patterns that may have been formed after omission
+        document_instance_name = self.replace_patterns(self.omit_characters(document_instance_name))
+        # replace spaces with underscores, and convert to uri-safe string
+        return quote(document_instance_name.replace(' ', '_'))
+
+
+    def format_document_names(self, titles, algorithm='pybtex_document_instance_name'):
+        """
+        Formats a list of titles (or e.g., journal or publisher names) at once. Each distinct title in the list is
+        formatted only once.
+
+        Args:
+            titles(list): A list of strings
+            algorithm(str): 'pybtex_document_instance_name' or 'pybtex_document_label'
+
+        Returns:
+            A list of formatted strings, in the same order as the titles.
+        """
+        if algorithm == 'pybtex_document_instance_name':
+            formatting_function = self.format_document_instance_name
+        elif algorithm == 'pybtex_document_label':
+            formatting_function = self.format_document_label
+        else:
+            raise ValueError('Unknown algorithm parameter: "%s". Please enter "pybtex_document_instance_name" or '
+                             '"pybtex_document_label".' % algorithm)
+
+        formatted_titles = {}
+        for each_title in titles:
+            if each_title not in formatted_titles:
+                formatted_titles[each_title] = formatting_function(each_title)
+
+        return [formatted_titles[each_title] for each_title in titles]
+
+
+# compiled once at module load, and shared by all calls to cleanAndFormatValues() and standardizeCapitalization()
+formatting_engine = Formatting_Engine()
+
+
+def replacePatternsAsPerDictionary(input_string, patterns_dictionary):
+    """
+    Replaces patterns in an inputted string according to the key:value combinations in a dictionary. Useful for replacing
+    long name segments such as "_-_" with "-" in instance names during their creation.
+
+    Args:
+        input_string (str): String to be processed
+        patterns_dictionary(dict): A dictionary that contains the key:value combinations to be used in replacement.
+             Keys in the patterns dictionary should be target patterns, while values of the dictionary should be
+             the desired replacement patterns or characters.
+
+    Returns:
+        A string
+
+    Examples:
+        >>> patterns_dictionary = {"_-_" : "-",
+        ...                        ": "  : "-" }
+        >>> target_string = "Case_1_-_12:_Unknown"
+        >>> formatted_string = replacePatternsAsPerDictionary(target_string, patterns_dictionary)
+        >>> print(formatted_string)
+        Case_1-12:_Unknown
     """
     import re
 
-    formatted_string = input_string
+    output_string = input_string
+
+    # replace undesired characters with the desired ones (e.g., ':' -> '-') using dictionary_of_patterns_to_replace
+    for each_target_pattern, each_replacement_pattern in patterns_dictionary.items():
+        output_string = re.sub(each_target_pattern, each_replacement_pattern, output_string)
 
+    return output_string
+
+
+def standardizeCapitalization(input_string, algorithm):
+    """
+    Converts title case words (e.g., ' The ') to lowercase e.g., ' the '). Allows conversion algorithms for multiple
+    scenarios (e.g., author names vs titles) and languages via keyword arguments of 'algorithm' parameter.
+
+    Args:
+        input_string (str): the string to be converted.
+        algorithm: capitalization algorithm to be used
+
+    Keyword Args:
+        "English title" (algorithm):
+
+    Returns:
+        The converted string
+
+    Examples:
+        >>> from triplicator.bibTools import standardizeCapitalization
+        >>> standardizeCapitalization("Phantom Of The Opera", "en_title")
+        'Phantom of the Opera'
+    """
     # convert title case to lowercase (DBpedia format)
-    if algorithm is "en_title":
-        formatted_string = re.sub(" In ", " in ", formatted_string)
-        formatted_string = re.sub(" The ", " the ", formatted_string)
-        formatted_string = re.sub(" A ", " a ", formatted_string)
-        formatted_string = re.sub(" An ", " an ", formatted_string)
-        formatted_string = re.sub(" As ", " as ", formatted_string)
-        formatted_string = re.sub(" On ", " on ", formatted_string)
-        formatted_string = re.sub(" At ", " at ", formatted_string)
-        formatted_string = re.sub(" For ", " for ", formatted_string)
-        formatted_string = re.sub(" With ", " with ", formatted_string)
-        formatted_string = re.sub(" From ", " from ", formatted_string)
-        formatted_string = re.sub(" By ", " by ", formatted_string)
-        formatted_string = re.sub(" Of ", " of ", formatted_string)
-        formatted_string = re.sub(" Vs ", " vs ", formatted_string)
-        formatted_string = re.sub(" And ", " and ", formatted_string)
-
-        formatted_string = re.sub(" Be ", " be ", formatted_string)
-        formatted_string = re.sub(" Been ", " been ", formatted_string)
-        formatted_string = re.sub(" Not ", " not ", formatted_string)
-        formatted_string = re.sub(" Is ", " is ", formatted_string)
-        formatted_string = re.sub(" Isn\'t ", " isn\'t ", formatted_string)
-        formatted_string = re.sub(" Are ", " are ", formatted_string)
-        formatted_string = re.sub(" Aren\'t ", " aren\'t ", formatted_string)
-        formatted_string = re.sub(" Does ", " does ", formatted_string)
-        formatted_string = re.sub(" Doesn\'t ", " doesn\'t ", formatted_string)
-        formatted_string = re.sub(" Do ", " do ", formatted_string)
-        formatted_string = re.sub(" Don\'t ", " don\'t ", formatted_string)
-        formatted_string = re.sub(" Was ", " was ", formatted_string)
-        formatted_string = re.sub(" Wasn\'t ", " wasn\'t ", formatted_string)
-        formatted_string = re.sub(" Were ", " were ", formatted_string)
-        formatted_string = re.sub(" Weren\'t ", " weren\'t ", formatted_string)
-        formatted_string = re.sub(" Did ", " did ", formatted_string)
-        formatted_string = re.sub(" Didn\'t ", " didn\'t ", formatted_string)
-        # This list is not exhaustive
+    # (the words that are lowercased are listed in Formatting_Engine.EN_TITLE_LOWERCASE_WORDS)
+    if algorithm == "en_title":
+        formatted_string = formatting_engine.standardize_capitalization(input_string)
 
     else:
         raise Exception ('Unknown algorithm parameter: "' + algorithm + '". Please enter a valid capitalization algorithm such as "en_title".')
@@ -2422,8 +4500,8 @@ def cleanAndFormatValues(target_field, algorithm):
     """
     Formats the values in a given list or string according to the style specified by 'algorithm' parameter (e.g.,
     'pybtex_author_instance_name'). All algorithms follow DBPedia naming conventions. For changing which characters
-    to omit, the internal variables 'pattern_of_characters_to_omit' and 'dictionary_of_patterns_to_replace' should be
-    modified.
+    to omit or which patterns to replace, Formatting_Engine.CHARACTERS_TO_OMIT and Formatting_Engine.PATTERNS_TO_REPLACE
+    should be modified.
 
     Args:
         target_field(str or list): string or list to be formatted.
@@ -2491,7 +4569,7 @@ def cleanAndFormatValues(target_field, algorithm):
     Examples:
         >>> # preparation
         >>> from triplicator.pybtexImporter import Pybtex_import
-        >>> from triplicator.bibTools import cleanAndFormatValues
+        >>> from triplicator.bibTools import cleanAndFormatValues, formatting_cache
 
         >>> # import a bib file with pybtex and and extract entries (i.e., {entry_id:entries} pairs)
         >>> pybtex_entries = Pybtex_import("example_data//test.bib").data.entries
@@ -2572,28 +4650,22 @@ def cleanAndFormatValues(target_field, algorithm):
         >>> # test diagnostic
         >>> if no_of_keywords_processed == 0:
         ...     raise Exception ("Test failed: No keywords processed inside the try-except block.")
+
+        >>> # CACHING
+        >>> # formatted values are cached (in formatting_cache), and are not formatted again when they reoccur
+        >>> formatting_cache.clear()
+        >>> cleanAndFormatValues(['Lokman - John Can', 'Schlobach - Stefan'], 'open_citations_author_instance_name')
+        ['Lokman_JC', 'Schlobach_S']
+        >>> cleanAndFormatValues(['Lokman - John Can'], 'open_citations_author_instance_name')
+        ['Lokman_JC']
+        >>> formatting_cache.hits, formatting_cache.misses
+        (1, 2)
     """
-    import re
     from urllib.parse import quote
 
-    # special characters to omit from strings
-    # NOTE: currently, same characters are omitted for both labels and author names.
-    # ...for richer labels, this can be changed in a future revision.
-    # this variable is used by several cleaning/formatting algorithms within the current function
-    pattern_of_characters_to_omit = "[.,;\'\")(}{]"
-
-    # special character patterns to replace in strings
-    # in this dictionary, keys are target patterns and values are replacements
-    # note the spaces in the patterns (i.e., in keys of the dictionary)
-    # this dictionary is used by several cleaning/formatting algorithms within the current function
-    dictionary_of_patterns_to_replace = {
-        ": ": "-",
-        " - ": "-",
-        # This pattern replacement is important for .bib files, as the pattern {"} is used to denote double quotation
-        # marks in .bib files. It should be used (at least) for replacing this pattern in titles and abstract strings.
-        # (otherwise, it leads to errors in .ttl files)
-        '\{"\}': "'"
-    }
+    # special characters to omit from strings and special character patterns to replace in strings are defined in
+    # ...(and compiled by) Formatting_Engine. the shared formatting_engine is used by several cleaning/formatting
+    # ...algorithms within the current function
 
     # error handling for keywords of the 'algorithm' parameter is handled this way, as an 'else'
     # statement at the end of elif block for keywords does not produce the same result ('else' too broad?)
@@ -2620,7 +4692,7 @@ def cleanAndFormatValues(target_field, algorithm):
     #              FORMAT: AUTHOR INSTANCE NAME AND LABEL               #
     #-------------------------------------------------------------------#
     # algorithm for pybtex author field
-    if algorithm is "pybtex_author_instance_name" or algorithm is "pybtex_author_label":
+    if algorithm == "pybtex_author_instance_name" or algorithm == "pybtex_author_label":
     # TODO: Initial letter of last names and first name abbreviations should always be capitalized, even if this is not the case in input
 
         # a more descriptive name for target_field
@@ -2634,11 +4706,27 @@ def cleanAndFormatValues(target_field, algorithm):
 
         # for each "author" field value (which can hold multiple authors as a list) in the pybtex bib data
         for each_author in inputted_author_field_value_list:
+            # authors that have been formatted before are retrieved from the cache, together with their formatted
+            # ...last and abbreviated first names (which carry over to the next author if its names are missing)
+            each_cache_key = (algorithm, tuple(each_author.last()), tuple(each_author.first()))
+            each_cached_author = formatting_cache.get(each_cache_key)
+            if each_cached_author is not None:
+                each_last_name_formatted, each_abbreviated_first_names_string, each_formatted_fullname = \
+                    each_cached_author
+                if algorithm in ("pybtex_author_instance_name", "open_citations_author_instance_name"):
+                    each_formatted_author_instance_list.append(each_formatted_fullname)
+                else:
+                    each_formatted_author_label_list.append(each_formatted_fullname)
+                continue
+
+            # only authors with both a last and a first name are cached, as the output for other authors depends on
+            # ...the previous author in the list
+            each_author_is_cacheable = False
+
             # extract and format each LAST NAME (if available)
             try:
                 each_last_name = str(each_author.last()[0])
-                each_last_name_formatted = re.sub(pattern_of_characters_to_omit, "", each_last_name)
-                each_last_name_formatted = re.sub(" ", "_", each_last_name_formatted)
+                each_last_name_formatted = formatting_engine.omit_characters(each_last_name).replace(" ", "_")
 
 
                 # extract and format each FIRST NAME (if available)
@@ -2646,7 +4734,7 @@ def cleanAndFormatValues(target_field, algorithm):
                     # extract first name of a single author
                     each_first_names_string = str(each_author.first()[0])
                     # omit unwanted characters
-                    each_first_names_string = re.sub(pattern_of_characters_to_omit, "", each_first_names_string)
+                    each_first_names_string = formatting_engine.omit_characters(each_first_names_string)
                     # placeholder for output
                     each_abbreviated_first_names_string = ""
 
@@ -2668,6 +4756,9 @@ def cleanAndFormatValues(target_field, algorithm):
                             # if there are no spaces of uppercase letters in the first name string, don't do anything additional
                             else:
                                 pass
+
+                    each_author_is_cacheable = True
+
                 # if a first name is not available, don't do anything
                 except:
                     pass
@@ -2677,27 +4768,31 @@ def cleanAndFormatValues(target_field, algorithm):
 
             # add extracted last and first names to the output variables (as author instance names or as labels, ...
             # ...depending on the 'algorithm' parameter)
-            if algorithm is "pybtex_author_instance_name":
+            if algorithm == "pybtex_author_instance_name":
                 each_formatted_fullname = each_last_name_formatted + "_" + each_abbreviated_first_names_string
                 each_formatted_fullname = quote(each_formatted_fullname)  # make safe to use as URI
                 each_formatted_author_instance_list.append(each_formatted_fullname)
 
-            elif algorithm is "pybtex_author_label":
+            elif algorithm == "pybtex_author_label":
                 each_formatted_fullname = each_last_name_formatted + ", " + each_abbreviated_first_names_string
 
                 each_formatted_author_label_list.append(each_formatted_fullname)
                 #each_formatted_author_label_list.append(each_last_name_formatted + ", " + each_first_name_formatted)
 
+            if each_author_is_cacheable:
+                formatting_cache.set(each_cache_key, (each_last_name_formatted, each_abbreviated_first_names_string,
+                                                      each_formatted_fullname))
+
         # return either author instance names or author labels depending on which 'algorithm' parameter is entered
-        if algorithm is "pybtex_author_instance_name":
+        if algorithm == "pybtex_author_instance_name":
             return each_formatted_author_instance_list
-        elif algorithm is "pybtex_author_label":
+        elif algorithm == "pybtex_author_label":
             return each_formatted_author_label_list
 
     #-----------------------------------------------------------------------------------------------#
     #              FORMAT: OPEN CITATIONS AUTHOR INSTANCE NAME AND LABEL PREPROCESSOR               #
     #-----------------------------------------------------------------------------------------------#
-    if algorithm is "open_citations_author_instance_name" or algorithm is "open_citations_author_label":
+    if algorithm == "open_citations_author_instance_name" or algorithm == "open_citations_author_label":
         from preprocessor.string_tools import Parameter_Value
         target_field = Parameter_Value(target_field).convert_to_single_item_list_if_not_list()
         authors_list = target_field
@@ -2708,18 +4803,34 @@ def cleanAndFormatValues(target_field, algorithm):
         each_abbreviated_first_names_string = ""
 
         for each_author_full_name in authors_list:
+            # authors that have been formatted before are retrieved from the cache, together with their formatted
+            # ...last and abbreviated first names (which carry over to the next author if its names are missing)
+            each_cache_key = (algorithm, each_author_full_name)
+            each_cached_author = formatting_cache.get(each_cache_key)
+            if each_cached_author is not None:
+                each_last_name_formatted, each_abbreviated_first_names_string, each_formatted_fullname = \
+                    each_cached_author
+                if algorithm in ("pybtex_author_instance_name", "open_citations_author_instance_name"):
+                    each_formatted_author_instance_list.append(each_formatted_fullname)
+                else:
+                    each_formatted_author_label_list.append(each_formatted_fullname)
+                continue
+
+            # only authors with both a last and a first name are cached, as the output for other authors depends on
+            # ...the previous author in the list
+            each_author_is_cacheable = False
+
             try:
                 each_author_split_names_list = each_author_full_name.split(' - ')
                 each_last_name = each_author_split_names_list[0]
                 each_first_names_string = each_author_split_names_list[1]
 
-                each_last_name_formatted = re.sub(pattern_of_characters_to_omit, "", each_last_name)
-                each_last_name_formatted = re.sub(" ", "_", each_last_name_formatted)
+                each_last_name_formatted = formatting_engine.omit_characters(each_last_name).replace(" ", "_")
 
                 # extract and format each FIRST NAME (if available)
                 try:
                     # omit unwanted characters
-                    each_first_names_string = re.sub(pattern_of_characters_to_omit, "", each_first_names_string)
+                    each_first_names_string = formatting_engine.omit_characters(each_first_names_string)
                     # placeholder for output
                     each_abbreviated_first_names_string = ""
 
@@ -2745,6 +4856,9 @@ def cleanAndFormatValues(target_field, algorithm):
                             # if there are no spaces of uppercase letters in the first name string, don't do anything additional
                             else:
                                 pass
+
+                    each_author_is_cacheable = True
+
                 # if a first name is not available, don't do anything
                 except:
                     pass
@@ -2753,20 +4867,24 @@ def cleanAndFormatValues(target_field, algorithm):
 
             # add extracted last and first names to the output variables (as author instance names or as labels, ...
             # ...depending on the 'algorithm' parameter)
-            if algorithm is "open_citations_author_instance_name":
+            if algorithm == "open_citations_author_instance_name":
                 each_formatted_fullname = each_last_name_formatted + "_" + each_abbreviated_first_names_string
                 each_formatted_fullname = quote(each_formatted_fullname)  # convert to uri-safe string
                 each_formatted_author_instance_list.append(each_formatted_fullname)
 
-            elif algorithm is "open_citations_author_label":
+            elif algorithm == "open_citations_author_label":
                 each_formatted_fullname = each_last_name_formatted + ", " + each_abbreviated_first_names_string
                 each_formatted_author_label_list.append(each_formatted_fullname)
                 # each_formatted_author_label_list.append(each_last_name_formatted + ", " + each_first_name_formatted)
 
+            if each_author_is_cacheable:
+                formatting_cache.set(each_cache_key, (each_last_name_formatted, each_abbreviated_first_names_string,
+                                                      each_formatted_fullname))
+
         # return either author instance names or author labels depending on which 'algorithm' parameter is entered
-        if algorithm is "open_citations_author_instance_name":
+        if algorithm == "open_citations_author_instance_name":
             return each_formatted_author_instance_list
-        elif algorithm is "open_citations_author_label":
+        elif algorithm == "open_citations_author_label":
             return each_formatted_author_label_list
 
 
@@ -2774,34 +4892,39 @@ def cleanAndFormatValues(target_field, algorithm):
     #              FORMAT: DOCUMENT INSTANCE NAME AND LABEL              #
     # -------------------------------------------------------------------#
     # if the task is title to document_instance_name conversion
-    elif algorithm is "pybtex_document_instance_name" or algorithm is "pybtex_document_label":
+    elif algorithm == "pybtex_document_instance_name" or algorithm == "pybtex_document_label":
         # in this case, the input (i.e., 'target_field') will be a string
 
-        # standardize capitalization in the string (e.g., '  At ' -> ' at ')
-        document_instance_name = standardizeCapitalization(target_field, "en_title")
-        # replace remaining undesired characters with the desired ones (e.g., ':' -> '-' or '{"}' with a double quote)
-        # using dictionary_of_patterns_to_replace
-        document_instance_name = replacePatternsAsPerDictionary(document_instance_name,
-                                                                dictionary_of_patterns_to_replace)
-
-        if algorithm is "pybtex_document_instance_name":
-            # omit undesired characters from this string
-            document_instance_name = re.sub(pattern_of_characters_to_omit, "", document_instance_name)
-            document_instance_name = replacePatternsAsPerDictionary(document_instance_name,
-                                                                    dictionary_of_patterns_to_replace)
-            # replace spaces with underscores
-            document_instance_name = re.sub(" ", "_", document_instance_name)
-
-            # convert to uri-safe string
-            document_instance_name = quote(document_instance_name)
+        # documents (e.g., journals, publishers) that have been formatted before are retrieved from the cache
+        cache_key = (algorithm, target_field)
+        cached_document_instance_name = formatting_cache.get(cache_key)
+        if cached_document_instance_name is not None:
+            return cached_document_instance_name
+
+        # standardize capitalization in the string (e.g., '  At ' -> ' at '), and replace remaining undesired
+        # ...characters with the desired ones (e.g., ':' -> '-' or '{"}' with a double quote)
+        # if an instance name is requested, also omit undesired characters, replace spaces with underscores and
+        # ...convert to uri-safe string
+        if algorithm == "pybtex_document_instance_name":
+            document_instance_name = formatting_engine.format_document_instance_name(target_field)
+        else:
+            document_instance_name = formatting_engine.format_document_label(target_field)
 
+        formatting_cache.set(cache_key, document_instance_name)
         return document_instance_name
 
 
     # ---------------------------------------------------------------------------#
     #                 FORMAT: TOPIC INSTANCE NAME AND TOPIC LABEL                #
     # ---------------------------------------------------------------------------#
-    elif algorithm is "pybtex_topic_instance_name" or algorithm is "pybtex_topic_label":
+    elif algorithm == "pybtex_topic_instance_name" or algorithm == "pybtex_topic_label":
+        # keyword strings that have been formatted before are retrieved from the cache (as a new list, so that the
+        # ...cached list cannot be modified through the returned one)
+        cache_key = (algorithm, target_field)
+        cached_formatted_topics_list = formatting_cache.get(cache_key)
+        if cached_formatted_topics_list is not None:
+            return list(cached_formatted_topics_list)
+
         # tokenize string input (which is in the format of "topic string 1, topic string 2")
         # note that the split character is ", " and not ",". if space is not included, the first character of topics
         # end up being a space e.g., " topic 1" instead of "topic 1" .
@@ -2812,30 +4935,30 @@ def cleanAndFormatValues(target_field, algorithm):
 
         for each_topic_string in tokenized_topics_list:
             # omit unwanted characters
-            each_formatted_topic = re.sub(pattern_of_characters_to_omit, "", each_topic_string)
+            each_formatted_topic = formatting_engine.omit_characters(each_topic_string)
             # standardize capitalization in the string (e.g., '  At ' -> ' at ')
-            each_formatted_topic = standardizeCapitalization(each_formatted_topic, "en_title")
+            each_formatted_topic = formatting_engine.standardize_capitalization(each_formatted_topic)
 
             # if the task is to formatting the input as an instance name
-            if algorithm is "pybtex_topic_instance_name":
+            if algorithm == "pybtex_topic_instance_name":
                 each_formatted_topic = each_formatted_topic.lower()
-                # replace remaining unwanted characters/patterns with the ones in dictionary_of_patterns_to_replace
-                each_formatted_topic = replacePatternsAsPerDictionary(each_formatted_topic,
-                                                                      dictionary_of_patterns_to_replace)
+                # replace remaining unwanted characters/patterns with the ones in Formatting_Engine.PATTERNS_TO_REPLACE
+                each_formatted_topic = formatting_engine.replace_patterns(each_formatted_topic)
                 # replace spaces with underscores
-                each_formatted_topic = re.sub(" ", "_", each_formatted_topic)
+                each_formatted_topic = each_formatted_topic.replace(" ", "_")
 
                 # convert to uri-safe string
                 each_formatted_topic = quote(each_formatted_topic)
 
             # if the task is to format as a topic label
-            elif algorithm is "pybtex_topic_label":
+            elif algorithm == "pybtex_topic_label":
                 # keep the spaces (i.e., " " character) in topic strings
                 pass
 
             # add the formatted topics list to the output variable
             formatted_topics_list.append(each_formatted_topic)
 
+        formatting_cache.set(cache_key, tuple(formatted_topics_list))
         return formatted_topics_list
 
 
@@ -2843,14 +4966,14 @@ def cleanAndFormatValues(target_field, algorithm):
     #                           MINIMIZE LISTS                                   #
     # ---------------------------------------------------------------------------#
     # TODO: These list minimization/selection functions should be replaced with more graceful equivalents.
-    elif algorithm is "oc_select_first_item_if_list":
+    elif algorithm == "oc_select_first_item_if_list":
         if type(target_field) is list:
             inputted_list = target_field
             return inputted_list[0]
         else:
             return target_field
 
-    elif algorithm is "oc_select_last_item_if_list_and_capitalize_first_letter":
+    elif algorithm == "oc_select_last_item_if_list_and_capitalize_first_letter":
         from preprocessor.string_tools import String
 
         if type(target_field) is list:
@@ -2862,7 +4985,7 @@ def cleanAndFormatValues(target_field, algorithm):
         return formatted_element
 
 
-    elif algorithm is "oc_select_last_item_if_list":
+    elif algorithm == "oc_select_last_item_if_list":
         from preprocessor.string_tools import String
 
         if type(target_field) is list:
@@ -2873,7 +4996,7 @@ def cleanAndFormatValues(target_field, algorithm):
         return selected_element
 
 
-    elif algorithm is "capitalize_first_letter":
+    elif algorithm == "capitalize_first_letter":
         from preprocessor.string_tools import String
         from preprocessor.string_tools import Parameter_Value
         inputted_list = Parameter_Value(target_field).convert_to_single_item_list_if_not_list()
@@ -2889,11 +5012,81 @@ def cleanAndFormatValues(target_field, algorithm):
     # ---------------------------------------------------------------------------#
     #               NO FORMATTING: MINIMIZE LISTS (FOR NOW)                      #
     # ---------------------------------------------------------------------------#
-    elif algorithm is "none":
+    elif algorithm == "none":
         # if no formatting is wanted, the target field values are returned as they are.
         return target_field
 
 
+###################################################################################################################
+############################################ KEY NORMALIZATION FUNCTIONS ##########################################
+###################################################################################################################
+
+def normalizeDoi(doi):
+    """
+    Reduces a DOI to its kernel (see DOI_String.reduce_to_kernel() in retriever.sparql_tools), and normalizes its
+    notation, so that the same DOI written in different ways (e.g., in VU Pure, UvA Pure and OpenCitations data) can
+    be matched. The '--' that replaces '/' in cleaned .bib files is reverted, and the DOI is lowercased (DOIs are
+    case-insensitive). Normalized DOIs are cached in doi_normalization_cache.
+
+    Args:
+        doi(str)
+
+    Returns:
+        str
+
+    Examples:
+        >>> normalizeDoi('10.1016--J.FUTURE.2017.04.017')
+        '10.1016/j.future.2017.04.017'
+        >>> normalizeDoi('https://doi.org/10.1016/j.future.2017.04.017')
+        '10.1016/j.future.2017.04.017'
+        >>> normalizeDoi(' DOI: 10.1016/j.future.2017.04.017 ')
+        '10.1016/j.future.2017.04.017'
+    """
+    from retriever.sparql_tools import DOI_String
+
+    normalized_doi = doi_normalization_cache.get(doi)
+    if normalized_doi is None:
+        normalized_doi = DOI_String(doi.strip().replace('--', '/')).reduce_to_kernel().content.lower()
+        doi_normalization_cache.set(doi, normalized_doi)
+    return normalized_doi
+
+
+# shared by all calls to normalizeDoi()
+doi_normalization_cache = Formatting_Cache(maximum_size=1000000)
+
+# key normalizers that can be referred to by name (e.g., in Bibliography.enrich_with(key_normalizer='doi'))
+KEY_NORMALIZERS = {'doi': normalizeDoi}
+
+
+def normalizeKey(key, key_normalizer):
+    """
+    Normalizes a field value (or each value in a list of field values) to be used as a join key.
+
+    Args:
+        key(str or list): Field value(s) to be normalized
+        key_normalizer(str or function): Name of a function in KEY_NORMALIZERS (e.g., 'doi'), or a function that takes
+            and returns a string
+
+    Returns:
+        str or list
+
+    Examples:
+        >>> normalizeKey(['10.1016--J.FUTURE.2017.04.017', 'doi:10.1186/S13034-015-0062-7'], 'doi')
+        ['10.1016/j.future.2017.04.017', '10.1186/s13034-015-0062-7']
+        >>> normalizeKey('A Title', str.lower)
+        'a title'
+    """
+    if type(key_normalizer) == str:
+        key_normalizer = KEY_NORMALIZERS[key_normalizer]
+
+    if type(key) == list:
+        return [key_normalizer(each_key) for each_key in key]
+    elif type(key) == str:
+        return key_normalizer(key)
+    else:
+        return key
+
+
 def long_tests():
     """
     Tests with long outputs are being run under this function
@@ -2902,166 +5095,7 @@ def long_tests():
         >>> my_bibtex_file = Bibtex_File('example_data//vu_1k_test.bib')
         >>> my_bibtex_file.convert_to_ttl(desired_version_suffix='0.0_test', desired_source_bibliography_name='vu')
         Cleaning of "example_data//vu_1k_test.bib" started
-        [------------------------------------------------------------] 0% ...Cleaning example_data//vu_1k_test.bib
-        [=-----------------------------------------------------------] 0% ...Cleaning example_data//vu_1k_test.bib
-        [=-----------------------------------------------------------] 1% ...Cleaning example_data//vu_1k_test.bib
-        [=-----------------------------------------------------------] 2% ...Cleaning example_data//vu_1k_test.bib
-        [==----------------------------------------------------------] 2% ...Cleaning example_data//vu_1k_test.bib
-        [==----------------------------------------------------------] 3% ...Cleaning example_data//vu_1k_test.bib
-        [==----------------------------------------------------------] 4% ...Cleaning example_data//vu_1k_test.bib
-        [===---------------------------------------------------------] 4% ...Cleaning example_data//vu_1k_test.bib
-        [===---------------------------------------------------------] 5% ...Cleaning example_data//vu_1k_test.bib
-        [====--------------------------------------------------------] 5% ...Cleaning example_data//vu_1k_test.bib
-        [====--------------------------------------------------------] 6% ...Cleaning example_data//vu_1k_test.bib
-        [====--------------------------------------------------------] 7% ...Cleaning example_data//vu_1k_test.bib
-        [=====-------------------------------------------------------] 7% ...Cleaning example_data//vu_1k_test.bib
-        [=====-------------------------------------------------------] 8% ...Cleaning example_data//vu_1k_test.bib
-        [=====-------------------------------------------------------] 9% ...Cleaning example_data//vu_1k_test.bib
-        [======------------------------------------------------------] 9% ...Cleaning example_data//vu_1k_test.bib
-        [======------------------------------------------------------] 10% ...Cleaning example_data//vu_1k_test.bib
-        [=======-----------------------------------------------------] 10% ...Cleaning example_data//vu_1k_test.bib
-        [=======-----------------------------------------------------] 11% ...Cleaning example_data//vu_1k_test.bib
-        [=======-----------------------------------------------------] 12% ...Cleaning example_data//vu_1k_test.bib
-        [========----------------------------------------------------] 12% ...Cleaning example_data//vu_1k_test.bib
-        [========----------------------------------------------------] 13% ...Cleaning example_data//vu_1k_test.bib
-        [========----------------------------------------------------] 14% ...Cleaning example_data//vu_1k_test.bib
-        [=========---------------------------------------------------] 14% ...Cleaning example_data//vu_1k_test.bib
-        [=========---------------------------------------------------] 15% ...Cleaning example_data//vu_1k_test.bib
-        [==========--------------------------------------------------] 15% ...Cleaning example_data//vu_1k_test.bib
-        [==========--------------------------------------------------] 16% ...Cleaning example_data//vu_1k_test.bib
-        [==========--------------------------------------------------] 17% ...Cleaning example_data//vu_1k_test.bib
-        [===========-------------------------------------------------] 17% ...Cleaning example_data//vu_1k_test.bib
-        [===========-------------------------------------------------] 18% ...Cleaning example_data//vu_1k_test.bib
-        [===========-------------------------------------------------] 19% ...Cleaning example_data//vu_1k_test.bib
-        [============------------------------------------------------] 19% ...Cleaning example_data//vu_1k_test.bib
-        [============------------------------------------------------] 20% ...Cleaning example_data//vu_1k_test.bib
-        [=============-----------------------------------------------] 20% ...Cleaning example_data//vu_1k_test.bib
-        [=============-----------------------------------------------] 21% ...Cleaning example_data//vu_1k_test.bib
-        [=============-----------------------------------------------] 22% ...Cleaning example_data//vu_1k_test.bib
-        [==============----------------------------------------------] 22% ...Cleaning example_data//vu_1k_test.bib
-        [==============----------------------------------------------] 23% ...Cleaning example_data//vu_1k_test.bib
-        [==============----------------------------------------------] 24% ...Cleaning example_data//vu_1k_test.bib
-        [===============---------------------------------------------] 24% ...Cleaning example_data//vu_1k_test.bib
-        [===============---------------------------------------------] 25% ...Cleaning example_data//vu_1k_test.bib
-        [================--------------------------------------------] 25% ...Cleaning example_data//vu_1k_test.bib
-        [================--------------------------------------------] 26% ...Cleaning example_data//vu_1k_test.bib
-        [================--------------------------------------------] 27% ...Cleaning example_data//vu_1k_test.bib
-        [=================-------------------------------------------] 27% ...Cleaning example_data//vu_1k_test.bib
-        [=================-------------------------------------------] 28% ...Cleaning example_data//vu_1k_test.bib
-        [=================-------------------------------------------] 29% ...Cleaning example_data//vu_1k_test.bib
-        [==================------------------------------------------] 29% ...Cleaning example_data//vu_1k_test.bib
-        [==================------------------------------------------] 30% ...Cleaning example_data//vu_1k_test.bib
-        [===================-----------------------------------------] 30% ...Cleaning example_data//vu_1k_test.bib
-        [===================-----------------------------------------] 31% ...Cleaning example_data//vu_1k_test.bib
-        [===================-----------------------------------------] 32% ...Cleaning example_data//vu_1k_test.bib
-        [====================----------------------------------------] 32% ...Cleaning example_data//vu_1k_test.bib
-        [====================----------------------------------------] 33% ...Cleaning example_data//vu_1k_test.bib
-        [====================----------------------------------------] 34% ...Cleaning example_data//vu_1k_test.bib
-        [=====================---------------------------------------] 34% ...Cleaning example_data//vu_1k_test.bib
-        [=====================---------------------------------------] 35% ...Cleaning example_data//vu_1k_test.bib
-        [======================--------------------------------------] 35% ...Cleaning example_data//vu_1k_test.bib
-        [======================--------------------------------------] 36% ...Cleaning example_data//vu_1k_test.bib
-        [======================--------------------------------------] 37% ...Cleaning example_data//vu_1k_test.bib
-        [=======================-------------------------------------] 37% ...Cleaning example_data//vu_1k_test.bib
-        [=======================-------------------------------------] 38% ...Cleaning example_data//vu_1k_test.bib
-        [=======================-------------------------------------] 39% ...Cleaning example_data//vu_1k_test.bib
-        [========================------------------------------------] 39% ...Cleaning example_data//vu_1k_test.bib
-        [========================------------------------------------] 40% ...Cleaning example_data//vu_1k_test.bib
-        [=========================-----------------------------------] 40% ...Cleaning example_data//vu_1k_test.bib
-        [=========================-----------------------------------] 41% ...Cleaning example_data//vu_1k_test.bib
-        [=========================-----------------------------------] 42% ...Cleaning example_data//vu_1k_test.bib
-        [==========================----------------------------------] 42% ...Cleaning example_data//vu_1k_test.bib
-        [==========================----------------------------------] 43% ...Cleaning example_data//vu_1k_test.bib
-        [==========================----------------------------------] 44% ...Cleaning example_data//vu_1k_test.bib
-        [===========================---------------------------------] 44% ...Cleaning example_data//vu_1k_test.bib
-        [===========================---------------------------------] 45% ...Cleaning example_data//vu_1k_test.bib
-        [============================--------------------------------] 45% ...Cleaning example_data//vu_1k_test.bib
-        [============================--------------------------------] 46% ...Cleaning example_data//vu_1k_test.bib
-        [============================--------------------------------] 47% ...Cleaning example_data//vu_1k_test.bib
-        [=============================-------------------------------] 47% ...Cleaning example_data//vu_1k_test.bib
-        [=============================-------------------------------] 48% ...Cleaning example_data//vu_1k_test.bib
-        [=============================-------------------------------] 49% ...Cleaning example_data//vu_1k_test.bib
-        [==============================------------------------------] 49% ...Cleaning example_data//vu_1k_test.bib
-        [==============================------------------------------] 50% ...Cleaning example_data//vu_1k_test.bib
-        [===============================-----------------------------] 50% ...Cleaning example_data//vu_1k_test.bib
-        [===============================-----------------------------] 51% ...Cleaning example_data//vu_1k_test.bib
-        [===============================-----------------------------] 52% ...Cleaning example_data//vu_1k_test.bib
-        [================================----------------------------] 52% ...Cleaning example_data//vu_1k_test.bib
-        [================================----------------------------] 53% ...Cleaning example_data//vu_1k_test.bib
-        [================================----------------------------] 54% ...Cleaning example_data//vu_1k_test.bib
-        [=================================---------------------------] 54% ...Cleaning example_data//vu_1k_test.bib
-        [=================================---------------------------] 55% ...Cleaning example_data//vu_1k_test.bib
-        [==================================--------------------------] 55% ...Cleaning example_data//vu_1k_test.bib
-        [==================================--------------------------] 56% ...Cleaning example_data//vu_1k_test.bib
-        [==================================--------------------------] 57% ...Cleaning example_data//vu_1k_test.bib
-        [===================================-------------------------] 57% ...Cleaning example_data//vu_1k_test.bib
-        [===================================-------------------------] 58% ...Cleaning example_data//vu_1k_test.bib
-        [===================================-------------------------] 59% ...Cleaning example_data//vu_1k_test.bib
-        [====================================------------------------] 59% ...Cleaning example_data//vu_1k_test.bib
-        [====================================------------------------] 60% ...Cleaning example_data//vu_1k_test.bib
-        [=====================================-----------------------] 60% ...Cleaning example_data//vu_1k_test.bib
-        [=====================================-----------------------] 61% ...Cleaning example_data//vu_1k_test.bib
-        [=====================================-----------------------] 62% ...Cleaning example_data//vu_1k_test.bib
-        [======================================----------------------] 62% ...Cleaning example_data//vu_1k_test.bib
-        [======================================----------------------] 63% ...Cleaning example_data//vu_1k_test.bib
-        [======================================----------------------] 64% ...Cleaning example_data//vu_1k_test.bib
-        [=======================================---------------------] 64% ...Cleaning example_data//vu_1k_test.bib
-        [=======================================---------------------] 65% ...Cleaning example_data//vu_1k_test.bib
-        [========================================--------------------] 65% ...Cleaning example_data//vu_1k_test.bib
-        [========================================--------------------] 66% ...Cleaning example_data//vu_1k_test.bib
-        [========================================--------------------] 67% ...Cleaning example_data//vu_1k_test.bib
-        [=========================================-------------------] 67% ...Cleaning example_data//vu_1k_test.bib
-        [=========================================-------------------] 68% ...Cleaning example_data//vu_1k_test.bib
-        [=========================================-------------------] 69% ...Cleaning example_data//vu_1k_test.bib
-        [==========================================------------------] 69% ...Cleaning example_data//vu_1k_test.bib
-        [==========================================------------------] 70% ...Cleaning example_data//vu_1k_test.bib
-        [===========================================-----------------] 70% ...Cleaning example_data//vu_1k_test.bib
-        [===========================================-----------------] 71% ...Cleaning example_data//vu_1k_test.bib
-        [===========================================-----------------] 72% ...Cleaning example_data//vu_1k_test.bib
-        [============================================----------------] 72% ...Cleaning example_data//vu_1k_test.bib
-        [============================================----------------] 73% ...Cleaning example_data//vu_1k_test.bib
-        [============================================----------------] 74% ...Cleaning example_data//vu_1k_test.bib
-        [=============================================---------------] 74% ...Cleaning example_data//vu_1k_test.bib
-        [=============================================---------------] 75% ...Cleaning example_data//vu_1k_test.bib
-        [==============================================--------------] 75% ...Cleaning example_data//vu_1k_test.bib
-        [==============================================--------------] 76% ...Cleaning example_data//vu_1k_test.bib
-        [==============================================--------------] 77% ...Cleaning example_data//vu_1k_test.bib
-        [===============================================-------------] 77% ...Cleaning example_data//vu_1k_test.bib
-        [===============================================-------------] 78% ...Cleaning example_data//vu_1k_test.bib
-        [===============================================-------------] 79% ...Cleaning example_data//vu_1k_test.bib
-        [================================================------------] 79% ...Cleaning example_data//vu_1k_test.bib
-        [================================================------------] 80% ...Cleaning example_data//vu_1k_test.bib
-        [=================================================-----------] 80% ...Cleaning example_data//vu_1k_test.bib
-        [=================================================-----------] 81% ...Cleaning example_data//vu_1k_test.bib
-        [=================================================-----------] 82% ...Cleaning example_data//vu_1k_test.bib
-        [==================================================----------] 82% ...Cleaning example_data//vu_1k_test.bib
-        [==================================================----------] 83% ...Cleaning example_data//vu_1k_test.bib
-        [==================================================----------] 84% ...Cleaning example_data//vu_1k_test.bib
-        [===================================================---------] 84% ...Cleaning example_data//vu_1k_test.bib
-        [===================================================---------] 85% ...Cleaning example_data//vu_1k_test.bib
-        [====================================================--------] 85% ...Cleaning example_data//vu_1k_test.bib
-        [====================================================--------] 86% ...Cleaning example_data//vu_1k_test.bib
-        [====================================================--------] 87% ...Cleaning example_data//vu_1k_test.bib
-        [=====================================================-------] 87% ...Cleaning example_data//vu_1k_test.bib
-        [=====================================================-------] 88% ...Cleaning example_data//vu_1k_test.bib
-        [=====================================================-------] 89% ...Cleaning example_data//vu_1k_test.bib
-        [======================================================------] 89% ...Cleaning example_data//vu_1k_test.bib
-        [======================================================------] 90% ...Cleaning example_data//vu_1k_test.bib
-        [=======================================================-----] 90% ...Cleaning example_data//vu_1k_test.bib
-        [=======================================================-----] 91% ...Cleaning example_data//vu_1k_test.bib
-        [=======================================================-----] 92% ...Cleaning example_data//vu_1k_test.bib
-        [========================================================----] 92% ...Cleaning example_data//vu_1k_test.bib
-        [========================================================----] 93% ...Cleaning example_data//vu_1k_test.bib
-        [========================================================----] 94% ...Cleaning example_data//vu_1k_test.bib
-        [=========================================================---] 94% ...Cleaning example_data//vu_1k_test.bib
-        [=========================================================---] 95% ...Cleaning example_data//vu_1k_test.bib
-        [==========================================================--] 95% ...Cleaning example_data//vu_1k_test.bib
-        [==========================================================--] 96% ...Cleaning example_data//vu_1k_test.bib
-        [==========================================================--] 97% ...Cleaning example_data//vu_1k_test.bib
-        [===========================================================-] 97% ...Cleaning example_data//vu_1k_test.bib
-        [===========================================================-] 98% ...Cleaning example_data//vu_1k_test.bib
-        [===========================================================-] 99% ...Cleaning example_data//vu_1k_test.bib
-        [============================================================] 99% ...Cleaning example_data//vu_1k_test.bib
+        [============================================================] 100% ...Cleaning example_data//vu_1k_test.bib
         Cleaning of "example_data//vu_1k_test.bib" finished
         Parsing of example_data//vu_1k_test_cleaned.bib started
         pybtex package is parsing using bibtex.Parser()...
@@ -0,0 +1,95 @@
+class Formatting_Cache():
+    """
+    A bounded (least-recently-used) cache for the outputs of bibTools.cleanAndFormatValues() and
+    rdfTools.construct_uri(). The same authors, journals and publishers occur many times in large bibliographies, and
+    this cache prevents them from being formatted again each time they occur.
+
+    Examples:
+        >>> my_cache = Formatting_Cache(maximum_size=2)
+        >>> my_cache.get(('none', 'a')) is None
+        True
+        >>> my_cache.set(('none', 'a'), 'A')
+        >>> my_cache.set(('none', 'b'), 'B')
+        >>> my_cache.get(('none', 'a'))
+        'A'
+
+        >>> # the least recently used item ('b') is evicted when the cache is full
+        >>> my_cache.set(('none', 'c'), 'C')
+        >>> my_cache.get(('none', 'b')) is None
+        True
+        >>> my_cache.get_statistics()
+        {'size': 2, 'maximum_size': 2, 'hits': 1, 'misses': 2, 'evictions': 1, 'hit_rate': 0.3333333333333333}
+
+        >>> # a cache with a maximum size of 0 stores nothing
+        >>> my_disabled_cache = Formatting_Cache(maximum_size=0)
+        >>> my_disabled_cache.set(('none', 'a'), 'A')
+        >>> my_disabled_cache.get(('none', 'a')) is None
+        True
+    """
+
+    def __init__(self, maximum_size=100000):
+        """
+        Args:
+            maximum_size(int): Maximum number of items held in the cache. 0 disables caching.
+        """
+        from collections import OrderedDict
+
+        self.maximum_size = maximum_size
+        self._items = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+
+    def get(self, key):
+        """
+        Returns the cached value for the key (and marks it as recently used), or None if the key is not cached.
+        """
+        try:
+            value = self._items[key]
+        except KeyError:
+            self.misses += 1
+            return None
+
+        self._items.move_to_end(key)
+        self.hits += 1
+        return value
+
+
+    def set(self, key, value):
+        """
+        Caches the value for the key, evicting the least recently used item if the cache is full.
+        """
+        if self.maximum_size <= 0:
+            return
+
+        self._items[key] = value
+        self._items.move_to_end(key)
+
+        if len(self._items) > self.maximum_size:
+            self._items.popitem(last=False)
+            self.evictions += 1
+
+
+    def clear(self):
+        """
+        Empties the cache and resets its counters.
+        """
+        self._items.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+
+    def get_statistics(self):
+        """
+        Returns:
+            A dictionary with the current size of the cache and its hit, miss and eviction counts.
+        """
+        no_of_lookups = self.hits + self.misses
+        return {'size': len(self._items),
+                'maximum_size': self.maximum_size,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / no_of_lookups if no_of_lookups else 0.0}
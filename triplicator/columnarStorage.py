@@ -0,0 +1,684 @@
+from array import array
+from collections.abc import MutableMapping, MutableSequence
+
+
+class Columnar_Entries(MutableMapping):
+    """
+    A columnar storage backend for the entries of a Bibliography object (see Bibliography(storage='columnar')).
+
+    Instead of a dictionary of per-entry dictionaries (in which the same field names are repeated for each entry),
+    entries are stored in one column per field. Each column is an array of integer codes (one per entry), and the codes
+    refer to a single, shared dictionary of distinct values; so each distinct string (e.g., an author name or a
+    publisher that appears in thousands of entries) is stored only once. List values (e.g., authors) are stored in the
+    same way, as a flat array of codes per column, together with an array of offsets that marks where each list
+    starts.
+
+    The object behaves like the dictionary of entries it replaces: entries[entry_id] returns a view of the entry that
+    behaves like the entry's dictionary (with its fields in the order they were added to the entry), and changes made
+    through it are written to the columns. List values are returned as Columnar_List objects, which are lists that
+    write their changes back to the columns (e.g., entries[entry_id]['author'].append(...) changes the stored entry).
+
+    The field order of each row is stored as a code that refers to a dictionary of distinct field orders (as most
+    entries share the same few orders). Replaced list values and removed entries leave their codes unused in the
+    arrays; .compact() rebuilds the storage without them.
+
+    Examples:
+        >>> my_entries = Columnar_Entries()
+        >>> my_entries['01'] = {'author': ['John Can Lokman', 'Stefan Schlobach'], 'title': 'A title'}
+        >>> my_entries['02'] = {'title': 'Another title'}
+        >>> my_entries['02']['author'] = ['John Can Lokman']
+        >>> my_entries
+        {'01': {'author': ['John Can Lokman', 'Stefan Schlobach'], 'title': 'A title'}, '02': {'title': 'Another title', 'author': ['John Can Lokman']}}
+        >>> my_entries['01']['title']
+        'A title'
+        >>> my_entries == {'01': {'title': 'A title', 'author': ['John Can Lokman', 'Stefan Schlobach']},
+        ...                '02': {'title': 'Another title', 'author': ['John Can Lokman']}}
+        True
+
+        >>> # distinct values are stored only once
+        >>> my_entries._values
+        ['John Can Lokman', 'Stefan Schlobach', 'A title', 'Another title']
+
+        >>> # column scans
+        >>> my_entries.count_values('author')
+        {'John Can Lokman': 2, 'Stefan Schlobach': 1}
+        >>> list(my_entries.iterate_column('title'))
+        [('01', 'A title'), ('02', 'Another title')]
+
+        >>> # fields keep the order they were added to each entry
+        >>> my_entries['03'] = {'title': 'Third title', 'author': ['Stefan Schlobach']}
+        >>> list(my_entries['03'])
+        ['title', 'author']
+        >>> my_entries['03']['year'] = '2017'
+        >>> my_entries['03']['title'] = 'Third title, revised'
+        >>> my_entries['03']
+        {'title': 'Third title, revised', 'author': ['Stefan Schlobach'], 'year': '2017'}
+
+        >>> # list values can be changed in place
+        >>> my_entries['03']['author'].append('John Can Lokman')
+        >>> my_entries['03']['author']
+        ['Stefan Schlobach', 'John Can Lokman']
+
+        >>> # entries can be removed, and the dictionary methods work as usual
+        >>> my_entries.pop('01')
+        {'author': ['John Can Lokman', 'Stefan Schlobach'], 'title': 'A title'}
+        >>> list(my_entries.keys())
+        ['02', '03']
+        >>> dict(my_entries['02'])
+        {'title': 'Another title', 'author': ['John Can Lokman']}
+
+        >>> # the space left by removed entries and replaced lists can be reclaimed
+        >>> my_entries.compact()
+        >>> my_entries
+        {'02': {'title': 'Another title', 'author': ['John Can Lokman']}, '03': {'title': 'Third title, revised', 'author': ['Stefan Schlobach', 'John Can Lokman'], 'year': '2017'}}
+        >>> my_entries._values
+        ['Another title', 'John Can Lokman', 'Third title, revised', 'Stefan Schlobach', '2017']
+    """
+
+    # codes that do not refer to the values dictionary
+    _MISSING = -1            # the entry does not have the field
+    _OBJECT = -2             # the value is not a string or a list of strings, and is kept as it is (in ._objects)
+    _FIRST_LIST_CODE = -3    # codes from -3 downwards refer to lists (-3 is the first list of the column, and so on)
+
+    def __init__(self):
+        # entry ids by row number (None for removed entries), and row numbers by entry id
+        self._ids = []
+        self._rows = {}
+
+        # one array of codes per field, in the order the fields are first added
+        self._columns = {}
+
+        # list values of each field: the codes of all list items in a single array, and the start position of each
+        # ...list in it (the end of each list is the start of the next one)
+        self._list_items = {}
+        self._list_offsets = {}
+
+        # values that are neither strings nor lists of strings, by field and row
+        self._objects = {}
+
+        # dictionary of distinct values; codes are positions in ._values
+        self._values = []
+        self._value_codes = {}
+
+        # dictionary of distinct field orders (tuples of field names; code 0 is the order of an empty entry), and the
+        # ...code of the field order of each row
+        self._layouts = [()]
+        self._layout_codes = {(): 0}
+        self._row_layouts = array('i')
+
+        # incremented by .compact(), which renumbers rows and list codes (see Columnar_List)
+        self._generation = 0
+
+
+    ###################################################################################################################
+    ############################################### MAPPING FUNCTIONS #################################################
+    ###################################################################################################################
+
+    def __getitem__(self, entry_id):
+        return Columnar_Entry(self, self._rows[entry_id])
+
+
+    def __setitem__(self, entry_id, entry_data):
+        entry_data = list(entry_data.items())  # copied first, as entry_data may be a view of the entry being replaced
+
+        if entry_id in self._rows:
+            row = self._rows[entry_id]
+            self._clear_row(row)
+        else:
+            row = len(self._ids)
+            self._ids.append(entry_id)
+            self._rows[entry_id] = row
+            self._row_layouts.append(0)
+
+        for each_field_name, each_field_value in entry_data:
+            self._set_value(row, each_field_name, each_field_value)
+
+
+    def __delitem__(self, entry_id):
+        row = self._rows.pop(entry_id)
+        self._clear_row(row)
+        self._ids[row] = None
+
+
+    def __iter__(self):
+        for each_entry_id in self._ids:
+            if each_entry_id is not None:
+                yield each_entry_id
+
+
+    def __len__(self):
+        return len(self._rows)
+
+
+    def __contains__(self, entry_id):
+        return entry_id in self._rows
+
+
+    def __repr__(self):
+        return repr({each_entry_id: dict(each_entry) for each_entry_id, each_entry in self.items()})
+
+
+    def pop(self, entry_id, *default):
+        """
+        Removes an entry and returns it as a dictionary (a view of a removed entry would be empty).
+        """
+        if entry_id not in self._rows:
+            if default:
+                return default[0]
+            raise KeyError(entry_id)
+
+        entry_data = dict(self[entry_id])
+        del self[entry_id]
+        return entry_data
+
+
+    def popitem(self):
+        for each_entry_id in reversed(self._ids):
+            if each_entry_id is not None:
+                return each_entry_id, self.pop(each_entry_id)
+        raise KeyError('popitem(): no entries')
+
+
+    def compact(self):
+        """
+        Rebuilds the storage without the rows of removed entries, the list items of replaced lists, and the values
+        that are no longer used by any entry. Views (Columnar_Entry) and lists (Columnar_List) that were returned
+        before compaction are detached from the storage; their changes are no longer written to it.
+        """
+        compacted_entries = Columnar_Entries()
+        for each_entry_id, each_entry in self.items():
+            compacted_entries[each_entry_id] = each_entry
+        compacted_entries._generation = self._generation + 1
+        self.__dict__.update(compacted_entries.__dict__)
+
+
+    ###################################################################################################################
+    ################################################ COLUMN FUNCTIONS #################################################
+    ###################################################################################################################
+
+    def iterate_column(self, field_name):
+        """
+        Yields (entry_id, value) pairs of all entries that have the field, without creating views of the entries.
+
+        Args:
+            field_name(str)
+        """
+        column = self._columns.get(field_name, ())
+        for each_row, each_code in enumerate(column):
+            if each_code != self._MISSING and self._ids[each_row] is not None:
+                yield self._ids[each_row], self._decode(field_name, each_row, each_code)
+
+
+    def count_values(self, field_name):
+        """
+        Counts the occurrences of each value of a field (each item is counted separately for list values), by
+        scanning the codes in the column of the field.
+
+        Args:
+            field_name(str)
+
+        Returns:
+            dict: {value: count}, in the order the values first appear in the column
+        """
+        from collections import Counter
+
+        code_counts = Counter()
+        object_counts = Counter()
+        column = self._columns.get(field_name, ())
+        for each_row, each_code in enumerate(column):
+            if each_code >= 0:
+                code_counts[each_code] += 1
+            elif each_code <= self._FIRST_LIST_CODE:
+                code_counts.update(self._list_codes(field_name, each_code))
+            elif each_code == self._OBJECT:
+                object_counts[repr(self._objects[field_name][each_row])] += 1
+
+        value_counts = {self._values[each_code]: each_count for each_code, each_count in code_counts.items()}
+        value_counts.update(object_counts)
+        return value_counts
+
+
+    ###################################################################################################################
+    ################################################ VALUE FUNCTIONS ##################################################
+    ###################################################################################################################
+
+    def _encode(self, value):
+        """
+        Returns the code of a (string) value in the values dictionary, and adds the value to it if necessary.
+        """
+        try:
+            return self._value_codes[value]
+        except KeyError:
+            code = len(self._values)
+            self._values.append(value)
+            self._value_codes[value] = code
+            return code
+
+
+    def _set_value(self, row, field_name, field_value):
+        if field_name not in self._columns:
+            self._columns[field_name] = array('i')
+            self._list_items[field_name] = array('i')
+            self._list_offsets[field_name] = array('i')
+            self._objects[field_name] = {}
+
+        column = self._columns[field_name]
+        if len(column) <= row:
+            column.extend([self._MISSING] * (row + 1 - len(column)))
+        if column[row] == self._MISSING:
+            self._set_row_layout(row, self._layouts[self._row_layouts[row]] + (field_name,))
+        self._objects[field_name].pop(row, None)
+
+        if type(field_value) == str:
+            column[row] = self._encode(field_value)
+
+        elif isinstance(field_value, list) and all(type(each_item) == str for each_item in field_value):
+            # lists are only appended; the items of a replaced list are left unused in the array
+            list_offsets = self._list_offsets[field_name]
+            list_offsets.append(len(self._list_items[field_name]))
+            self._list_items[field_name].extend(self._encode(each_item) for each_item in field_value)
+            column[row] = self._FIRST_LIST_CODE - (len(list_offsets) - 1)
+
+        else:
+            self._objects[field_name][row] = field_value
+            column[row] = self._OBJECT
+
+
+    def _get_value(self, row, field_name):
+        """
+        Raises:
+            KeyError: If the entry in the row does not have the field.
+        """
+        column = self._columns.get(field_name)
+        if column is None or len(column) <= row or column[row] == self._MISSING:
+            raise KeyError(field_name)
+        return self._decode(field_name, row, column[row])
+
+
+    def _delete_value(self, row, field_name):
+        column = self._columns[field_name]
+        if row < len(column) and column[row] != self._MISSING:
+            column[row] = self._MISSING
+            self._objects[field_name].pop(row, None)
+            self._set_row_layout(row, tuple(each_field_name for each_field_name in self._layouts[self._row_layouts[row]]
+                                            if each_field_name != field_name))
+
+
+    def _clear_row(self, row):
+        for each_field_name in self._layouts[self._row_layouts[row]]:
+            column = self._columns[each_field_name]
+            column[row] = self._MISSING
+            self._objects[each_field_name].pop(row, None)
+        self._row_layouts[row] = 0
+
+
+    def _set_row_layout(self, row, layout):
+        try:
+            self._row_layouts[row] = self._layout_codes[layout]
+        except KeyError:
+            self._layout_codes[layout] = len(self._layouts)
+            self._layouts.append(layout)
+            self._row_layouts[row] = self._layout_codes[layout]
+
+
+    def _get_fields(self, row):
+        """
+        Returns the field names of the entry in the row, in the order they were added to the entry.
+        """
+        return self._layouts[self._row_layouts[row]]
+
+
+    def _has_value(self, row, field_name):
+        column = self._columns.get(field_name)
+        return column is not None and row < len(column) and column[row] != self._MISSING
+
+
+    def _list_codes(self, field_name, code):
+        list_index = self._FIRST_LIST_CODE - code
+        list_offsets = self._list_offsets[field_name]
+        start = list_offsets[list_index]
+        end = list_offsets[list_index + 1] if list_index + 1 < len(list_offsets) else len(self._list_items[field_name])
+        return self._list_items[field_name][start:end]
+
+
+    def _decode(self, field_name, row, code):
+        if code >= 0:
+            return self._values[code]
+        elif code == self._OBJECT:
+            return self._objects[field_name][row]
+        else:
+            return Columnar_List([self._values[each_code] for each_code in self._list_codes(field_name, code)],
+                                 self, row, field_name, code)
+
+
+class Columnar_Entry(MutableMapping):
+    """
+    A view of a single entry in Columnar_Entries, which behaves like the dictionary of the entry.
+
+    Examples:
+        >>> my_entries = Columnar_Entries()
+        >>> my_entries['01'] = {'title': 'A title'}
+        >>> my_entry = my_entries['01']
+        >>> my_entry['author'] = 'John Can Lokman'
+        >>> del my_entry['title']
+        >>> my_entry
+        {'author': 'John Can Lokman'}
+        >>> 'title' in my_entry
+        False
+        >>> my_entries['01'] == {'author': 'John Can Lokman'}
+        True
+    """
+
+    __slots__ = ['_storage', '_row']
+
+    def __init__(self, storage, row):
+        self._storage = storage
+        self._row = row
+
+
+    def __getitem__(self, field_name):
+        return self._storage._get_value(self._row, field_name)
+
+
+    def __setitem__(self, field_name, field_value):
+        self._storage._set_value(self._row, field_name, field_value)
+
+
+    def __delitem__(self, field_name):
+        if not self._storage._has_value(self._row, field_name):
+            raise KeyError(field_name)
+        self._storage._delete_value(self._row, field_name)
+
+
+    def __iter__(self):
+        return iter(self._storage._get_fields(self._row))
+
+
+    def __len__(self):
+        return len(self._storage._get_fields(self._row))
+
+
+    def __contains__(self, field_name):
+        return self._storage._has_value(self._row, field_name)
+
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
+    def copy(self):
+        return dict(self)
+
+
+class Columnar_List(list):
+    """
+    A list value of an entry in Columnar_Entries. It is a regular list, except that changes made to it in place (e.g.,
+    with .append()) are written back to the entry, as long as the field of the entry has not been replaced (or
+    removed) in the meantime, and the storage has not been compacted since the list was returned. Copies and pickles
+    of the list are regular lists.
+
+    Examples:
+        >>> my_entries = Columnar_Entries()
+        >>> my_entries['01'] = {'author': ['John Can Lokman']}
+        >>> my_authors = my_entries['01']['author']
+        >>> my_authors += ['Stefan Schlobach']
+        >>> my_authors.sort(reverse=True)
+        >>> my_entries['01']['author']
+        ['Stefan Schlobach', 'John Can Lokman']
+
+        >>> # a list of a replaced value is detached from the entry
+        >>> my_entries['01']['author'] = ['Frank van Harmelen']
+        >>> my_authors.append('John Can Lokman')
+        >>> my_entries['01']['author']
+        ['Frank van Harmelen']
+        >>> type(my_authors.copy())
+        <class 'list'>
+    """
+
+    __slots__ = ['_storage', '_row', '_field_name', '_code', '_generation']
+
+    def __init__(self, items, storage, row, field_name, code):
+        super().__init__(items)
+        self._storage = storage
+        self._row = row
+        self._field_name = field_name
+        self._code = code
+        self._generation = storage._generation
+
+
+    def __reduce__(self):
+        return list, (list(self),)
+
+
+    def _write_back(self):
+        storage = self._storage
+        column = storage._columns.get(self._field_name)
+        if storage._generation != self._generation or column is None or len(column) <= self._row \
+                or column[self._row] != self._code:
+            return
+        storage._set_value(self._row, self._field_name, list(self))
+        self._code = column[self._row]
+
+
+def _add_write_back(method_name):
+    list_method = getattr(list, method_name)
+
+    def method_with_write_back(self, *args, **kwargs):
+        result = list_method(self, *args, **kwargs)
+        self._write_back()
+        return result
+
+    method_with_write_back.__name__ = method_name
+    setattr(Columnar_List, method_name, method_with_write_back)
+
+
+for each_method_name in ['append', 'extend', 'insert', 'remove', 'pop', 'clear', 'sort', 'reverse',
+                         '__setitem__', '__delitem__', '__iadd__', '__imul__']:
+    _add_write_back(each_method_name)
+
+
+class Columnar_Triples(MutableSequence):
+    """
+    A columnar storage backend for the triples of a Triples object (see rdfTools.Triples(storage='columnar')).
+
+    Instead of one string per triple (in which the same subject and property URIs are repeated in many triples), each
+    term of a triple is dictionary-encoded to an integer code, and triples are stored in three arrays of codes (one
+    for subjects, one for properties and one for objects). Each distinct term is stored only once. Triples are only
+    converted to strings (in n3 format) when they are read (e.g., when they are written to a file).
+
+    Lines that are not triples (e.g., prefix definitions, or strings that are assigned to an index) are stored as a
+    single term in the objects array, and are marked as such in the subjects array.
+
+    The object behaves like the list of triple strings it replaces.
+
+    Examples:
+        >>> my_triples = Columnar_Triples()
+        >>> my_triples.append_triple('<http://example.com/a>', '<http://example.com/type>', '<http://example.com/Book>')
+        >>> my_triples.append_triple('<http://example.com/b>', '<http://example.com/type>', '<http://example.com/Book>')
+        >>> my_triples
+        ['<http://example.com/a> <http://example.com/type> <http://example.com/Book> .', '<http://example.com/b> <http://example.com/type> <http://example.com/Book> .']
+        >>> my_triples[1]
+        '<http://example.com/b> <http://example.com/type> <http://example.com/Book> .'
+        >>> len(my_triples)
+        2
+
+        >>> # distinct terms are stored only once
+        >>> my_triples._terms
+        ['<http://example.com/a>', '<http://example.com/type>', '<http://example.com/Book>', '<http://example.com/b>']
+        >>> list(my_triples.iterate_codes())
+        [(0, 1, 2), (3, 1, 2)]
+
+        >>> # lines other than triples
+        >>> my_triples.append('@prefix ex: <http://example.com/> .')
+        >>> my_triples[0] = 'test 1'
+        >>> my_triples[0:3]
+        ['test 1', '<http://example.com/b> <http://example.com/type> <http://example.com/Book> .', '@prefix ex: <http://example.com/> .']
+        >>> list(my_triples.iterate_codes())
+        [(3, 1, 2)]
+
+        >>> # the list methods work as usual
+        >>> del my_triples[0]
+        >>> my_triples == ['<http://example.com/b> <http://example.com/type> <http://example.com/Book> .',
+        ...                '@prefix ex: <http://example.com/> .']
+        True
+    """
+
+    # code in the subjects array of lines that are not triples (the whole line is encoded in the objects array)
+    _LINE = -1
+
+    def __init__(self):
+        # one array of term codes for each position in the triples
+        self._subjects = array('i')
+        self._predicates = array('i')
+        self._objects = array('i')
+
+        # dictionary of distinct terms; codes are positions in ._terms
+        self._terms = []
+        self._term_codes = {}
+
+
+    ###################################################################################################################
+    ############################################### SEQUENCE FUNCTIONS ################################################
+    ###################################################################################################################
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._decode(each_index) for each_index in range(*index.indices(len(self)))]
+        return self._decode(self._get_position(index))
+
+
+    def __setitem__(self, index, line):
+        if isinstance(index, slice):
+            raise TypeError('Columnar_Triples does not support slice assignment.')
+        index = self._get_position(index)
+        self._subjects[index] = self._LINE
+        self._predicates[index] = self._LINE
+        self._objects[index] = self._encode(line)
+
+
+    def __delitem__(self, index):
+        if isinstance(index, slice):
+            for each_index in sorted(range(*index.indices(len(self))), reverse=True):
+                del self[each_index]
+            return
+        index = self._get_position(index)
+        del self._subjects[index]
+        del self._predicates[index]
+        del self._objects[index]
+
+
+    def __len__(self):
+        return len(self._subjects)
+
+
+    def __iter__(self):
+        for each_index in range(len(self)):
+            yield self._decode(each_index)
+
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+    def insert(self, index, line):
+        self._subjects.insert(index, self._LINE)
+        self._predicates.insert(index, self._LINE)
+        self._objects.insert(index, self._encode(line))
+
+
+    ###################################################################################################################
+    ################################################ TRIPLE FUNCTIONS #################################################
+    ###################################################################################################################
+
+    def append_triple(self, sub, prop, obj):
+        """
+        Adds a triple, without converting it to a string.
+
+        Args:
+            sub(str): The subject of the triple
+            prop(str): The property of the triple
+            obj(str): The object of the triple
+        """
+        self._subjects.append(self._encode(sub))
+        self._predicates.append(self._encode(prop))
+        self._objects.append(self._encode(obj))
+
+
+    def extend_with_codes(self, terms, subjects, predicates, objects):
+        """
+        Adds triples that are encoded with another terms dictionary (e.g., the columns of another Columnar_Triples
+        object), by converting their codes to the codes of this object, without converting the triples to strings.
+
+        Args:
+            terms(list): The terms dictionary of the triples to add
+            subjects, predicates, objects(array): The codes of the subjects, properties and objects of the triples to
+                add
+
+        Examples:
+            >>> my_triples = Columnar_Triples()
+            >>> my_triples.append_triple('<http://example.com/a>', '<http://example.com/type>', '<http://example.com/Book>')
+            >>> my_other_triples = Columnar_Triples()
+            >>> my_other_triples.append_triple('<http://example.com/b>', '<http://example.com/type>', '<http://example.com/Book>')
+            >>> my_triples.extend_with_codes(my_other_triples._terms, my_other_triples._subjects,
+            ...                              my_other_triples._predicates, my_other_triples._objects)
+            >>> my_triples[1]
+            '<http://example.com/b> <http://example.com/type> <http://example.com/Book> .'
+            >>> list(my_triples.iterate_codes())
+            [(0, 1, 2), (3, 1, 2)]
+        """
+        codes = [self._encode(each_term) for each_term in terms]
+        self._subjects.extend(map(codes.__getitem__, subjects))
+        self._predicates.extend(map(codes.__getitem__, predicates))
+        self._objects.extend(map(codes.__getitem__, objects))
+
+
+    def iterate_codes(self):
+        """
+        Yields the (subject, property, object) codes of the triples (lines that are not triples are skipped). As codes
+        are integers, they can be compared, sorted or put in sets at a fraction of the cost of the strings they
+        stand for (see ._terms).
+        """
+        for each_subject_code, each_predicate_code, each_object_code in zip(self._subjects, self._predicates,
+                                                                             self._objects):
+            if each_subject_code != self._LINE:
+                yield each_subject_code, each_predicate_code, each_object_code
+
+
+    ###################################################################################################################
+    ################################################ TERM FUNCTIONS ###################################################
+    ###################################################################################################################
+
+    def _encode(self, term):
+        """
+        Returns the code of a term in the terms dictionary, and adds the term to it if necessary.
+        """
+        try:
+            return self._term_codes[term]
+        except KeyError:
+            code = len(self._terms)
+            self._terms.append(term)
+            self._term_codes[term] = code
+            return code
+
+
+    def _decode(self, index):
+        """
+        Returns the triple (or line) at the index as a string in n3 format.
+        """
+        if self._subjects[index] == self._LINE:
+            return self._terms[self._objects[index]]
+        terms = self._terms
+        return terms[self._subjects[index]] + " " + terms[self._predicates[index]] + " " + \
+               terms[self._objects[index]] + " ."
+
+
+    def _get_position(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('Columnar_Triples index out of range')
+        return index
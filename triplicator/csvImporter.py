@@ -64,12 +64,18 @@ class CSV_Bibliography(Bibliography):
         from preprocessor.legacy_functions.get_header_index import get_header_index
 
         ### Bibliography class instance attributes
-        # adds the instance to the list of all instances of the class
-        Bibliography._class_instance_registry.append(instance)
+        # adds the instance to the registry of all instances of the class
+        Bibliography._registerInstance(instance)
         # local equivalent of _class_field_values_registry. Does the same thing for the bibliography instance.
         instance._field_values_registry       = {}
+        # only the fields that are looked up are indexed (see Bibliography.__init__())
+        instance._index_all_fields = False
+        instance._normalized_field_values_registry = {}
+        instance._search_indexes = {}
+        # values are interned in the parent Bibliography object (see Bibliography.setEntry())
+        instance._value_pool = None
         # hold all ids created within the bibliography instance. allows quick checking whether an id exists.
-        instance._id_registry = []
+        instance._id_registry = {}
         # dictionary for holding all field types and number of their occurrences
         instance._field_type_registry = {}
 
@@ -190,3 +190,142 @@ class Pybtex_import:
     #                     return False
     #         return not stack
     #
+
+
+def iterate_bibtex_entry_strings(bib_file_path, file_progress=None):
+    """
+    Reads a .bib file line by line and yields the raw text of one entry at a time. An entry is considered to start at
+    a line that begins with '@' (as in String.is_line_type('bibtex', 'start of entry')) and to continue until the
+    next such line. Any text before the first entry is yielded as a separate string.
+
+    Args:
+        bib_file_path(str): The location of the bib file to be read.
+        file_progress(meta.consoleOutput.File_Progress): If provided, it is set to track the progress of reading the
+            file.
+
+    Yields:
+        str: The raw text of an entry (including the blank lines that follow it)
+
+    Examples:
+        >>> entry_strings = list(iterate_bibtex_entry_strings('example_data//test.bib'))
+        >>> len(entry_strings)
+        4
+        >>> print(entry_strings[0].strip())
+        @book{56fafbf2574947cc9cbbfae578a0a36d,
+          title     = "Book with one author",
+          author    = "A.C. Jaschke",
+          year      = "2017",
+          month     = "10",
+          publisher = "Van Gennep",
+        }
+    """
+    entry_lines = []
+    with open(bib_file_path, encoding='utf8') as bib_file:
+        if file_progress is not None:
+            file_progress.track(bib_file)
+        for each_line in bib_file:
+            if each_line.startswith('@') and entry_lines:
+                yield ''.join(entry_lines)
+                entry_lines = []
+            entry_lines.append(each_line)
+
+    if entry_lines:
+        yield ''.join(entry_lines)
+
+
+def split_bibtex_file_into_shards(bib_file_path, no_of_shards):
+    """
+    Splits a .bib file at entry boundaries into (at most) the specified number of shards of consecutive entries, so
+    that the shards can be parsed independently (e.g., in parallel processes). Macro definitions (i.e., '@string'
+    entries) are copied to the beginning of each shard, so that they remain available to all entries.
+
+    Args:
+        bib_file_path(str): The location of the bib file to be split.
+        no_of_shards(int): The desired number of shards.
+
+    Returns:
+        list: A list of strings, each containing the text of consecutive entries in the original file (in original
+            order).
+
+    Examples:
+        >>> shards = split_bibtex_file_into_shards('example_data//test.bib', no_of_shards=2)
+        >>> len(shards)
+        2
+        >>> # number of entries in each shard
+        >>> [len([each_line for each_line in each_shard.splitlines() if each_line.startswith('@')])
+        ...  for each_shard in shards]
+        [2, 2]
+
+        >>> # the number of shards never exceeds the number of entries
+        >>> len(split_bibtex_file_into_shards('example_data//test.bib', no_of_shards=10))
+        4
+    """
+    from preprocessor.string_tools import Parameter_Value
+    Parameter_Value(no_of_shards).force_positive_integer()
+
+    macro_strings = []
+    entry_strings = []
+    for each_entry_string in iterate_bibtex_entry_strings(bib_file_path):
+        if each_entry_string[:7].lower() == '@string':
+            macro_strings.append(each_entry_string)
+        else:
+            entry_strings.append(each_entry_string)
+
+    no_of_shards = max(1, min(no_of_shards, len(entry_strings)))
+    shard_length, remainder = divmod(len(entry_strings), no_of_shards)
+
+    shards = []
+    start_index = 0
+    for i in range(no_of_shards):
+        end_index = start_index + shard_length + (1 if i < remainder else 0)
+        shards.append(''.join(macro_strings + entry_strings[start_index:end_index]))
+        start_index = end_index
+
+    return shards
+
+
+def iterate_pybtex_entries(bib_file_path, file_progress=None):
+    """
+    Parses a .bib file one entry at a time, and yields each entry as soon as it is parsed. Unlike Pybtex_import,
+    this does not build a pybtex BibliographyData object for the whole file, so the parsed entries can be consumed
+    (and discarded) incrementally.
+
+    Macro definitions (i.e., '@string' entries) remain available to all entries that come after them, and repeated
+    entry ids are reported in the same way as pybtex does when parsing a whole file.
+
+    Args:
+        bib_file_path(str): The location of the bib file to be parsed.
+        file_progress(meta.consoleOutput.File_Progress): If provided, it is set to track the progress of reading the
+            file.
+
+    Yields:
+        tuple: (entry id, pybtex Entry) pairs, in the order they appear in the file
+
+    Examples:
+        >>> for each_entry_id, each_entry in iterate_pybtex_entries('example_data//test.bib'):
+        ...     print(each_entry_id, each_entry.fields['title'])
+        56fafbf2574947cc9cbbfae578a0a36d Book with one author
+        d79d00c790984ab08240e997d077c332 Article with 5 authors with 'and' notation
+        a8781aa0eae047d1826a658f3545ce3f Article with 3 authors with mixed notation
+        01b9c957875b4a96839c1bfd05ec6a31 Article with non-uri safe characters:<>{}()[] @% to WW ∗→eνμν with the ATLAS detector at √s=8 TeV
+    """
+    from pybtex.database import BibliographyData, BibliographyDataError
+    from pybtex.database.input import bibtex
+    from pybtex.errors import report_error
+
+    # a single parser is used, so that the macros (e.g., '@string' definitions and month names) it has collected
+    # ...are preserved between entries
+    parser = bibtex.Parser()
+    parsed_entry_ids = set()
+
+    for each_entry_string in iterate_bibtex_entry_strings(bib_file_path, file_progress):
+        # the parsed data is reset for each entry, so that only one entry is held in memory at a time
+        parser.data = BibliographyData()
+        parser.parse_string(each_entry_string)
+
+        for each_entry_id, each_entry in parser.data.entries.items():
+            if each_entry_id.lower() in parsed_entry_ids:
+                report_error(BibliographyDataError('repeated bibliography entry: %s' % each_entry_id))
+                continue
+            parsed_entry_ids.add(each_entry_id.lower())
+            yield each_entry_id, each_entry
@@ -1,7 +1,10 @@
 ## TODO: Re-write rdfTools.py as an object oriented module
 
 from __future__ import print_function
+import re
+
 from preprocessor.Text_File import Text_File
+from triplicator.cacheTools import Formatting_Cache
 
 
 class RDF_File(Text_File):
@@ -154,6 +157,117 @@ class RDF_File(Text_File):
         console.log_message('\nA log of the operation is kept in "%s"' % console.get_log_file_path())
 
 
+    def write_entries_as_triples(self, entries, desired_source_bibliography_name, show_progress_bar=True,
+                                 file_progress=None, remove_duplicates=False):
+        """
+        Converts Bibliography entries to triples and writes them to the file one entry at a time. The static triples
+        of the ontology are written once, at the start of the file, and the triples of each entry are written (and
+        discarded) as soon as the entry is converted. Unlike Triples.import_bibliography_object() followed by
+        .write_triples_to_file(), the triples of all entries are never held in memory at the same time, and, if entries
+        is a generator (e.g., Bibliography.iterateBibtexEntries()), neither are the entries themselves. The written
+        file is the same.
+
+        Args:
+            entries: (entry id, entry) pairs (e.g., Bibliography.entries.items(), or a generator such as
+                Bibliography.iterateBibtexEntries())
+            desired_source_bibliography_name(str): See Triples.import_bibliography_object()
+            show_progress_bar(bool): As the number of entries is not known in advance, the progress bar is only shown if
+                file_progress is provided.
+            file_progress(meta.consoleOutput.File_Progress): The progress of reading the source file of the entries
+                (e.g., when entries is a generator that reads the file), which is shown in the progress bar.
+            remove_duplicates(bool): See Triples.import_bibliography_object(). The fingerprints of all written triples
+                are kept in memory until the writing is finished.
+
+        Returns:
+            Nothing
+
+        Examples:
+            >>> # prep
+            >>> from triplicator.bibTools import Bibliography
+            >>> my_bibliography = Bibliography()
+            >>> my_bibliography.importBibtex('example_data//test_clean.bib', streaming=True)  #doctest: +ELLIPSIS
+            Parsing of example_data//test_clean.bib started
+            ...
+            >>> my_triples = Triples().import_bibliography_object(my_bibliography, 'some bibliography',
+            ...                                                   show_progress_bar=False)
+
+            >>> # write entries as triples, one entry at a time
+            >>> my_rdf_file = RDF_File('example_data//write_test.ttl')
+            >>> my_rdf_file.write_entries_as_triples(my_bibliography.iterateBibtexEntries('example_data//test_clean.bib'),
+            ...                                      'some bibliography', show_progress_bar=False)
+            Writing of the triples to file "example_data//write_test.ttl" has started
+            Success: 120 triples were written to "example_data//write_test.ttl"
+            These items were skipped due to errors (0 items):
+            <BLANKLINE>
+            A log of the operation is kept in "log.txt"
+
+            >>> # the file is the same as the one written from a Triples object
+            >>> with open('example_data//write_test.ttl', encoding='utf8') as ttl_file:
+            ...     ttl_file.read() == ''.join(each_triple + '\\n' for each_triple in my_triples)
+            True
+
+            >>> # remove duplicate triples
+            >>> my_rdf_file.write_entries_as_triples(my_bibliography.iterateBibtexEntries('example_data//test_clean.bib'),
+            ...                                      'some bibliography', show_progress_bar=False, remove_duplicates=True)
+            Writing of the triples to file "example_data//write_test.ttl" has started
+            2 duplicate triples were removed
+            Success: 118 triples were written to "example_data//write_test.ttl"
+            These items were skipped due to errors (0 items):
+            <BLANKLINE>
+            A log of the operation is kept in "log.txt"
+        """
+        from meta.consoleOutput import ConsoleOutput
+        from preprocessor.string_tools import Parameter_Value
+
+        Parameter_Value(desired_source_bibliography_name).force_type(str)
+
+        console = ConsoleOutput(log_file_path='log.txt')
+
+        file_path = self.input_file_path
+        triples = Triples()  # holds the triples of one entry at a time
+        erroneous_triples = []  # for logging and reporting
+        no_of_successfully_written_triples = 0
+
+        # Write to file
+        console.log_message('Writing of the triples to file "%s" has started' % file_path, add_timestamp_in_file=True)
+        with open(file_path, mode="w", encoding='utf8') as file:
+
+            def write_and_clear_triples():
+                nonlocal no_of_successfully_written_triples
+                for each_triple in triples:
+                    try:
+                        file.write(each_triple + '\n')
+                        no_of_successfully_written_triples += 1
+                    except:
+                        erroneous_triples.append(each_triple)
+                del triples.triples_list[:]  # (the fingerprints of the triples are kept)
+
+            if remove_duplicates:
+                triples._start_removing_duplicates()
+
+            try:
+                for each_entry_id in triples._generate_triples(entries, desired_source_bibliography_name):
+                    write_and_clear_triples()
+                    if show_progress_bar and file_progress is not None:
+                        console.print_file_progress(file_progress, 'Writing triples to "%s"' % file_path)
+
+                write_and_clear_triples()  # the static triples, if there were no entries
+
+            finally:
+                if remove_duplicates:
+                    triples._stop_removing_duplicates()
+
+        if remove_duplicates:
+            console.log_message('%d duplicate triples were removed'
+                                % triples.no_of_duplicate_triples_removed_in_last_operation, add_timestamp_in_file=True)
+
+        # Log
+        console.log_message('Success: %d triples were written to "%s"'
+                            % (no_of_successfully_written_triples, file_path), add_timestamp_in_file=True)
+        console.log_list_with_caption('These items were skipped due to errors', erroneous_triples)
+        console.log_message('\nA log of the operation is kept in "%s"' % console.get_log_file_path())
+
+
 class Triples():
     """
     Examples:
@@ -201,9 +315,33 @@ class Triples():
         >>> # length
         >>> len(my_triples)
         2
+
+        >>> # columnar storage
+        >>> my_columnar_triples = Triples(storage='columnar')
+        >>> my_columnar_triples.add_triple("<http://clokman.com/ontologies/scientific-research>", "<http://www.w3.org/1999/02/22-rdf-syntax-ns#type>", "http://www.w3.org/2002/07/owl#Ontology")\
+                               .add_triple("<http://clokman.com/ontologies/scientific-research>", "<http://www.w3.org/1999/02/22-rdf-syntax-ns#type>", "http://www.w3.org/2002/07/owl#Visualization")
+        ['<http://clokman.com/ontologies/scientific-research> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> http://www.w3.org/2002/07/owl#Ontology .', '<http://clokman.com/ontologies/scientific-research> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> http://www.w3.org/2002/07/owl#Visualization .']
+        >>> my_columnar_triples[1] == my_triples[1]
+        True
     """
-    def __init__(self):
-        self.triples_list = []
+    def __init__(self, storage='list'):
+        """
+        Keyword Args:
+            storage(str): How the triples are stored. 'list' stores each triple as a string in a list. 'columnar'
+                stores the terms of the triples as integer codes in arrays, and each distinct term only once (see
+                columnarStorage.Columnar_Triples), which uses a fraction of the memory for large numbers of triples;
+                triples are then only converted to strings when they are read (e.g., when they are written to a file).
+        """
+        if storage not in ['list', 'columnar']:
+            raise ValueError('Unknown storage "%s"; storage must be "list" or "columnar".' % storage)
+        self.storage = storage
+
+        self.triples_list = self._create_triples_list()
+
+        # fingerprints of the triples added so far; only kept while duplicates are being removed (see
+        # ...import_bibliography_object(remove_duplicates=True))
+        self._triple_fingerprints = None
+        self.no_of_duplicate_triples_removed_in_last_operation = 0
 
 
     # Overrides #########################
@@ -227,6 +365,29 @@ class Triples():
     #####################################
 
 
+    def _start_removing_duplicates(self):
+        """
+        Makes .add_triple() skip the triples that have already been added (including those added before this method
+        was called), until ._stop_removing_duplicates() is called.
+        """
+        self._triple_fingerprints = set(get_triple_fingerprint(each_line) for each_line in self.triples_list)
+        self.no_of_duplicate_triples_removed_in_last_operation = 0
+
+
+    def _stop_removing_duplicates(self):
+        self._triple_fingerprints = None  # frees the memory used by the fingerprints
+
+
+    def _create_triples_list(self):
+        """
+        Returns an empty container for the triples, as specified by the storage parameter of the constructor.
+        """
+        if self.storage == 'columnar':
+            from triplicator.columnarStorage import Columnar_Triples
+            return Columnar_Triples()
+        return []
+
+
     def add_triple(self, sub, prop, obj):
         """
         Constructs a triple from three given parameters and adds it to self.triples_list.
@@ -259,8 +420,18 @@ class Triples():
             >>> #add_triple(c_book, p_rdf_type, c_class)
 
         """
-        triple = sub + " " + prop + " " + obj + " ."  # construct a triple in n3 format
-        self.triples_list.append(triple)
+        if self._triple_fingerprints is not None:
+            fingerprint = get_triple_fingerprint(sub + " " + prop + " " + obj + " .")
+            if fingerprint in self._triple_fingerprints:
+                self.no_of_duplicate_triples_removed_in_last_operation += 1
+                return self
+            self._triple_fingerprints.add(fingerprint)
+
+        if self.storage == 'columnar':
+            self.triples_list.append_triple(sub, prop, obj)  # converted to n3 format when read
+        else:
+            triple = sub + " " + prop + " " + obj + " ."  # construct a triple in n3 format
+            self.triples_list.append(triple)
 
         return self
 
@@ -369,14 +540,26 @@ class Triples():
                           .preview()
             Instance does not have any triples to preview (empty instance).
         """
-        self.triples_list = []
+        self.triples_list = self._create_triples_list()
 
         return self
 
 
-    def import_bibliography_object(self, source_bibliography, desired_source_bibliography_name, show_progress_bar=True):
+    def import_bibliography_object(self, source_bibliography, desired_source_bibliography_name, show_progress_bar=True,
+                                   remove_duplicates=False, workers=1):
         # TODO: This method is extracted as a method from the old source code and is not concise. It must be divided into many short methods.
         """
+        Args:
+            remove_duplicates(bool): If True, triples that have already been added (e.g., the type and label triples
+                of an author, which would otherwise be added once for each document of the author) are not added
+                again. Duplicates are detected by comparing 64-bit fingerprints of the triples (see
+                get_triple_fingerprint()), which are only kept in memory during the import. The number of duplicates
+                removed is reported, and stored in .no_of_duplicate_triples_removed_in_last_operation.
+            workers(int): Number of processes to use. If more than 1, the entries are split into (at most) this many
+                shards, the triples of each shard are generated in a separate worker process, and they are added (in
+                the original order of entries) after the static triples, which are added only once. The resulting
+                triples are the same as with a single process.
+
         Returns:
             - self
 
@@ -898,7 +1081,45 @@ class Triples():
              'backfiring effect may depend on the extent to which compliance is '
              'voluntary."@en .')
 
+            >>> # the same triples, in columnar storage
+            >>> my_columnar_triples = Triples(storage='columnar')
+            >>> my_columnar_triples = my_columnar_triples.import_bibliography_object(my_bibliography_object,
+            ...                           desired_source_bibliography_name='some bibliography', show_progress_bar=False)
+            >>> list(my_columnar_triples) == list(my_triples)
+            True
 
+            >>> # remove duplicate triples (e.g., 'Article subClassOf Document', which is added for each article)
+            >>> my_unique_triples = Triples().import_bibliography_object(my_bibliography_object,
+            ...                         desired_source_bibliography_name='some bibliography', show_progress_bar=False,
+            ...                         remove_duplicates=True)
+            2 duplicate triples were removed
+            >>> len(my_unique_triples), list(my_unique_triples) == list(dict.fromkeys(my_triples))
+            (118, True)
+
+            >>> # generate the triples using two worker processes
+            >>> my_parallel_triples = Triples().import_bibliography_object(my_bibliography_object,
+            ...                           desired_source_bibliography_name='some bibliography', show_progress_bar=False,
+            ...                           workers=2)
+            >>> list(my_parallel_triples) == list(my_triples)
+            True
+
+            >>> # Open Citations entries (which are named after 'b_document' instead of a Pure id), using three worker
+            >>> # ...processes
+            >>> my_oc_bibliography = Bibliography()
+            >>> my_oc_bibliography.importCsv(path_of_file_to_import='example_data//oc_query_2.2_results_short_sample.csv',
+            ...                              csv_delimiter_character=',', field_value_list_separator=' | ',
+            ...                              id_column_header='journal_article',
+            ...                              conversion_arguments_list='open citations',
+            ...                              cleaning_algorithm='default', show_progress_bar=False) #doctest: +ELLIPSIS
+            Parsing of "example_data//oc_query_2.2_results_short_sample.csv" started
+            ...
+            >>> my_oc_triples = Triples().import_bibliography_object(my_oc_bibliography,
+            ...                           desired_source_bibliography_name='open citations', show_progress_bar=False)
+            >>> my_parallel_oc_triples = Triples().import_bibliography_object(my_oc_bibliography,
+            ...                           desired_source_bibliography_name='open citations', show_progress_bar=False,
+            ...                           workers=3)
+            >>> list(my_parallel_oc_triples) == list(my_oc_triples)
+            True
 
             >>> # wrong type entered as source_bibliography parameter:
             >>> my_triples = Triples()
@@ -911,24 +1132,126 @@ class Triples():
         """
         ## TODO: Add basic class equivalencies (e.g., article = JournalArticle) to method
 
-        # This method is formatted without line wrapping. Turn LINE WRAPPING OFF for optimal viewing.
-
         from triplicator.bibTools import Bibliography
-        from preprocessor.string_tools import String
         from meta.consoleOutput import ConsoleOutput
         from preprocessor.string_tools import Parameter_Value
 
         # Parameters
         Parameter_Value(source_bibliography).force_type(Bibliography)
         Parameter_Value(desired_source_bibliography_name).force_type(str)
-
-        source_bibliography = source_bibliography
-        origin_bibliography = desired_source_bibliography_name
+        Parameter_Value(workers).force_positive_integer()
 
         # for logging
         console = ConsoleOutput(log_file_path='log.txt')
-        current_progress = 0
-        maximum_progress = len(source_bibliography.entries.items())
+        maximum_progress = len(source_bibliography.entries)
+
+        if remove_duplicates:
+            self._start_removing_duplicates()
+
+        # the fingerprints are released even if an error occurs, so that later .add_triple() calls do not skip triples
+        try:
+            # multiple processes: generate the triples of shards of the entries in worker processes, and add them in
+            # ...order
+            if workers > 1:
+                self._import_entries_in_parallel(source_bibliography, desired_source_bibliography_name, workers,
+                                                 show_progress_bar)
+
+            # single process
+            else:
+                triple_generator = self._generate_triples(source_bibliography.entries.items(),
+                                                          desired_source_bibliography_name)
+                for current_progress, each_entry_id in enumerate(triple_generator):
+                    # Progress bar update
+                    if show_progress_bar:
+                        console.print_current_progress(current_progress, maximum_progress,
+                                                       'Converting Bibliography object to Triples object.')
+
+        finally:
+            if remove_duplicates:
+                self._stop_removing_duplicates()
+
+        if remove_duplicates:
+            console.log_message('%d duplicate triples were removed'
+                                % self.no_of_duplicate_triples_removed_in_last_operation, add_timestamp_in_file=True)
+
+        return self
+
+
+    def _import_entries_in_parallel(self, source_bibliography, origin_bibliography, workers, show_progress_bar):
+        """
+        Adds the static triples, and then the triples of the entries of the bibliography, which are generated in
+        (at most) the given number of worker processes, one shard of consecutive entries per process. Used by
+        .import_bibliography_object().
+
+        The triples of an entry may depend on the entries before it (see _find_shard_context_start()), so each worker
+        process also receives these preceding entries, and discards their triples.
+        """
+        from concurrent.futures import ProcessPoolExecutor
+        from itertools import repeat
+        from meta.consoleOutput import ConsoleOutput
+
+        console = ConsoleOutput(log_file_path='log.txt')
+
+        # entries are copied into dictionaries, so that they can be sent to worker processes (whatever the storage of
+        # ...the bibliography is)
+        entries = [(each_entry_id, dict(each_entry)) for each_entry_id, each_entry in source_bibliography.entries.items()]
+        shard_size = -(-len(entries) // workers)  # (ceiling division)
+
+        shard_entries = []
+        no_of_context_entries = []
+        for each_shard_start in range(0, len(entries), shard_size):
+            each_context_start = _find_shard_context_start(entries, each_shard_start)
+            shard_entries.append(entries[each_context_start:each_shard_start + shard_size])
+            no_of_context_entries.append(each_shard_start - each_context_start)
+
+        # static triples (once)
+        for each_entry_id in self._generate_triples([], origin_bibliography):
+            pass
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            shard_results = executor.map(_generate_shard_triples, shard_entries, no_of_context_entries,
+                                         repeat(origin_bibliography))
+            for i, (terms, subjects, predicates, objects) in enumerate(shard_results):
+                # duplicates have to be checked one triple at a time
+                if self._triple_fingerprints is not None:
+                    for each_subject_code, each_predicate_code, each_object_code in zip(subjects, predicates, objects):
+                        self.add_triple(terms[each_subject_code], terms[each_predicate_code], terms[each_object_code])
+
+                elif self.storage == 'columnar':
+                    self.triples_list.extend_with_codes(terms, subjects, predicates, objects)
+
+                else:
+                    self.triples_list.extend(terms[each_subject_code] + " " + terms[each_predicate_code] + " " +
+                                             terms[each_object_code] + " ."
+                                             for each_subject_code, each_predicate_code, each_object_code
+                                             in zip(subjects, predicates, objects))
+
+                if show_progress_bar:
+                    console.print_current_progress(i, len(shard_entries), 'Converting Bibliography object to Triples '
+                                                                          'object.')
+
+
+    def _generate_triples(self, entries, origin_bibliography, add_static_triples=True):
+        """
+        Adds the triples of the given entries to self.triples_list. The static triples (i.e., the property and class
+        definitions of the ontology) are added first, and then the triples of each entry. This is a generator; it
+        yields the id of each entry right after its triples are added, so that the caller can e.g., update a progress
+        bar, or write the triples of the entry to a file and clear them before the next entry is processed (see
+        RDF_File.write_entries_as_triples()).
+
+        Args:
+            entries: (entry id, entry) pairs, where each entry is a dictionary of Bibliography fields (e.g.,
+                Bibliography.entries.items(), or a generator such as Bibliography.iterateBibtexEntries())
+            origin_bibliography(str): See desired_source_bibliography_name in .import_bibliography_object()
+            add_static_triples(bool): If False, only the triples of the entries are added.
+
+        Yields:
+            str: the id of each entry, after its triples are added
+        """
+        # This method is formatted without line wrapping. Turn LINE WRAPPING OFF for optimal viewing.
+
+        from preprocessor.string_tools import String
+        from preprocessor.string_tools import Parameter_Value
 
         #################################################################################
         #                   STATIC DEFINITIONS: PROPERTIES, CLASSES                     #
@@ -996,29 +1319,36 @@ class Triples():
         p_label                    = construct_uri(rdfs, "label"                )
         p_equivalent_class         = construct_uri(owl,  "equivalentClass"      )
 
+        # the static triples are skipped if add_static_triples is False (e.g., in the worker processes of a parallel
+        # ...import, as they are added once, by the main process)
+        if add_static_triples:
+            add_static_triple = self.add_triple
+        else:
+            add_static_triple = lambda sub, prop, obj: self
+
         # TODO: Add triple should add triple so self.some_object instead of a variable outside the instance
-        self.add_triple(p_subclass_of,              p_rdf_type,     c_object_property)
-        self.add_triple(p_is_author_of,             p_rdf_type,     c_object_property)
-        self.add_triple(p_has_author,               p_rdf_type,     c_object_property)
-        self.add_triple(p_is_published_on,          p_rdf_type,     c_object_property)
-        self.add_triple(p_is_published_by,          p_rdf_type,     c_object_property)
-        self.add_triple(p_is_published_on_year,     p_rdf_type,     c_object_property)
-        self.add_triple(p_is_published_on_month,    p_rdf_type,     c_object_property)
-        self.add_triple(p_is_published_on_date,     p_rdf_type,     c_object_property)
-        self.add_triple(p_has_doi,                  p_rdf_type,     c_object_property)
-        self.add_triple(p_has_issn,                 p_rdf_type,     c_object_property)
-        self.add_triple(p_has_isbn,                 p_rdf_type,     c_object_property)
-        self.add_triple(p_has_pure_bibliography_id, p_rdf_type,     c_object_property)
-        self.add_triple(p_has_open_citations_id,    p_rdf_type,     c_object_property)
-        self.add_triple(p_is_chapter_of,            p_rdf_type,     c_object_property)
-        self.add_triple(p_rdf_type,                 p_rdf_type,     c_object_property)
-        self.add_triple(p_label,                    p_rdf_type,     c_object_property)
-        self.add_triple(p_has_topic,                p_rdf_type,     c_object_property)
-        self.add_triple(p_has_abstract,             p_rdf_type,     c_object_property)
-        self.add_triple(p_has_cited,                p_rdf_type,     c_object_property)
-        self.add_triple(p_is_cited_by,              p_rdf_type,     c_object_property)
-        self.add_triple(p_equivalent_class,         p_rdf_type,     c_object_property)
-        self.add_triple(p_has_origin_bibliography,  p_rdf_type,     c_object_property)
+        add_static_triple(p_subclass_of,              p_rdf_type,     c_object_property)
+        add_static_triple(p_is_author_of,             p_rdf_type,     c_object_property)
+        add_static_triple(p_has_author,               p_rdf_type,     c_object_property)
+        add_static_triple(p_is_published_on,          p_rdf_type,     c_object_property)
+        add_static_triple(p_is_published_by,          p_rdf_type,     c_object_property)
+        add_static_triple(p_is_published_on_year,     p_rdf_type,     c_object_property)
+        add_static_triple(p_is_published_on_month,    p_rdf_type,     c_object_property)
+        add_static_triple(p_is_published_on_date,     p_rdf_type,     c_object_property)
+        add_static_triple(p_has_doi,                  p_rdf_type,     c_object_property)
+        add_static_triple(p_has_issn,                 p_rdf_type,     c_object_property)
+        add_static_triple(p_has_isbn,                 p_rdf_type,     c_object_property)
+        add_static_triple(p_has_pure_bibliography_id, p_rdf_type,     c_object_property)
+        add_static_triple(p_has_open_citations_id,    p_rdf_type,     c_object_property)
+        add_static_triple(p_is_chapter_of,            p_rdf_type,     c_object_property)
+        add_static_triple(p_rdf_type,                 p_rdf_type,     c_object_property)
+        add_static_triple(p_label,                    p_rdf_type,     c_object_property)
+        add_static_triple(p_has_topic,                p_rdf_type,     c_object_property)
+        add_static_triple(p_has_abstract,             p_rdf_type,     c_object_property)
+        add_static_triple(p_has_cited,                p_rdf_type,     c_object_property)
+        add_static_triple(p_is_cited_by,              p_rdf_type,     c_object_property)
+        add_static_triple(p_equivalent_class,         p_rdf_type,     c_object_property)
+        add_static_triple(p_has_origin_bibliography,  p_rdf_type,     c_object_property)
 
 
         #################################################################################
@@ -1039,14 +1369,14 @@ class Triples():
         # TODO: TRY TO ADD THESE AND SEE WHAT HAPPENS IN PROTEGE:
         # self.add_triple()(c_document, p_rdf_type, c_class)
         # self.add_triple()(c_journal, p_rdf_type, c_class)
-        self.add_triple(c_topic, p_rdf_type, c_class)
+        add_static_triple(c_topic, p_rdf_type, c_class)
         # self.add_triple()(c_named_individual, p_rdf_type, c_class)
         # self.add_triple()(c_object_property, p_rdf_type, c_class)
         # self.add_triple()(c_class, p_rdf_type, c_class)
 
         # Bibliography origin class definitions
-        self.add_triple(c_origin_bibliography,  p_rdf_type,    c_class)
-        self.add_triple(c_origin_bibliography,  p_subclass_of, c_bibliography)
+        add_static_triple(c_origin_bibliography,  p_rdf_type,    c_class)
+        add_static_triple(c_origin_bibliography,  p_subclass_of, c_bibliography)
 
         # Static document type definitions
         # These are not used to categorize instances in the document directly, but necessary for the class
@@ -1057,10 +1387,10 @@ class Triples():
         c_book_chapter    = construct_uri(ont, "BookChapter")
         c_miscellaneous   = construct_uri(ont, "Miscellaneous")
 
-        self.add_triple(c_journal_article,  p_rdf_type, c_class)
-        self.add_triple(c_book,             p_rdf_type, c_class)
-        self.add_triple(c_book_chapter,     p_rdf_type, c_class)
-        self.add_triple(c_miscellaneous,    p_rdf_type, c_class)
+        add_static_triple(c_journal_article,  p_rdf_type, c_class)
+        add_static_triple(c_book,             p_rdf_type, c_class)
+        add_static_triple(c_book_chapter,     p_rdf_type, c_class)
+        add_static_triple(c_miscellaneous,    p_rdf_type, c_class)
 
         ############################################################################################################
         # SECTION COMMENTED OUT (ON 14th OF FEB 2018) TO PREVENT DUPLICATE CLASSES SUCH AS 'BOOK'(ont) and 'BOOK'(vu)
@@ -1095,7 +1425,7 @@ class Triples():
         #                     DYNAMIC TRIPLES: INSTANCES AND TYPES                      #
         #################################################################################
 
-        for each_entry_id, each_entry in source_bibliography.entries.items():
+        for each_entry_id, each_entry in entries:
 
             #######  INSTANCE NAME (INSTANCE URI)  #######
             try:
@@ -1400,13 +1730,82 @@ class Triples():
                 pass
 
 
-            # Progress bar update
-            if show_progress_bar:
-                console.print_current_progress(current_progress, maximum_progress, 'Converting Bibliography object to '
-                                                                                   'Triples object.')
-            current_progress += 1
+            yield each_entry_id
 
-        return self
+
+###################################################################
+#                   PARALLEL IMPORT FUNCTIONS                     #
+###################################################################
+
+def _find_shard_context_start(entries, shard_start):
+    """
+    If an entry does not have a type, an instance name (i.e., 'b_pure_bibliography_id' or, as for Open Citations
+    entries, 'b_document') or authors, Triples._generate_triples() uses those of the entry before it (and so on).
+    Returns the position of the last entry before shard_start that has all of these fields (or 0); if the triples are
+    generated from this position on, the triples of the entries from shard_start on are the same as they would be if
+    all entries were processed in a single loop.
+
+    Args:
+        entries(list): (entry id, entry) pairs
+        shard_start(int): position of the first entry of the shard
+
+    Returns:
+        int
+
+    Examples:
+        >>> my_complete_entry = {'b_type': 'Book', 'b_pure_bibliography_id': '01', 'b_authors': ['Lokman_JC'],
+        ...                      'b_author_labels': ['Lokman, JC']}
+        >>> my_entry_without_authors = {'b_type': 'Book', 'b_pure_bibliography_id': '02'}
+        >>> my_entries = [('01', my_complete_entry), ('02', my_entry_without_authors),
+        ...               ('03', my_complete_entry), ('04', my_entry_without_authors)]
+
+        >>> # the entry before the shard has all fields
+        >>> _find_shard_context_start(my_entries, shard_start=3)
+        2
+        >>> # the entry before the shard does not have authors, so the authors of the entry before it would be used
+        >>> _find_shard_context_start(my_entries, shard_start=2)
+        0
+        >>> _find_shard_context_start(my_entries, shard_start=0)
+        0
+
+        >>> # Open Citations entries are named after 'b_document', as they do not have a Pure id
+        >>> my_oc_entry = {'b_type': 'Journal_Article', 'b_document': 'Some_Article', 'b_authors': ['Lokman_JC'],
+        ...                'b_author_labels': ['Lokman, JC']}
+        >>> my_oc_entries = [('a', my_oc_entry), ('b', my_oc_entry), ('c', my_entry_without_authors)]
+        >>> _find_shard_context_start(my_oc_entries, shard_start=2)
+        1
+    """
+    for each_position in range(shard_start - 1, -1, -1):
+        each_entry = entries[each_position][1]
+        has_instance_name = type(each_entry.get('b_pure_bibliography_id')) is str \
+                            or type(each_entry.get('b_document')) is str
+        if has_instance_name and 'b_type' in each_entry \
+                and 'b_authors' in each_entry and 'b_author_labels' in each_entry:
+            return each_position
+    return 0
+
+
+def _generate_shard_triples(shard_entries, no_of_context_entries, origin_bibliography):
+    """
+    Generates the triples of a shard of entries in a worker process (see Triples.import_bibliography_object()),
+    without the static triples. The triples of the first no_of_context_entries entries (see
+    _find_shard_context_start()) are discarded.
+
+    Returns:
+        tuple: (terms, subject codes, property codes, object codes) of the triples (see
+            columnarStorage.Columnar_Triples), which are smaller to send back to the main process than strings
+    """
+    triples = Triples(storage='columnar')
+
+    start_of_shard_triples = 0
+    triple_generator = triples._generate_triples(shard_entries, origin_bibliography, add_static_triples=False)
+    for i, each_entry_id in enumerate(triple_generator):
+        if i < no_of_context_entries:
+            start_of_shard_triples = len(triples)
+
+    columns = triples.triples_list
+    return (columns._terms, columns._subjects[start_of_shard_triples:], columns._predicates[start_of_shard_triples:],
+            columns._objects[start_of_shard_triples:])
 
 
 ###################################################################
@@ -1414,8 +1813,41 @@ class Triples():
 ###################################################################
 # TODO: Re-write as an OO module.
 
+def get_triple_fingerprint(triple):
+    """
+    Returns a 64-bit fingerprint of a triple (i.e., the first 8 bytes of its BLAKE2 hash, as an integer). Storing the
+    fingerprints of triples (instead of the triples themselves) makes it possible to detect duplicate triples using a
+    fraction of the memory. Unlike hash(), the fingerprint of a triple is the same in every process.
+
+    Args:
+        triple(str): A triple in n3 format
+
+    Returns:
+        int
+
+    Examples:
+        >>> get_triple_fingerprint('<http://example.com/a> <http://example.com/type> <http://example.com/Book> .')
+        17719133579764999448
+    """
+    from hashlib import blake2b
+
+    return int.from_bytes(blake2b(triple.encode('utf8'), digest_size=8).digest(), 'little')
+
+
+# shared by all calls to construct_uri(); its statistics can be inspected with uri_cache.get_statistics(), and its
+# ...size can be changed (or caching disabled with 0) via uri_cache.maximum_size
+uri_cache = Formatting_Cache(maximum_size=100000)
+
+# names that consist only of these characters are not changed by String.clean_from_non_uri_safe_characters() (i.e., by
+# ...urllib.parse.quote())
+_uri_safe_name_pattern = re.compile('[A-Za-z0-9_.~/-]*')
+
+
 def construct_uri(prefix, name):
     """
+    URIs are cached by (prefix, name) in uri_cache, as the same authors, journals, publishers and cited documents
+    occur in many entries. Names that are already URI-safe are not quoted.
+
     Returns:
         str
 
@@ -1427,13 +1859,37 @@ def construct_uri(prefix, name):
         >>> sr = 'http://www.example.com/'
         >>> construct_uri(sr, "Some Document")
         '<http://www.example.com/Some%20Document>'
+
+        >>> # cache statistics
+        >>> uri_cache.clear()
+        >>> construct_uri(sr, "Some Document")
+        '<http://www.example.com/Some%20Document>'
+        >>> uri_cache.get_statistics()
+        {'size': 1, 'maximum_size': 100000, 'hits': 0, 'misses': 1, 'evictions': 0, 'hit_rate': 0.0}
+        >>> construct_uri(sr, "Some Document")
+        '<http://www.example.com/Some%20Document>'
+        >>> uri_cache.get_statistics()['hit_rate']
+        0.5
     """
-    from preprocessor.string_tools import String
+    # other types of names (e.g., String objects, whose content may differ from their value as str) are not cached
+    if type(name) is not str:
+        from preprocessor.string_tools import String
+
+        name = String(name).clean_from_non_uri_safe_characters()
+        return "<" + prefix + str(name) + ">"
+
+    key = (prefix, name)
+    uri = uri_cache.get(key)
+    if uri is None:
+        if _uri_safe_name_pattern.fullmatch(name):
+            cleaned_name = name  # quoting would not change the name
+        else:
+            from preprocessor.string_tools import String
+            cleaned_name = str(String(name).clean_from_non_uri_safe_characters())
 
-    name = String(name).clean_from_non_uri_safe_characters()
-    cleaned_name = str(name)
+        uri = "<" + prefix + cleaned_name + ">"
+        uri_cache.set(key, uri)
 
-    uri = "<" + prefix + cleaned_name + ">"
     return uri
 
 